@@ -0,0 +1,306 @@
+"""
+Benchmark suite for the hot paths of the circles package.
+
+Times object construction, validation, geometry calls, tyre label parsing and wheel
+matching at several input sizes, using only the standard library. Each result is the
+median of several repeats, in nanoseconds per item. A case may reset state, such as
+caches, in a setup step that runs untimed before every repeat. Results can be saved as a
+JSON baseline and compared against a previous baseline; any case slower than the
+baseline by more than the threshold is reported as a regression and the script exits
+with status 1. Cases without a baseline value are reported as well.
+
+The read_label_slices and read_label_designation cases time uncached parsing of
+distinct plain "XXX/YYRZZ" labels by `try_parse_tyre_label`, which takes the
+slice-based path, and by `parse_tyre_designation`; read_designation times the
+designation parser on distinct prefixed labels with load indexes and speed ratings.
+The label cache is cleared before every repeat. radius_mismatches times the
+label-vs-radius check of a TyreArray.
+
+A baseline recorded on the reference machine is kept in benchmarks/baseline.json.
+
+Usage (at the project level):
+    python benchmarks/suite.py [--sizes 1000,10000] [--repeat 5]
+                               [--save baseline.json] [--baseline baseline.json]
+                               [--threshold 0.10] [--filter NAME]
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import timeit
+from typing import Callable, Dict, List, NamedTuple, Tuple, Union
+
+from circles.circle import Circle
+from circles.circle_array import TyreArray
+from circles.fitment import FitmentIndex
+from circles.pizza import Pizza
+from circles.rim import Rim
+from circles.tyre import (
+    Tyre,
+    clear_tyre_label_cache,
+    parse_tyre_designation,
+    parse_tyre_labels,
+    try_parse_tyre_label,
+)
+from circles.wheel import Wheel
+
+LABELS = [
+    f"{width}/{aspect}R{rim}"
+    for width in (195, 205, 225)
+    for aspect in (45, 55)
+    for rim in (16, 17, 18)
+]
+PREFIXES = ("", "P", "LT")
+CONSTRUCTIONS = ("R", "ZR")
+SERVICES = ("", " 94W", " 101(Y)")
+
+
+class Case(NamedTuple):
+    """
+    A timed function and the untimed setup run before every repeat.
+    """
+
+    function: Callable[[], None]
+    setup: Callable[[], None] = lambda: None
+
+
+def _labels(size: int) -> List[str]:
+    return [LABELS[index % len(LABELS)] for index in range(size)]
+
+
+def _distinct_labels(size: int) -> List[str]:
+    return [
+        f"{100 + index % 900}/{10 + index // 900 % 90}R{10 + index // 81000 % 90}"
+        for index in range(size)
+    ]
+
+
+def _distinct_designations(size: int) -> List[str]:
+    return [
+        f"{PREFIXES[index % 3]}{label[:6]}{CONSTRUCTIONS[index % 2]}{label[7:]}"
+        f"{SERVICES[index % 3]}"
+        for index, label in enumerate(_distinct_labels(size))
+    ]
+
+
+def _tyres(size: int) -> List[Tyre]:
+    return [Tyre(300 + index % 50, label) for index, label in enumerate(_labels(size))]
+
+
+def _rims(size: int) -> List[Rim]:
+    return [Rim(203.2 + 12.7 * (index % 3)) for index in range(size)]
+
+
+def _reset_caches(circles: List[Circle]) -> Callable[[], None]:
+    def setup() -> None:
+        for circle in circles:
+            circle.change_diameter(circle.get_diameter())
+
+    return setup
+
+
+def _construct_rims(size: int) -> Callable[[], None]:
+    radii = [200 + index % 100 for index in range(size)]
+    return lambda: [Rim(radius) for radius in radii]
+
+
+def _construct_tyres(size: int) -> Callable[[], None]:
+    labels = _labels(size)
+    return lambda: [Tyre(300, label) for label in labels]
+
+
+def _construct_pizzas(size: int) -> Callable[[], None]:
+    radii = [1 + index % 60 for index in range(size)]
+    ingredients = ["cheese", "sauce"]
+    return lambda: [Pizza(radius, ingredients) for radius in radii]
+
+
+def _construct_wheels(size: int) -> Callable[[], None]:
+    tyres = [Tyre(300, "205/55R16")] * size
+    rim = Rim(203.2)
+    return lambda: [Wheel(tyre, rim) for tyre in tyres]
+
+
+def _validate_data(size: int) -> Callable[[], None]:
+    values = [1 + index % 100 for index in range(size)]
+    validate = Circle.validate_data
+    return lambda: [validate(value) for value in values]
+
+
+def _mm_to_inches(size: int) -> Callable[[], None]:
+    values = [400 + index % 200 for index in range(size)]
+    convert = Rim.mm_to_inches
+    return lambda: [convert(value) for value in values]
+
+
+def _get_area(size: int) -> Case:
+    rims = _rims(size)
+    return Case(lambda: [rim.get_area() for rim in rims], _reset_caches(rims))
+
+
+def _get_diameter(size: int) -> Case:
+    rims = _rims(size)
+    return Case(lambda: [rim.get_diameter() for rim in rims], _reset_caches(rims))
+
+
+def _parse_labels(size: int) -> Case:
+    labels = _labels(size)
+    return Case(lambda: parse_tyre_labels(labels), clear_tyre_label_cache)
+
+
+def _read_labels_slices(size: int) -> Case:
+    labels = _distinct_labels(size)
+    return Case(
+        lambda: [try_parse_tyre_label(label) for label in labels],
+        clear_tyre_label_cache,
+    )
+
+
+def _read_labels_designation(size: int) -> Case:
+    labels = _distinct_labels(size)
+    return Case(
+        lambda: [parse_tyre_designation(label) for label in labels],
+        clear_tyre_label_cache,
+    )
+
+
+def _read_designations(size: int) -> Case:
+    labels = _distinct_designations(size)
+    return Case(
+        lambda: [parse_tyre_designation(label) for label in labels],
+        clear_tyre_label_cache,
+    )
+
+
+def _radius_mismatches(size: int) -> Callable[[], None]:
+    tyre_array = TyreArray.from_circles(_tyres(size))
+    return lambda: tyre_array.radius_mismatches(1.0)
+
+
+def _verify_rim_size(size: int) -> Callable[[], None]:
+    rim = Rim(203.2)
+    wheels = [Wheel(Tyre(300, "205/55R16"), rim) for _ in range(size)]
+    return lambda: [wheel.verify_rim_size() for wheel in wheels]
+
+
+def _match_wheels(size: int) -> Callable[[], None]:
+    tyres = _tyres(size)
+    rims = _rims(30)
+    return lambda: sum(1 for _ in FitmentIndex(rims, tyres).pairs())
+
+
+CASES: Dict[str, Callable[[int], Union[Case, Callable[[], None]]]] = {
+    "construct_rim": _construct_rims,
+    "construct_tyre": _construct_tyres,
+    "construct_pizza": _construct_pizzas,
+    "construct_wheel": _construct_wheels,
+    "validate_data": _validate_data,
+    "mm_to_inches": _mm_to_inches,
+    "get_area": _get_area,
+    "get_diameter": _get_diameter,
+    "parse_tyre_labels": _parse_labels,
+    "read_label_slices": _read_labels_slices,
+    "read_label_designation": _read_labels_designation,
+    "read_designation": _read_designations,
+    "radius_mismatches": _radius_mismatches,
+    "verify_rim_size": _verify_rim_size,
+    "match_wheels": _match_wheels,
+}
+
+
+def run(sizes: List[int], repeat: int, name_filter: str = "") -> Dict[str, float]:
+    """
+    Runs every selected case at every size.
+
+    Parameters:
+        sizes (List[int]): The input sizes.
+        repeat (int): The number of timed repeats, the median is kept.
+        name_filter (str): Only cases whose name contains this string are run.
+
+    Returns:
+        Dict[str, float]: Nanoseconds per item keyed by "case@size".
+    """
+    results = {}
+    for name, case in CASES.items():
+        if name_filter not in name:
+            continue
+        for size in sizes:
+            timed = case(size)
+            if not isinstance(timed, Case):
+                timed = Case(timed)
+            times = timeit.repeat(timed.function, timed.setup, number=1, repeat=repeat)
+            results[f"{name}@{size}"] = statistics.median(times) * 1e9 / size
+    return results
+
+
+def compare(
+    results: Dict[str, float], baseline: Dict[str, float], threshold: float
+) -> Tuple[List[str], List[str]]:
+    """
+    Compares results with a baseline.
+
+    Parameters:
+        results (Dict[str, float]): The current results.
+        baseline (Dict[str, float]): The baseline results.
+        threshold (float): The allowed relative slowdown, for example 0.10 for 10%.
+
+    Returns:
+        Tuple[List[str], List[str]]: The keys of the cases slower than the baseline by
+         more than threshold, and the keys of the cases missing from the baseline.
+    """
+    regressions = [
+        key
+        for key, value in results.items()
+        if key in baseline and value > baseline[key] * (1 + threshold)
+    ]
+    missing = [key for key in results if key not in baseline]
+    return regressions, missing
+
+
+def main() -> int:
+    """
+    Runs the suite from the command line.
+
+    Returns:
+        int: The exit status, 1 if a regression was found.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", default="1000,10000,100000")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--save", help="write the results to this JSON file")
+    parser.add_argument("--baseline", help="compare with this JSON file")
+    parser.add_argument("--threshold", type=float, default=0.10)
+    parser.add_argument("--filter", default="", help="run only matching cases")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    results = run(sizes, args.repeat, args.filter)
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)["results"]
+
+    for key, value in results.items():
+        line = f"{key:<28} {value:10.1f} ns/item"
+        if key in baseline:
+            line += f"  {value / baseline[key] - 1:+7.1%}"
+        print(line)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as file:
+            json.dump(
+                {"python": sys.version.split()[0], "results": results}, file, indent=2
+            )
+
+    regressions, missing = compare(results, baseline, args.threshold)
+    if args.baseline:
+        for key in missing:
+            print(f"No baseline: {key} was not compared")
+    for key in regressions:
+        print(f"Regression: {key} is more than {args.threshold:.0%} slower")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
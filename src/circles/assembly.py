@@ -0,0 +1,184 @@
+"""
+Module for assembling large numbers of wheels across several processes.
+
+This module defines the `assemble_wheels` function, which splits an iterable of
+(tyre, rim) pairs into chunks and assembles them in a `ProcessPoolExecutor`. A pair is
+either a `Tyre` and a `Rim` object or their raw specs: a (radius, tyre label) tuple and a
+rim radius. Pairs are checked before a `Wheel` is built, so failures are collected in a
+compact report instead of being printed; items that are not (tyre, rim) pairs are
+reported the same way. Every wheel and failure carries the position
+of its pair in the input. Workers send their wheels back encoded with
+`circles.codec`, which is smaller and faster to load than pickled objects.
+"""
+
+from __future__ import annotations
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+import os
+from typing import Iterable, List, NamedTuple, Optional, Tuple, Union
+
+from circles.circle import Circle
+from circles.codec import decode, encode
+from circles.conversion import fits
+from circles.rim import Rim
+from circles.tyre import Tyre, parse_tyre_label
+from circles.wheel import Wheel
+
+TyreSpec = Union[Tyre, Tuple[Union[int, float], str]]
+RimSpec = Union[Rim, int, float]
+
+
+class AssemblyFailure(NamedTuple):
+    """
+    A pair that could not be assembled.
+
+    Attributes:
+        index (int): The position of the pair in the input.
+        error (str): The name of the exception type, "TypeError" or "ValueError".
+        message (str): The reason the pair was rejected.
+    """
+
+    index: int
+    error: str
+    message: str
+
+
+class AssemblyResult(NamedTuple):
+    """
+    The outcome of a bulk assembly.
+
+    Attributes:
+        wheels (List[Tuple[int, Wheel]]): (index, wheel) pairs in input order, where
+         index is the position of the pair the wheel was assembled from.
+        failures (List[AssemblyFailure]): The rejected pairs in input order.
+    """
+
+    wheels: List[Tuple[int, Wheel]]
+    failures: List[AssemblyFailure]
+
+
+def assemble_wheel(tyre: TyreSpec, rim: RimSpec) -> Wheel:
+    """
+    Assembles a single wheel from a tyre and a rim or their raw specs without printing.
+
+    Parameters:
+        tyre (TyreSpec): A Tyre object or a (radius, tyre label) tuple.
+        rim (RimSpec): A Rim object or a rim radius.
+
+    Returns:
+        Wheel: The assembled wheel.
+
+    Raises:
+        ValueError: If a spec is invalid or the tyre and rim sizes do not match.
+        TypeError: If a component is of the wrong type.
+    """
+    if not isinstance(tyre, Tyre):
+        if isinstance(tyre, Circle):
+            raise TypeError("Provided object must be a tyre")
+        radius, tyre_label = tyre
+        Circle.validate_data(radius)
+        parse_tyre_label(tyre_label)
+        tyre = Tyre(radius, tyre_label)
+    if not isinstance(rim, Rim):
+        if isinstance(rim, Circle):
+            raise TypeError("Provided object must be a rim")
+        rim = Rim(rim)
+    if not fits(tyre.necessary_rim_size, rim.diameter_inches):
+        raise ValueError("Rim and Tyre size doesn't match")
+    return Wheel(tyre, rim)
+
+
+_ChunkResult = Tuple[List[int], Union[bytes, List[Wheel]], List[AssemblyFailure]]
+
+
+def _assemble_chunk(start: int, pairs: List[Tuple[TyreSpec, RimSpec]]) -> _ChunkResult:
+    indices = []
+    wheels = []
+    failures = []
+    for index, pair in enumerate(pairs, start):
+        try:
+            tyre, rim = pair
+            wheels.append(assemble_wheel(tyre, rim))
+        except (TypeError, ValueError) as error:
+            failures.append(AssemblyFailure(index, type(error).__name__, str(error)))
+        else:
+            indices.append(index)
+    return indices, wheels, failures
+
+
+def _assemble_encoded(
+    start: int, pairs: List[Tuple[TyreSpec, RimSpec]]
+) -> _ChunkResult:
+    indices, wheels, failures = _assemble_chunk(start, pairs)
+    try:
+        return indices, encode(wheels), failures
+    except (TypeError, ValueError):
+        return indices, wheels, failures
+
+
+def _chunks(pairs: Iterable[Tuple[TyreSpec, RimSpec]], chunk_size: int):
+    iterator = iter(pairs)
+    start = 0
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield start, chunk
+        start += len(chunk)
+
+
+def assemble_wheels(
+    pairs: Iterable[Tuple[TyreSpec, RimSpec]],
+    chunk_size: int = 10_000,
+    max_workers: Optional[int] = None,
+) -> AssemblyResult:
+    """
+    Assembles wheels from many (tyre, rim) pairs in parallel.
+
+    At most two chunks per worker are in flight at a time, so the input iterable is
+    consumed lazily.
+
+    Parameters:
+        pairs (Iterable[Tuple[TyreSpec, RimSpec]]): The tyres and rims to assemble.
+        chunk_size (int): The number of pairs sent to a worker at once.
+        max_workers (Optional[int]): The number of worker processes, by default the
+         number of CPUs. With 1 the pairs are assembled in the calling process.
+
+    Returns:
+        AssemblyResult: The assembled wheels with the indices of their pairs and the
+         failure report.
+
+    Raises:
+        ValueError: If chunk_size or max_workers is not greater than zero.
+    """
+    if chunk_size <= 0:
+        raise ValueError("The chunk size must be greater than zero")
+    if max_workers is not None and max_workers <= 0:
+        raise ValueError("The number of workers must be greater than zero")
+
+    wheels: List[Tuple[int, Wheel]] = []
+    failures: List[AssemblyFailure] = []
+
+    def collect(result: _ChunkResult) -> None:
+        indices, assembled, chunk_failures = result
+        if isinstance(assembled, bytes):
+            assembled = decode(assembled)
+        wheels.extend(zip(indices, assembled))
+        failures.extend(chunk_failures)
+
+    if max_workers == 1:
+        for start, chunk in _chunks(pairs, chunk_size):
+            collect(_assemble_chunk(start, chunk))
+        return AssemblyResult(wheels, failures)
+
+    window = 2 * (max_workers or os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        pending: deque = deque()
+        for start, chunk in _chunks(pairs, chunk_size):
+            pending.append(executor.submit(_assemble_encoded, start, chunk))
+            if len(pending) >= window:
+                collect(pending.popleft().result())
+        while pending:
+            collect(pending.popleft().result())
+    return AssemblyResult(wheels, failures)
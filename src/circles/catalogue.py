@@ -0,0 +1,363 @@
+"""
+Module for storing rim, tyre, pizza and wheel collections in a binary columnar file.
+
+This module defines `save_catalogue`, which writes the collections to a fixed-width
+columnar file, and `load_catalogue`, which memory-maps such a file. Loading only maps
+the file, so opening a large catalogue is close to instant and its pages are shared by
+every process that opens the same file. Objects are built on demand from the columns.
+Tyre labels are stored as written, so tyres with full designations such as
+"P225/45ZR17 94W" load back with the same label; every distinct label is stored once.
+
+File format (all values little-endian):
+
+    Header, 56 bytes:
+        magic       8 bytes   b"CIRCCAT2"
+        rims        uint64    number of rim rows
+        tyres       uint64    number of tyre rows
+        pizzas      uint64    number of pizza rows
+        wheels      uint64    number of wheel rows
+        labels      uint64    number of distinct tyre labels
+        text        uint64    length of the UTF-8 label data in bytes
+
+    Columns follow in the order below, each padded with zeros to a multiple of 8 bytes:
+        rims:    radius (float64), diameter in inches (float64)
+        tyres:   radius (float64), width in millimeters (int32),
+                 aspect ratio (int32), rim size in inches (int32), label (uint32)
+        pizzas:  radius (float64)
+        wheels:  radius (float64), tyre row index (int64), rim row index (int64)
+        labels:  start offset of every label in the text and the end offset of the
+                 last one (uint64, labels + 1 values), then the UTF-8 text
+
+Pizza ingredients are not stored, so loaded pizzas have no ingredients.
+"""
+
+from __future__ import annotations
+from array import array
+import mmap
+import struct
+import sys
+from typing import Dict, Iterable, NamedTuple
+
+from circles.pizza import Pizza
+from circles.rim import Rim
+from circles.tyre import Tyre
+from circles.wheel import Wheel
+
+MAGIC = b"CIRCCAT2"
+HEADER = struct.Struct("<8s6Q")
+
+
+class RimColumns(NamedTuple):
+    """
+    The rim columns of a catalogue.
+
+    Attributes:
+        radius (memoryview): The rim radii in millimeters.
+        diameter_inches (memoryview): The rim diameters in inches.
+    """
+
+    radius: memoryview
+    diameter_inches: memoryview
+
+
+class TyreColumns(NamedTuple):
+    """
+    The tyre columns of a catalogue.
+
+    Attributes:
+        radius (memoryview): The tyre radii in millimeters.
+        width (memoryview): The tyre widths in millimeters.
+        aspect_ratio (memoryview): The tyre height-to-width ratios in percent.
+        rim_size (memoryview): The required rim diameters in inches.
+        label (memoryview): The index of each tyre's label, see `Catalogue.label`.
+    """
+
+    radius: memoryview
+    width: memoryview
+    aspect_ratio: memoryview
+    rim_size: memoryview
+    label: memoryview
+
+
+class PizzaColumns(NamedTuple):
+    """
+    The pizza columns of a catalogue.
+
+    Attributes:
+        radius (memoryview): The pizza radii in centimeters.
+    """
+
+    radius: memoryview
+
+
+class WheelColumns(NamedTuple):
+    """
+    The wheel columns of a catalogue.
+
+    Attributes:
+        radius (memoryview): The wheel radii in millimeters.
+        tyre_index (memoryview): The tyre row of each wheel.
+        rim_index (memoryview): The rim row of each wheel.
+    """
+
+    radius: memoryview
+    tyre_index: memoryview
+    rim_index: memoryview
+
+
+def _write_column(file, column: array) -> None:
+    if sys.byteorder != "little":
+        column.byteswap()
+    data = column.tobytes()
+    file.write(data)
+    file.write(bytes(-len(data) % 8))
+
+
+def save_catalogue(
+    path: str,
+    rims: Iterable[Rim] = (),
+    tyres: Iterable[Tyre] = (),
+    pizzas: Iterable[Pizza] = (),
+    wheels: Iterable[Wheel] = (),
+) -> None:
+    """
+    Writes rim, tyre, pizza and wheel collections to a columnar catalogue file.
+
+    The tyre and rim of each wheel are stored in the tyre and rim columns and referenced
+    by row index. Components that are not already part of `tyres` or `rims` are appended.
+
+    Parameters:
+        path (str): The path of the file to write.
+        rims (Iterable[Rim]): The rims to store.
+        tyres (Iterable[Tyre]): The tyres to store.
+        pizzas (Iterable[Pizza]): The pizzas to store.
+        wheels (Iterable[Wheel]): The wheels to store.
+    """
+    rims = list(rims)
+    tyres = list(tyres)
+    pizzas = list(pizzas)
+    wheels = list(wheels)
+    rim_rows: Dict[int, int] = {id(rim): row for row, rim in enumerate(rims)}
+    tyre_rows: Dict[int, int] = {id(tyre): row for row, tyre in enumerate(tyres)}
+    tyre_index = array("q")
+    rim_index = array("q")
+    for wheel in wheels:
+        if id(wheel.tyre) not in tyre_rows:
+            tyre_rows[id(wheel.tyre)] = len(tyres)
+            tyres.append(wheel.tyre)
+        if id(wheel.rim) not in rim_rows:
+            rim_rows[id(wheel.rim)] = len(rims)
+            rims.append(wheel.rim)
+        tyre_index.append(tyre_rows[id(wheel.tyre)])
+        rim_index.append(rim_rows[id(wheel.rim)])
+    labels: Dict[str, int] = {}
+    tyre_label = array(
+        "I", [labels.setdefault(tyre.tyre_label, len(labels)) for tyre in tyres]
+    )
+    encoded = [label.encode("utf-8") for label in labels]
+    label_offsets = array("q", [0])
+    for label in encoded:
+        label_offsets.append(label_offsets[-1] + len(label))
+    text = b"".join(encoded)
+
+    with open(path, "wb") as file:
+        file.write(
+            HEADER.pack(
+                MAGIC,
+                len(rims),
+                len(tyres),
+                len(pizzas),
+                len(wheels),
+                len(labels),
+                len(text),
+            )
+        )
+        _write_column(file, array("d", [rim.get_radius() for rim in rims]))
+        _write_column(file, array("d", [rim.diameter_inches for rim in rims]))
+        _write_column(file, array("d", [tyre.get_radius() for tyre in tyres]))
+        _write_column(file, array("i", [tyre.tyre_size for tyre in tyres]))
+        _write_column(file, array("i", [tyre.aspect_ratio for tyre in tyres]))
+        _write_column(file, array("i", [tyre.necessary_rim_size for tyre in tyres]))
+        _write_column(file, tyre_label)
+        _write_column(file, array("d", [pizza.get_radius() for pizza in pizzas]))
+        _write_column(file, array("d", [wheel.get_radius() for wheel in wheels]))
+        _write_column(file, tyre_index)
+        _write_column(file, rim_index)
+        _write_column(file, label_offsets)
+        file.write(text)
+
+
+class Catalogue:
+    """
+    A memory-mapped columnar catalogue opened with `load_catalogue`.
+
+    Attributes:
+        rims (RimColumns): The rim columns.
+        tyres (TyreColumns): The tyre columns.
+        pizzas (PizzaColumns): The pizza columns.
+        wheels (WheelColumns): The wheel columns.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Memory-maps a catalogue file.
+
+        Parameters:
+            path (str): The path of the catalogue file.
+
+        Raises:
+            ValueError: If the file is not a catalogue or is truncated.
+        """
+        if sys.byteorder != "little":
+            raise ValueError("Catalogue files can only be mapped on little-endian hosts")
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+        self._labels: Dict[int, str] = {}
+        try:
+            magic, rims, tyres, pizzas, wheels, labels, text = HEADER.unpack_from(
+                self._view
+            )
+            if magic != MAGIC:
+                raise ValueError("The file is not a circles catalogue")
+            self._offset = HEADER.size
+            self.rims = RimColumns(self._column("d", rims), self._column("d", rims))
+            self.tyres = TyreColumns(
+                self._column("d", tyres),
+                self._column("i", tyres),
+                self._column("i", tyres),
+                self._column("i", tyres),
+                self._column("I", tyres),
+            )
+            self.pizzas = PizzaColumns(self._column("d", pizzas))
+            self.wheels = WheelColumns(
+                self._column("d", wheels),
+                self._column("q", wheels),
+                self._column("q", wheels),
+            )
+            self._label_offsets = self._column("q", labels + 1)
+            self._label_text = self._column("B", text)
+            if self._label_offsets[-1] != text:
+                raise ValueError("The catalogue file holds invalid labels")
+        except (ValueError, struct.error):
+            self.close()
+            raise ValueError("The file is not a valid circles catalogue") from None
+
+    def _column(self, typecode: str, length: int) -> memoryview:
+        size = length * struct.calcsize(typecode)
+        start = self._offset
+        if start + size > len(self._view):
+            raise ValueError("The catalogue file is truncated")
+        self._offset += size + (-size % 8)
+        return self._view[start : start + size].cast(typecode)
+
+    def rim(self, row: int) -> Rim:
+        """
+        Builds the Rim stored in a row.
+
+        Parameters:
+            row (int): The rim row.
+
+        Returns:
+            Rim: The rim.
+        """
+        return Rim(self.rims.radius[row])
+
+    def label(self, index: int) -> str:
+        """
+        Returns a stored tyre label. Every label is decoded once.
+
+        Parameters:
+            index (int): The label index, as stored in the tyre label column.
+
+        Returns:
+            str: The tyre label as it was saved.
+        """
+        label = self._labels.get(index)
+        if label is None:
+            offsets = self._label_offsets
+            data = self._label_text[offsets[index] : offsets[index + 1]]
+            label = self._labels[index] = str(data, "utf-8")
+        return label
+
+    def tyre(self, row: int) -> Tyre:
+        """
+        Builds the Tyre stored in a row, with the label it was saved with.
+
+        Parameters:
+            row (int): The tyre row.
+
+        Returns:
+            Tyre: The tyre.
+        """
+        columns = self.tyres
+        return Tyre(columns.radius[row], self.label(columns.label[row]))
+
+    def pizza(self, row: int) -> Pizza:
+        """
+        Builds the Pizza stored in a row, without ingredients.
+
+        Parameters:
+            row (int): The pizza row.
+
+        Returns:
+            Pizza: The pizza.
+        """
+        return Pizza(self.pizzas.radius[row], [])
+
+    def wheel(self, row: int) -> Wheel:
+        """
+        Builds the Wheel stored in a row together with its tyre and rim.
+
+        Parameters:
+            row (int): The wheel row.
+
+        Returns:
+            Wheel: The wheel.
+        """
+        wheel = Wheel(
+            self.tyre(self.wheels.tyre_index[row]), self.rim(self.wheels.rim_index[row])
+        )
+        wheel.change_diameter(2 * self.wheels.radius[row])
+        return wheel
+
+    def close(self) -> None:
+        """
+        Releases the columns and unmaps the file.
+        """
+        for columns in (
+            getattr(self, "rims", ()),
+            getattr(self, "tyres", ()),
+            getattr(self, "pizzas", ()),
+            getattr(self, "wheels", ()),
+        ):
+            for column in columns:
+                column.release()
+        for name in ("_label_offsets", "_label_text"):
+            column = getattr(self, name, None)
+            if column is not None:
+                column.release()
+        self._view.release()
+        self._mmap.close()
+
+    def __enter__(self) -> Catalogue:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def load_catalogue(path: str) -> Catalogue:
+    """
+    Memory-maps a catalogue file written by `save_catalogue`.
+
+    Parameters:
+        path (str): The path of the catalogue file.
+
+    Returns:
+        Catalogue: The mapped catalogue.
+
+    Raises:
+        ValueError: If the file is not a catalogue or is truncated.
+    """
+    return Catalogue(path)
@@ -10,7 +10,19 @@ objects such as: pizza, wheel, rim, tyre.
 from __future__ import annotations
 from abc import ABC, abstractmethod
 import math
-from typing import Union
+from typing import Iterable, List, Union
+
+SPEC_DIGITS = 6
+
+
+def _rebuild(cls: type, radius: Union[int, float], *state) -> Circle:
+    """
+    Recreates a pickled circle from its radius and state without running the
+    constructor checks again.
+    """
+    circle = cls.__new__(cls)
+    circle._restore(radius, state)
+    return circle
 
 
 class Circle(ABC):
@@ -18,11 +30,23 @@ class Circle(ABC):
     An abstract base class representing a circle, defining methods to be used or overridden
     in subclasses.
 
+    The area and the diameter are computed on first use and cached until the radius
+    changes. Subclasses that derive attributes from the radius refresh them in
+    `_on_radius_change`. Circles pickle as their class, radius and the attributes
+    returned by `_get_state`; the cached values are not stored.
+
+    Circles compare and hash by the value key returned by `spec_key`, in which the
+    radius is rounded to SPEC_DIGITS decimal places, so radii differing only by
+    floating point error are equal. A circle must not be changed while it is a set
+    element or a dict key.
+
     Attributes:
         __radius (Union[int, float]): The radius of the circle.
 
     """
 
+    __slots__ = ("__radius", "_area", "_diameter")
+
     @abstractmethod
     def __init__(self, radius: Union[int, float]) -> None:
         """
@@ -33,6 +57,8 @@ class Circle(ABC):
         """
         self.validate_data(radius)
         self.__radius = radius
+        self._area = None
+        self._diameter = None
 
     def get_diameter(self) -> Union[int, float]:
         """
@@ -41,7 +67,10 @@ class Circle(ABC):
         Returns:
             Union[int, float]: The diameter of the circle.
         """
-        return 2 * self.__radius
+        diameter = self._diameter
+        if diameter is None:
+            diameter = self._diameter = 2 * self.__radius
+        return diameter
 
     def get_area(self) -> float:
         """
@@ -50,7 +79,10 @@ class Circle(ABC):
         Returns:
             float: The area of the circle.
         """
-        return math.pi * self.__radius**2
+        area = self._area
+        if area is None:
+            area = self._area = math.pi * self.__radius**2
+        return area
 
     @classmethod
     @abstractmethod
@@ -69,9 +101,90 @@ class Circle(ABC):
 
         Parameters:
             new_diameter (Union[int, float]): The new diameter for the circle.
+
+        If a subclass rejects the new radius while refreshing its derived attributes,
+        the old radius is restored before the exception is raised again.
         """
         self.validate_data(new_diameter)
+        old_radius = self.__radius
         self.__radius = new_diameter / 2
+        try:
+            self._on_radius_change()
+        except Exception:
+            self.__radius = old_radius
+            self._on_radius_change()
+            raise
+
+    def _on_radius_change(self) -> None:
+        """
+        Drops the cached values derived from the radius after it has changed.
+        Subclasses extend it to refresh their own derived attributes.
+        """
+        self._area = None
+        self._diameter = None
+
+    def spec_key(self) -> tuple:
+        """
+        Returns the canonical value key of the circle: its class and radius rounded
+        to SPEC_DIGITS decimal places. Subclasses add the constructor arguments that
+        tell their specs apart; attributes derived from them are left out.
+
+        Returns:
+            tuple: A hashable key, equal for circles with the same spec.
+        """
+        return type(self), self._spec_radius()
+
+    def _spec_radius(self) -> Union[int, float]:
+        return round(self.__radius, SPEC_DIGITS)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Circle):
+            return NotImplemented
+        return self.spec_key() == other.spec_key()
+
+    def __hash__(self) -> int:
+        return hash(self.spec_key())
+
+    def __reduce__(self) -> tuple:
+        return _rebuild, (type(self), self.__radius) + self._get_state()
+
+    def _get_state(self) -> tuple:
+        """
+        Returns the attributes of a subclass stored when pickling, in the order
+        `_set_state` expects them.
+        """
+        return ()
+
+    def _set_state(self, state: tuple) -> None:
+        """
+        Restores the attributes returned by `_get_state` on an unpickled object.
+        """
+
+    def _restore(self, radius: Union[int, float], state: tuple) -> None:
+        self.__radius = radius
+        self._area = None
+        self._diameter = None
+        self._set_state(state)
+
+    @classmethod
+    def _rebuild_many(
+        cls, radii: Iterable[Union[int, float]], states: Iterable[tuple]
+    ) -> List[Circle]:
+        """
+        Recreates many circles from their radii and states, as `_rebuild` does for
+        one circle.
+        """
+        new = cls.__new__
+        set_state = cls._set_state
+        circles = []
+        for radius, state in zip(radii, states):
+            circle = new(cls)
+            circle.__radius = radius
+            circle._area = None
+            circle._diameter = None
+            set_state(circle, state)
+            circles.append(circle)
+        return circles
 
     @staticmethod
     def validate_data(data):
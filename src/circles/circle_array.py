@@ -0,0 +1,294 @@
+"""
+Module for storing large collections of circle-like objects as contiguous columns.
+
+This module defines the `CircleArray` class, which keeps the radii of many circles in a
+single `array.array` of doubles instead of one `Circle` object per item, and its typed
+variants `RimArray`, `TyreArray` and `PizzaArray`. Geometry methods work on the whole
+column at once and the arrays can be converted to and from lists of `Circle` objects.
+"""
+
+from __future__ import annotations
+from array import array
+import math
+from typing import Iterable, List, Sequence, Union
+
+from circles.circle import Circle
+from circles.conversion import mm_to_inches_array, mm_to_rim_sizes
+from circles.pizza import (
+    PIZZA_SIZE_BREAKPOINTS,
+    PIZZA_SIZES,
+    Pizza,
+    classify_pizza_radii,
+)
+from circles.rim import Rim
+from circles.tyre import Tyre
+from circles.tyre_geometry import label_outer_diameters, radius_mismatches
+
+
+class CircleArray:
+    """
+    A column-oriented collection of circles.
+
+    Attributes:
+        radii (array): The radii of the circles stored as contiguous doubles.
+        circle_class (type): The Circle subclass the array converts its items to.
+    """
+
+    circle_class = None
+
+    def __init__(self, radii: Iterable[Union[int, float]] = ()) -> None:
+        """
+        Initializes a CircleArray and verifies that every radius is correct.
+
+        Parameters:
+            radii (Iterable[Union[int, float]]): The radii of the circles.
+
+        Raises:
+            TypeError: If any radius is not an integer or a float.
+            ValueError: If any radius is not greater than zero.
+        """
+        self.radii = array("d")
+        for radius in radii:
+            Circle.validate_data(radius)
+            self.radii.append(radius)
+
+    def __len__(self) -> int:
+        return len(self.radii)
+
+    def areas(self) -> array:
+        """
+        Returns the areas of all circles.
+
+        Returns:
+            array: The areas of the circles.
+        """
+        pi = math.pi
+        return array("d", [pi * radius * radius for radius in self.radii])
+
+    def diameters(self) -> array:
+        """
+        Returns the diameters of all circles.
+
+        Returns:
+            array: The diameters of the circles.
+        """
+        return array("d", [2 * radius for radius in self.radii])
+
+    def change_diameter(
+        self, new_diameters: Union[int, float, Sequence[Union[int, float]]]
+    ) -> None:
+        """
+        Changes the diameters of the circles.
+
+        Parameters:
+            new_diameters (Union[int, float, Sequence[Union[int, float]]]): A single diameter
+             applied to every circle, or one diameter per circle.
+
+        Raises:
+            ValueError: If the number of diameters doesn't match the number of circles
+             or any diameter is not greater than zero.
+            TypeError: If any diameter is not an integer or a float.
+        """
+        if isinstance(new_diameters, (int, float)):
+            Circle.validate_data(new_diameters)
+            self.radii = array("d", [new_diameters / 2]) * len(self.radii)
+            return
+        if len(new_diameters) != len(self.radii):
+            raise ValueError("The number of diameters must match the number of circles")
+        for diameter in new_diameters:
+            Circle.validate_data(diameter)
+        self.radii = array("d", [diameter / 2 for diameter in new_diameters])
+
+    @classmethod
+    def from_circles(cls, circles: Iterable[Circle]) -> CircleArray:
+        """
+        Creates an array from existing Circle objects.
+
+        Parameters:
+            circles (Iterable[Circle]): The circles to store.
+
+        Returns:
+            CircleArray: An instance of the array class.
+        """
+        return cls(circle.get_radius() for circle in circles)
+
+    def to_circles(self) -> List[Circle]:
+        """
+        Converts the array to a list of Circle objects.
+
+        Returns:
+            List[Circle]: A list of `circle_class` instances.
+
+        Raises:
+            TypeError: If the array has no concrete circle class to convert to.
+        """
+        if self.circle_class is None:
+            raise TypeError("CircleArray can only be converted by its typed variants")
+        return [self.circle_class(radius) for radius in self.radii]
+
+
+class RimArray(CircleArray):
+    """
+    A column-oriented collection of rims.
+
+    Attributes:
+        radii (array): The radii of the rims in millimeters.
+    """
+
+    circle_class = Rim
+
+    def diameters_inches(self) -> array:
+        """
+        Returns the diameters of all rims measured in inches.
+
+        Returns:
+            array: The diameters of the rims in inches.
+        """
+        return mm_to_inches_array([2 * radius for radius in self.radii])
+
+    def rim_sizes(self) -> array:
+        """
+        Returns the rim sizes of all rims used for fitment, in whole inches.
+
+        Returns:
+            array: The rim diameters in inches rounded to whole numbers.
+        """
+        return mm_to_rim_sizes([2 * radius for radius in self.radii])
+
+
+class TyreArray(CircleArray):
+    """
+    A column-oriented collection of tyres.
+
+    Attributes:
+        radii (array): The radii of the tyres in millimeters.
+        tyre_labels (list): The tyre labels, one per radius.
+    """
+
+    circle_class = Tyre
+
+    def __init__(
+        self, radii: Iterable[Union[int, float]] = (), tyre_labels: Iterable[str] = ()
+    ) -> None:
+        """
+        Initializes a TyreArray.
+
+        Parameters:
+            radii (Iterable[Union[int, float]]): The radii of the tyres in millimeters.
+            tyre_labels (Iterable[str]): The tyre labels, one per radius.
+
+        Raises:
+            ValueError: If the number of labels doesn't match the number of radii.
+        """
+        super().__init__(radii)
+        self.tyre_labels = list(tyre_labels)
+        if len(self.tyre_labels) != len(self.radii):
+            raise ValueError("The number of tyre labels must match the number of radii")
+
+    @classmethod
+    def from_circles(cls, circles: Iterable[Tyre]) -> TyreArray:
+        radii = []
+        tyre_labels = []
+        for tyre in circles:
+            radii.append(tyre.get_radius())
+            tyre_labels.append(tyre.tyre_label)
+        return cls(radii, tyre_labels)
+
+    def to_circles(self) -> List[Tyre]:
+        return [
+            Tyre(radius, tyre_label)
+            for radius, tyre_label in zip(self.radii, self.tyre_labels)
+        ]
+
+    def outer_diameters(self) -> array:
+        """
+        Returns the outer diameters implied by the tyre labels.
+
+        Returns:
+            array: The outer diameters in millimeters.
+
+        Raises:
+            ValueError: If a tyre label is not valid.
+        """
+        return label_outer_diameters(self.tyre_labels)
+
+    def radius_mismatches(self, tolerance: float) -> array:
+        """
+        Returns the tyres whose diameter differs from the outer diameter implied by
+        their label by more than a tolerance.
+
+        Parameters:
+            tolerance (float): The largest accepted difference in millimeters.
+
+        Returns:
+            array: The indexes of the mismatching tyres.
+
+        Raises:
+            ValueError: If a tyre label is not valid or tolerance is negative.
+        """
+        return radius_mismatches(self.radii, self.outer_diameters(), tolerance)
+
+
+class PizzaArray(CircleArray):
+    """
+    A column-oriented collection of pizzas.
+
+    Attributes:
+        radii (array): The radii of the pizzas in centimeters.
+        ingredients (list): The ingredient lists, one per radius.
+    """
+
+    circle_class = Pizza
+
+    def __init__(
+        self, radii: Iterable[Union[int, float]] = (), ingredients: Iterable[list] = ()
+    ) -> None:
+        """
+        Initializes a PizzaArray.
+
+        Parameters:
+            radii (Iterable[Union[int, float]]): The radii of the pizzas in centimeters.
+            ingredients (Iterable[list]): The ingredient lists, one per radius.
+
+        Raises:
+            ValueError: If the number of ingredient lists doesn't match the number of radii.
+        """
+        super().__init__(radii)
+        self.ingredients = list(ingredients)
+        if len(self.ingredients) != len(self.radii):
+            raise ValueError(
+                "The number of ingredient lists must match the number of radii"
+            )
+
+    @classmethod
+    def from_circles(cls, circles: Iterable[Pizza]) -> PizzaArray:
+        radii = []
+        ingredients = []
+        for pizza in circles:
+            radii.append(pizza.get_radius())
+            ingredients.append(pizza.ingredients)
+        return cls(radii, ingredients)
+
+    def sizes(
+        self,
+        breakpoints: Sequence[Union[int, float]] = PIZZA_SIZE_BREAKPOINTS,
+        sizes: Sequence[str] = PIZZA_SIZES,
+    ) -> List[str]:
+        """
+        Categorizes all pizzas by their radius.
+
+        Parameters:
+            breakpoints (Sequence[Union[int, float]]): The sorted upper radius limits of
+             every size but the last one, inclusive.
+            sizes (Sequence[str]): The size names, one more than the breakpoints.
+
+        Returns:
+            List[str]: The size of every pizza.
+        """
+        return classify_pizza_radii(self.radii, breakpoints, sizes)
+
+    def to_circles(self) -> List[Pizza]:
+        return [
+            Pizza(radius, ingredients)
+            for radius, ingredients in zip(self.radii, self.ingredients)
+        ]
@@ -0,0 +1,416 @@
+"""
+Module for encoding whole lists of rims, tyres, pizzas and wheels into one buffer.
+
+This module defines `encode`, which packs a list of objects into a compact columnar
+byte string, and `decode`, which rebuilds the list. The buffer is meant for shipping
+large batches between processes: every string is stored once, numbers are stored in
+fixed-width columns and decoding restores the objects without running the
+constructor checks again, with the garbage collector paused while the objects are
+created. Attributes derived from the radius or the tyre label are recomputed on
+decoding and only stored for objects whose attributes were changed by hand. Objects
+repeated in the list, and tyres and rims shared by several wheels or also present in
+the list, are stored once and decoded as shared objects. Radii are stored as floats;
+a flag in the kind byte marks int radii, which are decoded as ints again. Int radii
+above 2**53 cannot be stored exactly as floats and are rejected. Instances of
+subclasses, such as the shared `FrozenRim` and `FrozenTyre` objects of the 'specs'
+module, are stored as their base class and decoded as plain, equal objects.
+
+Buffer format (all values little-endian):
+
+    Header, 112 bytes:
+        magic        8 bytes   b"CIRCODE3"
+        objects      uint64    number of stored objects, distinct list items first
+        items        uint64    number of list items
+        rims         uint64    number of rims
+        tyres        uint64    number of tyres
+        pizzas       uint64    number of pizzas
+        wheels       uint64    number of wheels
+        ingredients  uint64    total number of pizza ingredients
+        rim fixes    uint64    number of rims with a changed diameter in inches
+        tyre fixes   uint64    number of tyres with changed label fields
+        pizza fixes  uint64    number of pizzas with a changed size
+        repeats      uint64    number of list items repeating an earlier object
+        strings      uint64    number of distinct strings
+        text         uint64    length of the UTF-8 string data in bytes
+
+    Columns follow in the order below:
+        objects:     kind (uint8: 0 rim, 1 tyre, 2 pizza, 3 wheel; plus 128 when
+                     the radius is an int)
+        rims:        radius (float64)
+        tyres:       radius (float64), label string (uint32)
+        pizzas:      radius (float64), ingredient count (uint32)
+        ingredients: ingredient string (uint32)
+        wheels:      radius (float64), tyre object (uint32), rim object (uint32)
+        rim fixes:   rim row (uint32), diameter in inches (float64)
+        tyre fixes:  tyre row (uint32), width (int32), aspect ratio (int32),
+                     rim size (int32)
+        pizza fixes: pizza row (uint32), size string (uint32)
+        repeats:     list position (uint32), stored object (uint32)
+        strings:     length in bytes (uint32), then the UTF-8 data
+"""
+
+from __future__ import annotations
+from array import array
+import gc
+import struct
+import sys
+from typing import Dict, List, Sequence, Union
+
+from circles.pizza import Pizza, classify_pizza_radius
+from circles.rim import Rim
+from circles.tyre import Tyre, try_parse_tyre_label
+from circles.wheel import Wheel
+
+MAGIC = b"CIRCODE3"
+HEADER = struct.Struct("<8s13Q")
+RIM, TYRE, PIZZA, WHEEL = range(4)
+INT_RADIUS = 0x80
+MAX_INT_RADIUS = 2**53
+KINDS: Dict[type, int] = {Rim: RIM, Tyre: TYRE, Pizza: PIZZA, Wheel: WHEEL}
+
+Encodable = Union[Rim, Tyre, Pizza, Wheel]
+_SUBCLASS_KINDS: Dict[type, int] = {}
+
+
+def _column_bytes(column: array) -> bytes:
+    if sys.byteorder != "little":
+        column.byteswap()
+    return column.tobytes()
+
+
+class _Reader:
+    def __init__(self, data: bytes) -> None:
+        self.data = memoryview(data)
+        self.offset = HEADER.size
+
+    def column(self, typecode: str, length: int) -> array:
+        column = array(typecode)
+        size = length * column.itemsize
+        if self.offset + size > len(self.data):
+            raise ValueError("The buffer is truncated")
+        column.frombytes(self.data[self.offset : self.offset + size])
+        self.offset += size
+        if sys.byteorder != "little":
+            column.byteswap()
+        return column
+
+    def text(self, length: int) -> str:
+        if self.offset + length > len(self.data):
+            raise ValueError("The buffer is truncated")
+        text = str(self.data[self.offset : self.offset + length], "utf-8")
+        self.offset += length
+        return text
+
+
+def _kind(cls: type) -> int:
+    kind = _SUBCLASS_KINDS.get(cls)
+    if kind is None:
+        for base in cls.__mro__:
+            if base in KINDS:
+                kind = _SUBCLASS_KINDS[cls] = KINDS[base]
+                break
+        else:
+            raise TypeError("Only Rim, Tyre, Pizza and Wheel objects can be encoded")
+    return kind
+
+
+def encode(objects: Sequence[Encodable]) -> bytes:
+    """
+    Encodes a list of rims, tyres, pizzas and wheels into one buffer.
+
+    Parameters:
+        objects (Sequence[Encodable]): The objects to encode.
+
+    Returns:
+        bytes: The encoded buffer.
+
+    Raises:
+        TypeError: If an object is not a Rim, Tyre, Pizza or Wheel, or a pizza
+         ingredient is not a string.
+        ValueError: If an int radius is larger than 2**53.
+    """
+    stored: List[Encodable] = []
+    rows: Dict[int, int] = {}
+    repeat_position = array("I")
+    repeat_object = array("I")
+    items = 0
+    for circle in objects:
+        index = rows.get(id(circle))
+        if index is None:
+            rows[id(circle)] = len(stored)
+            stored.append(circle)
+        else:
+            repeat_position.append(items)
+            repeat_object.append(index)
+        items += 1
+    strings: Dict[str, int] = {}
+    kinds = array("B")
+    rim_radius = array("d")
+    tyre_radius = array("d")
+    tyre_label = array("I")
+    pizza_radius = array("d")
+    pizza_count = array("I")
+    ingredients = array("I")
+    wheel_radius = array("d")
+    wheel_tyre = array("I")
+    wheel_rim = array("I")
+    rim_fix_row = array("I")
+    rim_fix_inches = array("d")
+    tyre_fix_row = array("I")
+    tyre_fix_width = array("i")
+    tyre_fix_aspect = array("i")
+    tyre_fix_rim = array("i")
+    pizza_fix_row = array("I")
+    pizza_fix_size = array("I")
+
+    def row(component: Encodable) -> int:
+        index = rows.get(id(component))
+        if index is None:
+            index = rows[id(component)] = len(stored)
+            stored.append(component)
+        return index
+
+    index = 0
+    while index < len(stored):
+        circle = stored[index]
+        kind = KINDS.get(type(circle))
+        if kind is None:
+            kind = _kind(type(circle))
+        radius = circle.get_radius()
+        if isinstance(radius, int):
+            if radius > MAX_INT_RADIUS:
+                raise ValueError("Int radii above 2**53 cannot be encoded exactly")
+            kinds.append(kind | INT_RADIUS)
+        else:
+            kinds.append(kind)
+        if kind == RIM:
+            if circle.diameter_inches != Rim.mm_to_inches(2 * radius):
+                rim_fix_row.append(len(rim_radius))
+                rim_fix_inches.append(circle.diameter_inches)
+            rim_radius.append(radius)
+        elif kind == TYRE:
+            fields = (circle.tyre_size, circle.aspect_ratio, circle.necessary_rim_size)
+            if try_parse_tyre_label(circle.tyre_label) != fields:
+                tyre_fix_row.append(len(tyre_radius))
+                tyre_fix_width.append(fields[0])
+                tyre_fix_aspect.append(fields[1])
+                tyre_fix_rim.append(fields[2])
+            tyre_radius.append(radius)
+            tyre_label.append(strings.setdefault(circle.tyre_label, len(strings)))
+        elif kind == PIZZA:
+            if circle.size != classify_pizza_radius(radius):
+                pizza_fix_row.append(len(pizza_radius))
+                pizza_fix_size.append(strings.setdefault(circle.size, len(strings)))
+            pizza_radius.append(radius)
+            pizza_count.append(len(circle.ingredients))
+            for ingredient in circle.ingredients:
+                if not isinstance(ingredient, str):
+                    raise TypeError("Pizza ingredients must be strings to be encoded")
+                ingredients.append(strings.setdefault(ingredient, len(strings)))
+        else:
+            wheel_radius.append(radius)
+            wheel_tyre.append(row(circle.tyre))
+            wheel_rim.append(row(circle.rim))
+        index += 1
+
+    encoded = [string.encode("utf-8") for string in strings]
+    text = b"".join(encoded)
+    header = HEADER.pack(
+        MAGIC,
+        len(stored),
+        items,
+        len(rim_radius),
+        len(tyre_radius),
+        len(pizza_radius),
+        len(wheel_radius),
+        len(ingredients),
+        len(rim_fix_row),
+        len(tyre_fix_row),
+        len(pizza_fix_row),
+        len(repeat_position),
+        len(strings),
+        len(text),
+    )
+    columns = (
+        kinds,
+        rim_radius,
+        tyre_radius,
+        tyre_label,
+        pizza_radius,
+        pizza_count,
+        ingredients,
+        wheel_radius,
+        wheel_tyre,
+        wheel_rim,
+        rim_fix_row,
+        rim_fix_inches,
+        tyre_fix_row,
+        tyre_fix_width,
+        tyre_fix_aspect,
+        tyre_fix_rim,
+        pizza_fix_row,
+        pizza_fix_size,
+        repeat_position,
+        repeat_object,
+        array("I", [len(string) for string in encoded]),
+    )
+    return b"".join([header, *map(_column_bytes, columns), text])
+
+
+def decode(data: bytes) -> List[Encodable]:
+    """
+    Decodes a buffer written by `encode`.
+
+    Parameters:
+        data (bytes): The encoded buffer.
+
+    Returns:
+        List[Encodable]: The decoded objects in their original order.
+
+    Raises:
+        ValueError: If the buffer was not written by `encode` or is corrupt.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return _decode(data)
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _decode(data: bytes) -> List[Encodable]:
+    try:
+        magic, *counts = HEADER.unpack_from(data)
+    except struct.error:
+        raise ValueError("The buffer is not a circles codec buffer") from None
+    if magic != MAGIC:
+        raise ValueError("The buffer is not a circles codec buffer")
+    (
+        total,
+        items,
+        rim_total,
+        tyre_total,
+        pizza_total,
+        wheel_total,
+        ingredient_total,
+        rim_fixes,
+        tyre_fixes,
+        pizza_fixes,
+        repeats,
+        string_total,
+        text_size,
+    ) = counts
+    reader = _Reader(data)
+    kinds = reader.column("B", total)
+    rim_radius = reader.column("d", rim_total)
+    tyre_radius = reader.column("d", tyre_total)
+    tyre_label = reader.column("I", tyre_total)
+    pizza_radius = reader.column("d", pizza_total)
+    pizza_count = reader.column("I", pizza_total)
+    ingredients = reader.column("I", ingredient_total)
+    wheel_radius = reader.column("d", wheel_total)
+    wheel_tyre = reader.column("I", wheel_total)
+    wheel_rim = reader.column("I", wheel_total)
+    rim_fix_row = reader.column("I", rim_fixes)
+    rim_fix_inches = reader.column("d", rim_fixes)
+    tyre_fix_row = reader.column("I", tyre_fixes)
+    tyre_fix_width = reader.column("i", tyre_fixes)
+    tyre_fix_aspect = reader.column("i", tyre_fixes)
+    tyre_fix_rim = reader.column("i", tyre_fixes)
+    pizza_fix_row = reader.column("I", pizza_fixes)
+    pizza_fix_size = reader.column("I", pizza_fixes)
+    repeat_position = reader.column("I", repeats)
+    repeat_object = reader.column("I", repeats)
+    lengths = reader.column("I", string_total)
+    text = reader.text(text_size)
+    strings = []
+    start = 0
+    for length in lengths:
+        strings.append(text[start : start + length])
+        start += length
+    if start != len(text):
+        raise ValueError("The buffer holds invalid data")
+
+    try:
+        if any(value & INT_RADIUS for value in kinds):
+            rim_radius, tyre_radius, pizza_radius, wheel_radius = radii = [
+                rim_radius.tolist(),
+                tyre_radius.tolist(),
+                pizza_radius.tolist(),
+                wheel_radius.tolist(),
+            ]
+            rows = [0] * len(radii)
+            plain = array("B")
+            for value in kinds:
+                kind = value & ~INT_RADIUS
+                if value & INT_RADIUS:
+                    column = radii[kind]
+                    column[rows[kind]] = int(column[rows[kind]])
+                rows[kind] += 1
+                plain.append(kind)
+            kinds = plain
+
+        inches = {}
+        for radius in rim_radius:
+            if radius not in inches:
+                inches[radius] = (Rim.mm_to_inches(2 * radius),)
+        rims = Rim._rebuild_many(rim_radius, [inches[radius] for radius in rim_radius])
+        for row, diameter_inches in zip(rim_fix_row, rim_fix_inches):
+            rims[row].diameter_inches = diameter_inches
+
+        labels = {}
+        for label in tyre_label:
+            if label not in labels:
+                fields = try_parse_tyre_label(strings[label]) or (0, 0, 0)
+                labels[label] = (strings[label], *fields)
+        tyres = Tyre._rebuild_many(tyre_radius, [labels[label] for label in tyre_label])
+        for row, width, aspect_ratio, rim_size in zip(
+            tyre_fix_row, tyre_fix_width, tyre_fix_aspect, tyre_fix_rim
+        ):
+            tyre = tyres[row]
+            tyre.tyre_size = width
+            tyre.aspect_ratio = aspect_ratio
+            tyre.necessary_rim_size = rim_size
+
+        names = [strings[ingredient] for ingredient in ingredients]
+        states = []
+        start = 0
+        for radius, count in zip(pizza_radius, pizza_count):
+            states.append((names[start : start + count], classify_pizza_radius(radius)))
+            start += count
+        pizzas = Pizza._rebuild_many(pizza_radius, states)
+        for row, size in zip(pizza_fix_row, pizza_fix_size):
+            pizzas[row].size = strings[size]
+
+        decoded: List[Encodable] = [None] * total
+        for kind, built in ((RIM, rims), (TYRE, tyres), (PIZZA, pizzas)):
+            positions = [index for index, value in enumerate(kinds) if value == kind]
+            if len(positions) != len(built):
+                raise ValueError("The buffer holds invalid object kinds")
+            for index, circle in zip(positions, built):
+                decoded[index] = circle
+        positions = [index for index, value in enumerate(kinds) if value == WHEEL]
+        if len(positions) != len(wheel_radius):
+            raise ValueError("The buffer holds invalid object kinds")
+        states = [
+            (decoded[tyre], decoded[rim]) for tyre, rim in zip(wheel_tyre, wheel_rim)
+        ]
+        for index, wheel in zip(positions, Wheel._rebuild_many(wheel_radius, states)):
+            decoded[index] = wheel
+    except IndexError:
+        raise ValueError("The buffer holds invalid references") from None
+    unique = items - repeats
+    if not 0 <= unique <= total:
+        raise ValueError("The buffer holds invalid repeats")
+    if not repeats:
+        return decoded[:items]
+    distinct = iter(decoded[:unique])
+    repeated = dict(zip(repeat_position, repeat_object))
+    try:
+        return [
+            next(distinct) if position not in repeated else decoded[repeated[position]]
+            for position in range(items)
+        ]
+    except (IndexError, StopIteration):
+        raise ValueError("The buffer holds invalid references") from None
@@ -0,0 +1,355 @@
+"""
+Module for range, top-k and quantile queries over mixed collections of circles.
+
+This module defines the `CircleCollection` class, which keeps the circles of every
+class (`Pizza`, `Rim`, `Tyre`, `Wheel` and any other `Circle` subclass) sorted by
+radius, together with contiguous arrays of their radii and areas. Area and diameter
+grow with the radius, so one order serves every query: a range query is two bisections
+per class, the k largest circles are the last k of every class, and a quantile is read
+from the sorted array at its rank instead of scanning and calling `get_area()`.
+
+Added circles are buffered and merged into the sorted arrays on the next query; a
+batch added in increasing radius order is appended without sorting. Circles whose
+radius changes after they were added are found again after `rebuild`.
+"""
+
+from __future__ import annotations
+from array import array
+from bisect import bisect_left, bisect_right
+import heapq
+from itertools import islice, repeat
+import math
+from operator import itemgetter
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from circles.circle import Circle
+
+MEASURES = ("radius", "diameter", "area")
+
+_first = itemgetter(0)
+
+
+class _SortedColumn:
+    __slots__ = ("radii", "areas", "circles", "pending_radii", "pending_circles")
+
+    def __init__(self) -> None:
+        self.radii = array("d")
+        self.areas = array("d")
+        self.circles: List[Circle] = []
+        self.pending_radii: List[Union[int, float]] = []
+        self.pending_circles: List[Circle] = []
+
+    def flush(self) -> None:
+        radii = self.pending_radii
+        if not radii:
+            return
+        circles = self.pending_circles
+        self.pending_radii = []
+        self.pending_circles = []
+        if self.radii and min(radii) < self.radii[-1]:
+            # the sorted radii are one run, so timsort merges in linear time
+            radii = self.radii.tolist() + radii
+            circles = self.circles + circles
+            self.radii = array("d")
+            self.areas = array("d")
+            self.circles = []
+        order = sorted(range(len(radii)), key=radii.__getitem__)
+        radii = list(map(radii.__getitem__, order))
+        self.radii.extend(radii)
+        # the same expression as Circle.get_area, so the areas compare equal
+        self.areas.extend(map(math.pi.__mul__, map(pow, radii, repeat(2))))
+        self.circles.extend(map(circles.__getitem__, order))
+
+    def values(self, measure: str) -> array:
+        return self.areas if measure == "area" else self.radii
+
+    def span(self, measure: str, low: float, high: float) -> Tuple[int, int]:
+        if measure == "diameter":
+            low, high = low / 2, high / 2
+        values = self.values(measure)
+        return bisect_left(values, low), bisect_right(values, high)
+
+
+def _check_measure(measure: str) -> None:
+    if measure not in MEASURES:
+        raise ValueError(f"The measure must be one of {', '.join(MEASURES)}")
+
+
+def _quantiles(values: Sequence[float], qs: Sequence[float]) -> List[float]:
+    """
+    Returns quantiles of sorted values by linear interpolation between the closest
+    ranks.
+    """
+    if not values:
+        raise ValueError("Quantiles of an empty collection are undefined")
+    result = []
+    last = len(values) - 1
+    for q in qs:
+        if not 0 <= q <= 1:
+            raise ValueError("Quantiles must be between 0 and 1")
+        position = q * last
+        lower = int(position)
+        fraction = position - lower
+        value = values[lower]
+        if fraction:
+            value += (values[lower + 1] - value) * fraction
+        result.append(value)
+    return result
+
+
+class CircleCollection:
+    """
+    Circles of mixed classes kept sorted by radius per class.
+
+    Queries take an optional `kind`, a Circle subclass; only circles of that class and
+    its subclasses are included, all circles with None. Ranges are inclusive, and
+    `measure` is "radius", "diameter" or "area".
+    """
+
+    def __init__(self, circles: Iterable[Circle] = ()) -> None:
+        """
+        Initializes a CircleCollection.
+
+        Parameters:
+            circles (Iterable[Circle]): The circles to add.
+
+        Raises:
+            TypeError: If an object is not a circle.
+        """
+        self._columns: Dict[type, _SortedColumn] = {}
+        self.extend(circles)
+
+    def __len__(self) -> int:
+        return sum(
+            len(column.circles) + len(column.pending_circles)
+            for column in self._columns.values()
+        )
+
+    def add(self, circle: Circle) -> None:
+        """
+        Adds a circle to the collection.
+
+        Parameters:
+            circle (Circle): The circle to add.
+
+        Raises:
+            TypeError: If the provided object is not a circle.
+        """
+        self.extend((circle,))
+
+    def extend(self, circles: Iterable[Circle]) -> None:
+        """
+        Adds many circles to the collection. They are sorted in once on the next query.
+
+        Parameters:
+            circles (Iterable[Circle]): The circles to add.
+
+        Raises:
+            TypeError: If an object is not a circle. The circles before it are added.
+        """
+        columns = self._columns
+        for circle in circles:
+            column = columns.get(type(circle))
+            if column is None:
+                if not isinstance(circle, Circle):
+                    raise TypeError("Provided object must be a circle")
+                column = columns[type(circle)] = _SortedColumn()
+            column.pending_radii.append(circle.get_radius())
+            column.pending_circles.append(circle)
+
+    def rebuild(self) -> None:
+        """
+        Sorts every class again from the current radii of its circles. Needed after
+        the diameter of an added circle has been changed.
+        """
+        for column in self._columns.values():
+            circles = column.circles + column.pending_circles
+            column.radii = array("d")
+            column.areas = array("d")
+            column.circles = []
+            column.pending_radii = [circle.get_radius() for circle in circles]
+            column.pending_circles = circles
+            column.flush()
+
+    def classes(self) -> List[type]:
+        """
+        Returns the classes of the stored circles.
+
+        Returns:
+            List[type]: The classes in the order they were first added.
+        """
+        return list(self._columns)
+
+    def _matching(self, kind: Optional[type]) -> List[_SortedColumn]:
+        columns = []
+        for circle_class, column in self._columns.items():
+            if kind is None or issubclass(circle_class, kind):
+                column.flush()
+                columns.append(column)
+        return columns
+
+    def between(
+        self,
+        low: float,
+        high: float,
+        measure: str = "radius",
+        kind: Optional[type] = None,
+    ) -> List[Circle]:
+        """
+        Returns the circles whose measure lies in a range.
+
+        Parameters:
+            low (float): The lower bound, inclusive.
+            high (float): The upper bound, inclusive.
+            measure (str): "radius", "diameter" or "area".
+            kind (Optional[type]): The Circle subclass to query, None for all.
+
+        Returns:
+            List[Circle]: The matching circles from the smallest up.
+
+        Raises:
+            ValueError: If the measure is unknown.
+        """
+        _check_measure(measure)
+        runs = []
+        for column in self._matching(kind):
+            start, stop = column.span(measure, low, high)
+            if start < stop:
+                runs.append(
+                    zip(column.radii[start:stop], column.circles[start:stop])
+                )
+        if len(runs) == 1:
+            return [circle for _, circle in runs[0]]
+        return [circle for _, circle in heapq.merge(*runs, key=_first)]
+
+    def count_between(
+        self,
+        low: float,
+        high: float,
+        measure: str = "radius",
+        kind: Optional[type] = None,
+    ) -> int:
+        """
+        Returns the number of circles whose measure lies in a range.
+
+        Parameters:
+            low (float): The lower bound, inclusive.
+            high (float): The upper bound, inclusive.
+            measure (str): "radius", "diameter" or "area".
+            kind (Optional[type]): The Circle subclass to query, None for all.
+
+        Returns:
+            int: The number of matching circles.
+
+        Raises:
+            ValueError: If the measure is unknown.
+        """
+        _check_measure(measure)
+        count = 0
+        for column in self._matching(kind):
+            start, stop = column.span(measure, low, high)
+            count += max(0, stop - start)
+        return count
+
+    def largest(self, k: int, kind: Optional[type] = None) -> List[Circle]:
+        """
+        Returns the k largest circles.
+
+        Parameters:
+            k (int): The number of circles.
+            kind (Optional[type]): The Circle subclass to query, None for all.
+
+        Returns:
+            List[Circle]: Up to k circles from the largest down.
+        """
+        if k <= 0:
+            return []
+        runs = []
+        for column in self._matching(kind):
+            start = max(0, len(column.circles) - k)
+            runs.append(
+                zip(column.radii[start:][::-1], reversed(column.circles[start:]))
+            )
+        merged = heapq.merge(*runs, key=_first, reverse=True)
+        return [circle for _, circle in islice(merged, k)]
+
+    def smallest(self, k: int, kind: Optional[type] = None) -> List[Circle]:
+        """
+        Returns the k smallest circles.
+
+        Parameters:
+            k (int): The number of circles.
+            kind (Optional[type]): The Circle subclass to query, None for all.
+
+        Returns:
+            List[Circle]: Up to k circles from the smallest up.
+        """
+        if k <= 0:
+            return []
+        runs = [
+            zip(column.radii[:k], column.circles[:k]) for column in self._matching(kind)
+        ]
+        merged = heapq.merge(*runs, key=_first)
+        return [circle for _, circle in islice(merged, k)]
+
+    def quantiles(
+        self,
+        qs: Sequence[float],
+        measure: str = "radius",
+        kind: Optional[type] = None,
+    ) -> List[float]:
+        """
+        Returns quantiles of a measure, interpolating linearly between the closest
+        ranks. A quantile of a single class is read from its sorted array directly.
+
+        Parameters:
+            qs (Sequence[float]): The quantiles between 0 and 1, e.g. 0.5 for the
+             median.
+            measure (str): "radius", "diameter" or "area".
+            kind (Optional[type]): The Circle subclass to query, None for all.
+
+        Returns:
+            List[float]: The value of every quantile.
+
+        Raises:
+            ValueError: If the measure is unknown, a quantile is outside 0 to 1 or no
+             circle matches.
+        """
+        _check_measure(measure)
+        columns = [column for column in self._matching(kind) if column.circles]
+        if len(columns) == 1:
+            values = columns[0].values(measure)
+        else:
+            values = array(
+                "d", heapq.merge(*(column.values(measure) for column in columns))
+            )
+        result = _quantiles(values, qs)
+        if measure == "diameter":
+            result = [2 * value for value in result]
+        return result
+
+    def quantiles_by_class(
+        self, qs: Sequence[float], measure: str = "radius"
+    ) -> Dict[type, List[float]]:
+        """
+        Returns quantiles of a measure for every class separately.
+
+        Parameters:
+            qs (Sequence[float]): The quantiles between 0 and 1.
+            measure (str): "radius", "diameter" or "area".
+
+        Returns:
+            Dict[type, List[float]]: The quantiles keyed by class.
+
+        Raises:
+            ValueError: If the measure is unknown or a quantile is outside 0 to 1.
+        """
+        _check_measure(measure)
+        result = {}
+        for circle_class, column in self._columns.items():
+            column.flush()
+            values = _quantiles(column.values(measure), qs)
+            if measure == "diameter":
+                values = [2 * value for value in values]
+            result[circle_class] = values
+        return result
@@ -0,0 +1,226 @@
+"""
+Module for converting rim diameters between millimeters and inches.
+
+This module defines the conversions used by `Rim`, `Wheel` and the fitment helpers.
+Diameters in inches are computed as whole hundredths of an inch ("centi-inches") from
+the exact value of the millimeter input, rounded half to even, so the result does not
+depend on floating point error in the division. Floating point arithmetic is only
+used where it is far enough from a rounding tie to give the same result. Diameters of
+the standard rim sizes are looked up in a precomputed table instead of being
+converted. Near ties the result can differ from rounding the float quotient with
+`round(mm / 25.4, 2)`: 4.191 mm is exactly 0.165 in and converts to 0.16 in, where
+the float quotient rounds to 0.17 in. Infinite, NaN and too large values are
+rejected with ValueError.
+
+A tyre fits a rim when its necessary rim size equals the rim diameter in inches
+rounded half to even to a whole number. `fits` is the single implementation of this
+rule and compares integers only.
+"""
+
+from __future__ import annotations
+from array import array
+import math
+from typing import Dict, Iterable, Union
+
+from circles.circle import Circle
+
+MM_PER_INCH = 25.4
+CENTI_INCHES_PER_MM = 100 / MM_PER_INCH
+STANDARD_RIM_SIZES = tuple(range(10, 31))
+
+
+def _round_half_even(numerator: int, denominator: int) -> int:
+    quotient, remainder = divmod(numerator, denominator)
+    twice = 2 * remainder
+    if twice > denominator or (twice == denominator and quotient & 1):
+        quotient += 1
+    return quotient
+
+
+def _validate(mm_value: Union[int, float]) -> None:
+    Circle.validate_data(mm_value)
+    try:
+        finite = math.isfinite(mm_value)
+    except OverflowError:
+        finite = False
+    if not finite:
+        raise ValueError("The data must be a finite number")
+
+
+def _centi_inches(mm_value: Union[int, float]) -> int:
+    scaled = mm_value * CENTI_INCHES_PER_MM
+    centi_inches = round(scaled)
+    if scaled < 1e12 and abs(scaled - centi_inches) < 0.49:
+        # far enough from a tie for the floating point error not to matter
+        return centi_inches
+    # 100 / 25.4 == 500 / 127, applied to the exact value of mm_value
+    numerator, denominator = mm_value.as_integer_ratio()
+    return _round_half_even(500 * numerator, 127 * denominator)
+
+
+STANDARD_RIM_DIAMETERS: Dict[float, int] = {
+    round(size * MM_PER_INCH, 1): size for size in STANDARD_RIM_SIZES
+}
+_STANDARD_CENTI_INCHES: Dict[float, int] = {
+    diameter: _centi_inches(diameter) for diameter in STANDARD_RIM_DIAMETERS
+}
+
+
+def mm_to_centi_inches(mm_value: Union[int, float]) -> int:
+    """
+    Converts millimeters to whole hundredths of an inch.
+
+    Parameters:
+        mm_value (Union[int, float]): The value in millimeters to convert.
+
+    Returns:
+        int: The equivalent value in hundredths of an inch.
+
+    Raises:
+        ValueError: If mm_value is infinite, NaN or too large for a float.
+
+    Inherits all argument verification exceptions from Circle.
+    """
+    try:
+        centi_inches = _STANDARD_CENTI_INCHES.get(mm_value)
+    except TypeError:
+        centi_inches = None
+    if centi_inches is None:
+        _validate(mm_value)
+        centi_inches = _centi_inches(mm_value)
+    return centi_inches
+
+
+def mm_to_inches(mm_value: Union[int, float]) -> float:
+    """
+    Converts millimeters to inches rounded to two decimal places.
+
+    Parameters:
+        mm_value (Union[int, float]): The value in millimeters to convert.
+
+    Returns:
+        float: The equivalent value in inches.
+
+    Raises:
+        ValueError: If mm_value is infinite, NaN or too large for a float.
+
+    Inherits all argument verification exceptions from Circle.
+    """
+    return mm_to_centi_inches(mm_value) / 100
+
+
+def mm_to_rim_size(mm_value: Union[int, float]) -> int:
+    """
+    Converts a rim diameter in millimeters to its rim size in whole inches.
+
+    Parameters:
+        mm_value (Union[int, float]): The rim diameter in millimeters.
+
+    Returns:
+        int: The diameter in inches rounded half to even to a whole number.
+
+    Raises:
+        ValueError: If mm_value is infinite, NaN or too large for a float.
+
+    Inherits all argument verification exceptions from Circle.
+    """
+    return _round_half_even(mm_to_centi_inches(mm_value), 100)
+
+
+def inches_to_rim_size(diameter_inches: Union[int, float]) -> int:
+    """
+    Converts a rim diameter in inches to its rim size in whole inches.
+
+    Parameters:
+        diameter_inches (Union[int, float]): The rim diameter in inches.
+
+    Returns:
+        int: The diameter rounded half to even to a whole number.
+    """
+    return round(diameter_inches)
+
+
+def fits(necessary_rim_size: int, diameter_inches: Union[int, float]) -> bool:
+    """
+    Checks if a tyre fits a rim.
+
+    Parameters:
+        necessary_rim_size (int): The rim size the tyre requires, in inches.
+        diameter_inches (Union[int, float]): The rim diameter in inches.
+
+    Returns:
+        bool: True if the rim diameter rounds to the necessary rim size.
+    """
+    return necessary_rim_size == round(diameter_inches)
+
+
+def mm_to_centi_inches_array(mm_values: Iterable[Union[int, float]]) -> array:
+    """
+    Converts many millimeter values to whole hundredths of an inch. Every distinct
+    value is verified and converted once.
+
+    Parameters:
+        mm_values (Iterable[Union[int, float]]): The values in millimeters.
+
+    Returns:
+        array: The equivalent values in hundredths of an inch, typecode "q".
+
+    Raises:
+        ValueError: If a value is infinite, NaN or too large for a float.
+
+    Inherits all argument verification exceptions from Circle.
+    """
+    lookup = dict(_STANDARD_CENTI_INCHES)
+    result = array("q")
+    append = result.append
+    for mm_value in mm_values:
+        centi_inches = lookup.get(mm_value)
+        if centi_inches is None:
+            _validate(mm_value)
+            centi_inches = lookup[mm_value] = _centi_inches(mm_value)
+        append(centi_inches)
+    return result
+
+
+def mm_to_inches_array(mm_values: Iterable[Union[int, float]]) -> array:
+    """
+    Converts many millimeter values to inches rounded to two decimal places.
+
+    Parameters:
+        mm_values (Iterable[Union[int, float]]): The values in millimeters.
+
+    Returns:
+        array: The equivalent values in inches, typecode "d".
+
+    Raises:
+        ValueError: If a value is infinite, NaN or too large for a float.
+
+    Inherits all argument verification exceptions from Circle.
+    """
+    centi_inches = mm_to_centi_inches_array(mm_values)
+    return array("d", [value / 100 for value in centi_inches])
+
+
+def mm_to_rim_sizes(mm_values: Iterable[Union[int, float]]) -> array:
+    """
+    Converts many rim diameters in millimeters to rim sizes in whole inches.
+
+    Parameters:
+        mm_values (Iterable[Union[int, float]]): The rim diameters in millimeters.
+
+    Returns:
+        array: The rim sizes in inches, typecode "q".
+
+    Raises:
+        ValueError: If a value is infinite, NaN or too large for a float.
+
+    Inherits all argument verification exceptions from Circle.
+    """
+    sizes: Dict[int, int] = {}
+    result = array("q")
+    for centi_inches in mm_to_centi_inches_array(mm_values):
+        size = sizes.get(centi_inches)
+        if size is None:
+            size = sizes[centi_inches] = _round_half_even(centi_inches, 100)
+        result.append(size)
+    return result
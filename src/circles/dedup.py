@@ -0,0 +1,70 @@
+"""
+Module for removing duplicate circles from merged catalogues.
+
+This module defines `dedupe`, which keeps the first circle of every spec,
+`group_by_spec`, which collects the circles of every spec, and `count_by_spec`. They
+compute the `spec_key` of every circle once and look it up in a dict, so they run in
+linear time instead of comparing every pair of circles.
+"""
+
+from __future__ import annotations
+from collections import Counter
+from operator import methodcaller
+from typing import Dict, Hashable, Iterable, List
+
+from circles.circle import Circle
+
+_spec_key = methodcaller("spec_key")
+
+
+def dedupe(circles: Iterable[Circle]) -> List[Circle]:
+    """
+    Removes circles with the same spec as an earlier circle.
+
+    Parameters:
+        circles (Iterable[Circle]): The circles to deduplicate.
+
+    Returns:
+        List[Circle]: The first circle of every spec, in input order.
+    """
+    first: Dict[Hashable, Circle] = {}
+    setdefault = first.setdefault
+    for circle in circles:
+        setdefault(circle.spec_key(), circle)
+    return list(first.values())
+
+
+def group_by_spec(circles: Iterable[Circle]) -> Dict[Hashable, List[Circle]]:
+    """
+    Groups circles by spec.
+
+    Parameters:
+        circles (Iterable[Circle]): The circles to group.
+
+    Returns:
+        Dict[Hashable, List[Circle]]: The circles of every spec key in input order,
+         with the keys in order of first appearance.
+    """
+    groups: Dict[Hashable, List[Circle]] = {}
+    for circle in circles:
+        key = circle.spec_key()
+        group = groups.get(key)
+        if group is None:
+            groups[key] = [circle]
+        else:
+            group.append(circle)
+    return groups
+
+
+def count_by_spec(circles: Iterable[Circle]) -> Dict[Hashable, int]:
+    """
+    Counts the circles of every spec.
+
+    Parameters:
+        circles (Iterable[Circle]): The circles to count.
+
+    Returns:
+        Dict[Hashable, int]: The number of circles of every spec key, with the keys
+         in order of first appearance.
+    """
+    return dict(Counter(map(_spec_key, circles)))
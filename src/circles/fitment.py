@@ -0,0 +1,151 @@
+"""
+Module for matching tyres and rims without constructing trial wheels.
+
+This module defines the `FitmentIndex` class, which buckets `Rim` and `Tyre` objects by
+their rim size in inches. A tyre fits a rim when the tyre's necessary rim size equals the
+rim's diameter in inches rounded to a whole number, the same rule `Wheel` uses, so both
+lookup directions are a single dictionary access. `rims_for` and `tyres_for` return a
+copy of the matching bucket, which costs time proportional to its size;
+`iter_rims_for` and `iter_tyres_for` iterate over the bucket without copying it.
+"""
+
+from __future__ import annotations
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from circles.conversion import inches_to_rim_size
+from circles.rim import Rim
+from circles.tyre import Tyre
+
+
+def rim_inch_size(rim: Rim) -> int:
+    """
+    Returns the rim size used for fitment, the rim diameter in whole inches.
+
+    Parameters:
+        rim (Rim): The rim to measure.
+
+    Returns:
+        int: The rim diameter in inches rounded to a whole number.
+    """
+    return inches_to_rim_size(rim.diameter_inches)
+
+
+class FitmentIndex:
+    """
+    An index of tyres and rims bucketed by rim size in inches.
+
+    Attributes:
+        rims_by_size (Dict[int, List[Rim]]): The rims grouped by their size in inches.
+        tyres_by_size (Dict[int, List[Tyre]]): The tyres grouped by their necessary rim size.
+    """
+
+    def __init__(self, rims: Iterable[Rim] = (), tyres: Iterable[Tyre] = ()) -> None:
+        """
+        Initializes a FitmentIndex.
+
+        Parameters:
+            rims (Iterable[Rim]): The rims to index.
+            tyres (Iterable[Tyre]): The tyres to index.
+
+        Raises:
+            TypeError: If a rim or a tyre is of the wrong type.
+        """
+        self.rims_by_size: Dict[int, List[Rim]] = {}
+        self.tyres_by_size: Dict[int, List[Tyre]] = {}
+        for rim in rims:
+            self.add_rim(rim)
+        for tyre in tyres:
+            self.add_tyre(tyre)
+
+    def add_rim(self, rim: Rim) -> None:
+        """
+        Adds a rim to the index.
+
+        Parameters:
+            rim (Rim): The rim to add.
+
+        Raises:
+            TypeError: If the provided object is not a rim.
+        """
+        if not isinstance(rim, Rim):
+            raise TypeError("Provided object must be a rim")
+        self.rims_by_size.setdefault(rim_inch_size(rim), []).append(rim)
+
+    def add_tyre(self, tyre: Tyre) -> None:
+        """
+        Adds a tyre to the index.
+
+        Parameters:
+            tyre (Tyre): The tyre to add.
+
+        Raises:
+            TypeError: If the provided object is not a tyre.
+        """
+        if not isinstance(tyre, Tyre):
+            raise TypeError("Provided object must be a tyre")
+        self.tyres_by_size.setdefault(tyre.necessary_rim_size, []).append(tyre)
+
+    def rims_for(self, tyre: Tyre) -> List[Rim]:
+        """
+        Returns all indexed rims the tyre fits, as a new list the caller may change.
+
+        Parameters:
+            tyre (Tyre): The tyre to match.
+
+        Returns:
+            List[Rim]: The matching rims.
+        """
+        return list(self.rims_by_size.get(tyre.necessary_rim_size, ()))
+
+    def iter_rims_for(self, tyre: Tyre) -> Iterator[Rim]:
+        """
+        Iterates over the indexed rims the tyre fits without copying them. The index
+        must not be changed during the iteration.
+
+        Parameters:
+            tyre (Tyre): The tyre to match.
+
+        Returns:
+            Iterator[Rim]: The matching rims.
+        """
+        return iter(self.rims_by_size.get(tyre.necessary_rim_size, ()))
+
+    def tyres_for(self, rim: Rim) -> List[Tyre]:
+        """
+        Returns all indexed tyres that fit the rim, as a new list the caller may
+        change.
+
+        Parameters:
+            rim (Rim): The rim to match.
+
+        Returns:
+            List[Tyre]: The matching tyres.
+        """
+        return list(self.tyres_by_size.get(rim_inch_size(rim), ()))
+
+    def iter_tyres_for(self, rim: Rim) -> Iterator[Tyre]:
+        """
+        Iterates over the indexed tyres that fit the rim without copying them. The
+        index must not be changed during the iteration.
+
+        Parameters:
+            rim (Rim): The rim to match.
+
+        Returns:
+            Iterator[Tyre]: The matching tyres.
+        """
+        return iter(self.tyres_by_size.get(rim_inch_size(rim), ()))
+
+    def pairs(self) -> Iterator[Tuple[Tyre, Rim]]:
+        """
+        Generates every compatible (tyre, rim) pair in the index.
+
+        Returns:
+            Iterator[Tuple[Tyre, Rim]]: The compatible pairs, grouped by rim size.
+        """
+        for size, tyres in self.tyres_by_size.items():
+            rims = self.rims_by_size.get(size)
+            if rims:
+                for tyre in tyres:
+                    for rim in rims:
+                        yield tyre, rim
@@ -0,0 +1,349 @@
+"""
+Module for computing the full tyre x rim fitment matrix as a sparse file on disk.
+
+This module defines `write_fitment_matrix`, which writes the compatibility of every tyre
+with every rim in compressed sparse row (CSR) form: row i lists the rim indexes the
+i-th tyre fits, in increasing order. The rims are sorted by rim size once, so the rims
+of each size form one contiguous run, and the row of a tyre is a copy of the run of its
+necessary rim size. The row offsets are computed in the calling process; the rows
+themselves are written by worker processes, each into its own slice of the preallocated
+file. Memory use depends on the number of tyres and rims, not on the number of
+compatible pairs. `load_fitment_matrix` memory-maps a written file and checks that the
+row offsets are in order, so every row lies within the stored entries.
+
+File format (all values little-endian):
+
+    Header, 32 bytes:
+        magic       8 bytes   b"CIRCFIT1"
+        tyres       uint64    number of rows
+        rims        uint64    number of columns
+        entries     uint64    number of compatible pairs
+
+    Columns follow, each padded with zeros to a multiple of 8 bytes:
+        indptr:     int64 x (tyres + 1), row i spans entries indptr[i] to indptr[i + 1]
+        indices:    uint32 x entries, the rim indexes of every row
+"""
+
+from __future__ import annotations
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate, islice, repeat
+import mmap
+import operator
+import os
+import struct
+import sys
+from typing import Dict, Iterable, Iterator, Optional, Sequence, Tuple
+
+from circles.fitment import rim_inch_size
+from circles.rim import Rim
+from circles.tyre import Tyre
+
+MAGIC = b"CIRCFIT1"
+HEADER = struct.Struct("<8s3Q")
+MAX_RIMS = 2**32 - 1
+WRITE_BUFFER = 1 << 20
+
+Runs = Dict[int, Tuple[int, int]]
+
+_worker_runs: Runs = {}
+_worker_order = b""
+
+
+def _sort_rims(rim_sizes: Sequence[int]) -> Tuple[array, Runs]:
+    """
+    Sorts the rim indexes by rim size. Returns the sorted indexes and the (start, stop)
+    run of every rim size in them.
+    """
+    order = array("I", sorted(range(len(rim_sizes)), key=rim_sizes.__getitem__))
+    sizes = [rim_sizes[index] for index in order]
+    runs: Runs = {}
+    for size in set(sizes):
+        runs[size] = (bisect_left(sizes, size), bisect_right(sizes, size))
+    return order, runs
+
+
+def _write_rows(
+    path: str, offset: int, tyre_sizes: Sequence[int], runs: Runs, order: bytes
+) -> int:
+    """
+    Writes the rows of a chunk of tyres starting at a byte offset of the file and
+    returns the number of entries written.
+    """
+    view = memoryview(order)
+    entries = 0
+    with open(path, "r+b", buffering=WRITE_BUFFER) as file:
+        file.seek(offset)
+        for size in tyre_sizes:
+            run = runs.get(size)
+            if run is not None:
+                start, stop = run
+                file.write(view[4 * start : 4 * stop])
+                entries += stop - start
+    return entries
+
+
+def _init_worker(runs: Runs, order: bytes) -> None:
+    global _worker_runs, _worker_order
+    _worker_runs = runs
+    _worker_order = order
+
+
+def _write_chunk(path: str, offset: int, tyre_sizes: array) -> int:
+    return _write_rows(path, offset, tyre_sizes, _worker_runs, _worker_order)
+
+
+def write_fitment_matrix_columns(
+    path: str,
+    tyre_sizes: Sequence[int],
+    rim_sizes: Sequence[int],
+    chunk_size: int = 10_000,
+    max_workers: Optional[int] = None,
+) -> int:
+    """
+    Writes the fitment matrix of tyres and rims given by their rim sizes, for example
+    the columns of a memory-mapped catalogue.
+
+    Parameters:
+        path (str): The path of the file to write.
+        tyre_sizes (Sequence[int]): The necessary rim size of every tyre in inches.
+        rim_sizes (Sequence[int]): The size of every rim in whole inches.
+        chunk_size (int): The number of tyre rows sent to a worker at once.
+        max_workers (Optional[int]): The number of worker processes, by default the
+         number of CPUs. With 1 the rows are written by the calling process.
+
+    Returns:
+        int: The number of compatible pairs.
+
+    Raises:
+        TypeError: If a size is not an int.
+        ValueError: If chunk_size or max_workers is not greater than zero or there
+         are more than MAX_RIMS rims.
+    """
+    if chunk_size <= 0:
+        raise ValueError("The chunk size must be greater than zero")
+    if max_workers is not None and max_workers <= 0:
+        raise ValueError("The number of workers must be greater than zero")
+    if len(rim_sizes) > MAX_RIMS:
+        raise ValueError(f"A fitment matrix can index at most {MAX_RIMS} rims")
+    # convert before the file is opened, so invalid sizes leave no partial file
+    tyre_sizes = array("q", tyre_sizes)
+    rim_sizes = array("q", rim_sizes)
+    order, runs = _sort_rims(rim_sizes)
+    counts = {size: stop - start for size, (start, stop) in runs.items()}
+    indptr = array("q", accumulate(map(counts.get, tyre_sizes, repeat(0)), initial=0))
+    entries = indptr[-1]
+    rows = len(indptr) - 1
+    if sys.byteorder != "little":
+        order.byteswap()
+        indptr.byteswap()
+    indices_offset = HEADER.size + 8 * len(indptr)
+    with open(path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, rows, len(rim_sizes), entries))
+        file.write(indptr.tobytes())
+        file.truncate(indices_offset + 4 * entries + (-4 * entries % 8))
+    if sys.byteorder != "little":
+        indptr.byteswap()
+    order_bytes = order.tobytes()
+    del order
+
+    def chunks() -> Iterator[Tuple[int, array]]:
+        for start in range(0, rows, chunk_size):
+            sizes = tyre_sizes[start : start + chunk_size]
+            yield indices_offset + 4 * indptr[start], sizes
+
+    if max_workers == 1:
+        for offset, sizes in chunks():
+            _write_rows(path, offset, sizes, runs, order_bytes)
+        return entries
+
+    window = 2 * (max_workers or os.cpu_count() or 1)
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_worker,
+        initargs=(runs, order_bytes),
+    ) as executor:
+        pending: deque = deque()
+        for offset, sizes in chunks():
+            pending.append(executor.submit(_write_chunk, path, offset, sizes))
+            if len(pending) >= window:
+                pending.popleft().result()
+        while pending:
+            pending.popleft().result()
+    return entries
+
+
+def write_fitment_matrix(
+    path: str,
+    tyres: Iterable[Tyre],
+    rims: Iterable[Rim],
+    chunk_size: int = 10_000,
+    max_workers: Optional[int] = None,
+) -> int:
+    """
+    Writes the fitment matrix of tyres and rims, using the same rule as
+    `Wheel.verify_rim_size`. Row i of the matrix belongs to the i-th tyre and the
+    column indexes are the positions of the rims.
+
+    Parameters:
+        path (str): The path of the file to write.
+        tyres (Iterable[Tyre]): The tyres, one row each.
+        rims (Iterable[Rim]): The rims, one column each.
+        chunk_size (int): The number of tyre rows sent to a worker at once.
+        max_workers (Optional[int]): The number of worker processes, by default the
+         number of CPUs. With 1 the rows are written by the calling process.
+
+    Returns:
+        int: The number of compatible pairs.
+
+    Raises:
+        TypeError: If a tyre or a rim is of the wrong type.
+        ValueError: If chunk_size or max_workers is not greater than zero or there
+         are more than MAX_RIMS rims.
+    """
+    tyre_sizes = array("q")
+    for tyre in tyres:
+        if not isinstance(tyre, Tyre):
+            raise TypeError("Provided object must be a tyre")
+        tyre_sizes.append(tyre.necessary_rim_size)
+    rim_sizes = array("q")
+    for rim in rims:
+        if not isinstance(rim, Rim):
+            raise TypeError("Provided object must be a rim")
+        rim_sizes.append(rim_inch_size(rim))
+    return write_fitment_matrix_columns(
+        path, tyre_sizes, rim_sizes, chunk_size, max_workers
+    )
+
+
+class FitmentMatrix:
+    """
+    A memory-mapped fitment matrix opened with `load_fitment_matrix`.
+
+    Attributes:
+        shape (Tuple[int, int]): The number of tyres and rims.
+        indptr (memoryview): The row offsets, int64.
+        indices (memoryview): The rim indexes of all rows, uint32.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Memory-maps a fitment matrix file.
+
+        Parameters:
+            path (str): The path of the fitment matrix file.
+
+        Raises:
+            ValueError: If the file is not a fitment matrix, is truncated or its row
+             offsets are out of order.
+        """
+        if sys.byteorder != "little":
+            raise ValueError("Fitment files can only be mapped on little-endian hosts")
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+        try:
+            magic, tyres, rims, entries = HEADER.unpack_from(self._view)
+            if magic != MAGIC:
+                raise ValueError("The file is not a fitment matrix")
+            indptr_end = HEADER.size + 8 * (tyres + 1)
+            indices_end = indptr_end + 4 * entries
+            if indices_end > len(self._view):
+                raise ValueError("The fitment matrix file is truncated")
+            self.shape = (tyres, rims)
+            self.indptr = self._view[HEADER.size : indptr_end].cast("q")
+            self.indices = self._view[indptr_end:indices_end].cast("I")
+            indptr = self.indptr
+            if (
+                indptr[0] != 0
+                or indptr[-1] != entries
+                or any(map(operator.gt, indptr, islice(indptr, 1, None)))
+            ):
+                raise ValueError("The fitment matrix file is corrupt")
+        except (ValueError, struct.error):
+            self.close()
+            raise ValueError("The file is not a valid fitment matrix") from None
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    @property
+    def entries(self) -> int:
+        """
+        Returns the number of compatible pairs.
+
+        Returns:
+            int: The number of stored entries.
+        """
+        return len(self.indices)
+
+    def rims_for(self, tyre_row: int) -> memoryview:
+        """
+        Returns the rims a tyre fits.
+
+        Parameters:
+            tyre_row (int): The tyre row.
+
+        Returns:
+            memoryview: The rim indexes in increasing order.
+        """
+        return self.indices[self.indptr[tyre_row] : self.indptr[tyre_row + 1]]
+
+    def count(self, tyre_row: int) -> int:
+        """
+        Returns the number of rims a tyre fits.
+
+        Parameters:
+            tyre_row (int): The tyre row.
+
+        Returns:
+            int: The number of compatible rims.
+        """
+        return self.indptr[tyre_row + 1] - self.indptr[tyre_row]
+
+    def pairs(self) -> Iterator[Tuple[int, int]]:
+        """
+        Generates every compatible (tyre row, rim index) pair.
+
+        Returns:
+            Iterator[Tuple[int, int]]: The pairs in row order.
+        """
+        for tyre_row in range(len(self)):
+            for rim_index in self.rims_for(tyre_row):
+                yield tyre_row, rim_index
+
+    def close(self) -> None:
+        """
+        Releases the columns and unmaps the file.
+        """
+        for name in ("indptr", "indices"):
+            column = getattr(self, name, None)
+            if column is not None:
+                column.release()
+        self._view.release()
+        self._mmap.close()
+
+    def __enter__(self) -> FitmentMatrix:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def load_fitment_matrix(path: str) -> FitmentMatrix:
+    """
+    Memory-maps a fitment matrix file written by `write_fitment_matrix`.
+
+    Parameters:
+        path (str): The path of the fitment matrix file.
+
+    Returns:
+        FitmentMatrix: The mapped matrix.
+
+    Raises:
+        ValueError: If the file is not a fitment matrix, is truncated or its row
+         offsets are out of order.
+    """
+    return FitmentMatrix(path)
@@ -0,0 +1,174 @@
+"""
+Module for opt-in instrumentation of the hot paths of the circles package.
+
+Instrumentation is disabled by default and costs nothing while off: `enable` replaces
+the instrumented methods with counting wrappers and `disable` puts the original
+methods back. While enabled, every instrumented function keeps its number of calls,
+its number of calls that raised an exception and its cumulative time. Times are
+inclusive, so a constructor's time contains the validation it performs.
+
+Example:
+    with instrumented():
+        Wheel(Tyre(800, "235/19R19"), Rim(241.3))
+    print(snapshot()["Wheel.__init__"].calls)
+"""
+
+from __future__ import annotations
+from contextlib import contextmanager
+import functools
+import time
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from circles.circle import Circle
+from circles.pizza import Pizza
+from circles.rim import Rim
+from circles.tyre import Tyre
+from circles.wheel import Wheel
+
+TARGETS: Tuple[Tuple[type, str], ...] = (
+    (Circle, "validate_data"),
+    (Rim, "mm_to_inches"),
+    (Wheel, "verify_rim_size"),
+    (Rim, "__init__"),
+    (Tyre, "__init__"),
+    (Pizza, "__init__"),
+    (Wheel, "__init__"),
+)
+
+
+class CallStats(NamedTuple):
+    """
+    Counters of an instrumented function.
+
+    Attributes:
+        calls (int): The number of calls.
+        failures (int): The number of calls that raised an exception.
+        total_time (float): The cumulative time spent in the function, in seconds.
+    """
+
+    calls: int
+    failures: int
+    total_time: float
+
+
+_records: Dict[str, List[int]] = {
+    f"{owner.__name__}.{attribute}": [0, 0, 0] for owner, attribute in TARGETS
+}
+_originals: Dict[Tuple[type, str], object] = {}
+_exporter: Optional[Callable[[Dict[str, CallStats]], None]] = None
+
+
+def _wrap(function: Callable, record: List[int]) -> Callable:
+    clock = time.perf_counter_ns
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        start = clock()
+        try:
+            return function(*args, **kwargs)
+        except BaseException:
+            record[1] += 1
+            raise
+        finally:
+            record[0] += 1
+            record[2] += clock() - start
+
+    return wrapper
+
+
+def enable() -> None:
+    """
+    Starts counting calls of the instrumented functions. Counters are kept from
+    previous sessions until `reset` is called.
+    """
+    if _originals:
+        return
+    for owner, attribute in TARGETS:
+        original = owner.__dict__[attribute]
+        record = _records[f"{owner.__name__}.{attribute}"]
+        _originals[owner, attribute] = original
+        if isinstance(original, staticmethod):
+            setattr(owner, attribute, staticmethod(_wrap(original.__func__, record)))
+        else:
+            setattr(owner, attribute, _wrap(original, record))
+
+
+def disable() -> None:
+    """
+    Stops counting and restores the original functions.
+    """
+    for (owner, attribute), original in _originals.items():
+        setattr(owner, attribute, original)
+    _originals.clear()
+
+
+def is_enabled() -> bool:
+    """
+    Returns True if instrumentation is enabled.
+    """
+    return bool(_originals)
+
+
+@contextmanager
+def instrumented() -> Iterator[None]:
+    """
+    Enables instrumentation for the duration of a with block.
+    """
+    was_enabled = is_enabled()
+    enable()
+    try:
+        yield
+    finally:
+        if not was_enabled:
+            disable()
+
+
+def snapshot() -> Dict[str, CallStats]:
+    """
+    Returns the current counters.
+
+    Returns:
+        Dict[str, CallStats]: The counters keyed by "Class.function".
+    """
+    return {
+        name: CallStats(calls, failures, elapsed / 1e9)
+        for name, (calls, failures, elapsed) in _records.items()
+    }
+
+
+def reset() -> None:
+    """
+    Sets every counter back to zero.
+    """
+    for record in _records.values():
+        record[:] = [0, 0, 0]
+
+
+def set_exporter(exporter: Optional[Callable[[Dict[str, CallStats]], None]]) -> None:
+    """
+    Sets the hook called by `export`, or removes it when None is given.
+
+    Parameters:
+        exporter (Optional[Callable[[Dict[str, CallStats]], None]]): A function
+         receiving a snapshot of the counters.
+    """
+    global _exporter
+    _exporter = exporter
+
+
+def export(reset_counters: bool = False) -> Dict[str, CallStats]:
+    """
+    Passes a snapshot of the counters to the exporter hook.
+
+    Parameters:
+        reset_counters (bool): Whether to reset the counters after exporting.
+
+    Returns:
+        Dict[str, CallStats]: The exported snapshot.
+    """
+    stats = snapshot()
+    if _exporter is not None:
+        _exporter(stats)
+    if reset_counters:
+        reset()
+    return stats
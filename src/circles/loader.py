@@ -0,0 +1,143 @@
+"""
+Module for streaming circle-like objects from catalogue files.
+
+This module defines generator functions that read CSV or JSONL catalogues one row at a
+time and yield `Tyre`, `Rim` and `Pizza` objects built with their `create_from_diameter`
+class methods, so memory use does not grow with the size of the file.
+
+Every row has a "type" field ("tyre", "rim" or "pizza") and a "diameter" field. Tyre rows
+also have a "tyre_label" field and pizza rows may have an "ingredients" field, a list in
+JSONL files and a ";"-separated string in CSV files. Invalid rows are reported to an
+optional callback as `LoadError` records instead of aborting the load.
+"""
+
+from __future__ import annotations
+import csv
+import json
+import math
+from typing import Callable, Iterable, Iterator, NamedTuple, Optional, Union
+
+from circles.circle import Circle
+from circles.pizza import Pizza
+from circles.rim import Rim
+from circles.tyre import Tyre, parse_tyre_label
+
+
+class LoadError(NamedTuple):
+    """
+    A catalogue row that could not be loaded.
+
+    Attributes:
+        line (int): The line number of the row in the file, starting at 1.
+        row (object): The raw row as read from the file.
+        reason (str): The reason the row was rejected.
+    """
+
+    line: int
+    row: object
+    reason: str
+
+
+ErrorCallback = Optional[Callable[[LoadError], None]]
+
+
+def _number(value: Union[str, int, float]) -> Union[int, float]:
+    if isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError:
+            value = float(value)
+    if isinstance(value, float) and not math.isfinite(value):
+        raise ValueError("The diameter must be a finite number")
+    return value
+
+
+def build_object(row: dict) -> Circle:
+    """
+    Builds a circle-like object from a catalogue row without printing.
+
+    Parameters:
+        row (dict): The row fields.
+
+    Returns:
+        Circle: A Tyre, Rim or Pizza instance.
+
+    Raises:
+        ValueError: If a field is missing or has an invalid value, such as a diameter
+         that is infinite or not a number.
+        TypeError: If a field has the wrong type.
+        ArithmeticError: If the diameter is too large to convert.
+    """
+    kind = row.get("type")
+    diameter = _number(row.get("diameter"))
+    Circle.validate_data(diameter)
+    if kind == "rim":
+        return Rim.create_from_diameter(diameter)
+    if kind == "tyre":
+        tyre_label = row.get("tyre_label")
+        parse_tyre_label(tyre_label)
+        return Tyre.create_from_diameter(diameter, tyre_label)
+    if kind == "pizza":
+        ingredients = row.get("ingredients") or []
+        if isinstance(ingredients, str):
+            ingredients = ingredients.split(";")
+        if not isinstance(ingredients, list):
+            raise TypeError("Ingredients value must be a list")
+        return Pizza.create_from_diameter(diameter, ingredients)
+    raise ValueError(f"Unknown object type: {kind!r}")
+
+
+def _build_rows(rows: Iterable[tuple], on_error: ErrorCallback) -> Iterator[Circle]:
+    for line, row in rows:
+        try:
+            yield build_object(row)
+        except (TypeError, ValueError, ArithmeticError) as error:
+            if on_error is not None:
+                on_error(LoadError(line, row, str(error) or type(error).__name__))
+
+
+def iter_csv(path: str, on_error: ErrorCallback = None) -> Iterator[Circle]:
+    """
+    Lazily yields the objects described in a CSV catalogue with a header row.
+
+    Parameters:
+        path (str): The path of the CSV file.
+        on_error (ErrorCallback): Called with a LoadError for every invalid row.
+
+    Returns:
+        Iterator[Circle]: The Tyre, Rim and Pizza objects in file order.
+    """
+    with open(path, newline="", encoding="utf-8") as file:
+        reader = csv.DictReader(file)
+        yield from _build_rows(((reader.line_num, row) for row in reader), on_error)
+
+
+def _jsonl_rows(file, on_error: ErrorCallback) -> Iterator[tuple]:
+    for line, text in enumerate(file, 1):
+        if not text.strip():
+            continue
+        try:
+            row = json.loads(text)
+        except json.JSONDecodeError as error:
+            if on_error is not None:
+                on_error(LoadError(line, text, str(error)))
+            continue
+        if isinstance(row, dict):
+            yield line, row
+        elif on_error is not None:
+            on_error(LoadError(line, row, "Row must be a JSON object"))
+
+
+def iter_jsonl(path: str, on_error: ErrorCallback = None) -> Iterator[Circle]:
+    """
+    Lazily yields the objects described in a JSONL catalogue, one JSON object per line.
+
+    Parameters:
+        path (str): The path of the JSONL file.
+        on_error (ErrorCallback): Called with a LoadError for every invalid row.
+
+    Returns:
+        Iterator[Circle]: The Tyre, Rim and Pizza objects in file order.
+    """
+    with open(path, encoding="utf-8") as file:
+        yield from _build_rows(_jsonl_rows(file, on_error), on_error)
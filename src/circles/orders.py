@@ -0,0 +1,156 @@
+"""
+Module for aggregating pizza orders.
+
+This module defines the `PizzaOrderAggregator` class, which keeps a running size
+histogram, the total dough area and the dough area per ingredient of a stream of
+pizzas. Pizzas can be added as `Pizza` objects or as raw radii and ingredient lists,
+so no object has to be created when only the aggregates are needed.
+"""
+
+from __future__ import annotations
+from bisect import bisect_left
+import math
+from typing import Dict, Iterable, Sequence, Tuple, Union
+
+from circles.circle import Circle
+from circles.pizza import (
+    PIZZA_SIZE_BREAKPOINTS,
+    PIZZA_SIZES,
+    Pizza,
+    validate_breakpoints,
+)
+
+
+class PizzaOrderAggregator:
+    """
+    Streaming aggregates of pizza orders.
+
+    Attributes:
+        breakpoints (Sequence[Union[int, float]]): The sorted upper radius limits of
+         every size but the last one, inclusive.
+        sizes (Sequence[str]): The size names, one more than the breakpoints.
+        count (int): The number of pizzas added.
+        total_area (float): The total dough area in square centimeters.
+        ingredient_area (Dict[str, float]): The dough area covered by each ingredient.
+         An ingredient listed more than once on a pizza counts once.
+    """
+
+    def __init__(
+        self,
+        breakpoints: Sequence[Union[int, float]] = PIZZA_SIZE_BREAKPOINTS,
+        sizes: Sequence[str] = PIZZA_SIZES,
+    ) -> None:
+        """
+        Initializes an empty aggregator.
+
+        Parameters:
+            breakpoints (Sequence[Union[int, float]]): The sorted upper radius limits of
+             every size but the last one, inclusive.
+            sizes (Sequence[str]): The size names, one more than the breakpoints.
+
+        Raises:
+            ValueError: If the breakpoints or sizes are invalid.
+        """
+        validate_breakpoints(breakpoints, sizes)
+        self.breakpoints = tuple(breakpoints)
+        self.sizes = tuple(sizes)
+        self.count = 0
+        self.total_area = 0.0
+        self.ingredient_area: Dict[str, float] = {}
+        self._size_counts = [0] * len(self.sizes)
+
+    @property
+    def histogram(self) -> Dict[str, int]:
+        """
+        Returns the number of pizzas of every size.
+
+        Returns:
+            Dict[str, int]: The counts keyed by size name.
+        """
+        return dict(zip(self.sizes, self._size_counts))
+
+    def add_raw(
+        self, radius: Union[int, float], ingredients: Iterable[str] = ()
+    ) -> None:
+        """
+        Adds a pizza given by its radius and ingredients.
+
+        Parameters:
+            radius (Union[int, float]): The radius of the pizza in centimeters.
+            ingredients (Iterable[str]): The ingredients of the pizza. Repeated
+             ingredients count once.
+
+        Raises:
+            TypeError: If ingredients is a string instead of an iterable of strings.
+
+        Inherits all argument verification exceptions from Circle.
+        """
+        Circle.validate_data(radius)
+        if isinstance(ingredients, str):
+            raise TypeError("Ingredients must be an iterable of strings, not a string")
+        ingredients = dict.fromkeys(ingredients)
+        area = math.pi * radius * radius
+        self.count += 1
+        self.total_area += area
+        self._size_counts[bisect_left(self.breakpoints, radius)] += 1
+        ingredient_area = self.ingredient_area
+        for ingredient in ingredients:
+            ingredient_area[ingredient] = ingredient_area.get(ingredient, 0.0) + area
+
+    def add(self, pizza: Pizza) -> None:
+        """
+        Adds a Pizza object.
+
+        Parameters:
+            pizza (Pizza): The pizza to add.
+
+        Raises:
+            TypeError: If the provided object is not a pizza.
+        """
+        if not isinstance(pizza, Pizza):
+            raise TypeError("Provided object must be a pizza")
+        self.add_raw(pizza.get_radius(), pizza.ingredients)
+
+    def add_many(self, pizzas: Iterable[Pizza]) -> None:
+        """
+        Adds many Pizza objects.
+
+        Parameters:
+            pizzas (Iterable[Pizza]): The pizzas to add.
+        """
+        for pizza in pizzas:
+            self.add(pizza)
+
+    def add_many_raw(
+        self, rows: Iterable[Tuple[Union[int, float], Iterable[str]]]
+    ) -> None:
+        """
+        Adds many pizzas given as (radius, ingredients) rows.
+
+        Parameters:
+            rows (Iterable[Tuple[Union[int, float], Iterable[str]]]): The pizzas to add.
+        """
+        for radius, ingredients in rows:
+            self.add_raw(radius, ingredients)
+
+
+def aggregate_pizzas(
+    pizzas: Iterable[Pizza],
+    breakpoints: Sequence[Union[int, float]] = PIZZA_SIZE_BREAKPOINTS,
+    sizes: Sequence[str] = PIZZA_SIZES,
+) -> PizzaOrderAggregator:
+    """
+    Aggregates a stream of Pizza objects.
+
+    Parameters:
+        pizzas (Iterable[Pizza]): The pizzas to aggregate.
+        breakpoints (Sequence[Union[int, float]]): The sorted upper radius limits of
+         every size but the last one, inclusive.
+        sizes (Sequence[str]): The size names, one more than the breakpoints.
+
+    Returns:
+        PizzaOrderAggregator: The aggregator holding the results.
+    """
+    aggregator = PizzaOrderAggregator(breakpoints, sizes)
+    aggregator.add_many(pizzas)
+    return aggregator
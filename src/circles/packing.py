@@ -0,0 +1,386 @@
+"""
+Module for packing pizzas and other circle-like objects onto rectangular trays.
+
+This module defines `pack_tray`, which places as many circles as it can on one tray,
+and `pack_trays`, which spreads a whole order over as many trays as needed. Placed
+circles are kept in a `SpatialHash` grid, so finding the neighbours of a position
+only looks at a few grid cells instead of every placed circle.
+
+The greedy pass takes the circles from the largest to the smallest and sweeps them
+across the tray in rows. Each circle is dropped towards the bottom edge until it rests
+on the circles below it; once a circle does not fit, the pass moves on to circles at
+most RETRY_RATIO times its radius. The improvement pass then takes the circles the
+greedy pass could not place from the smallest up, tries each at evenly spaced
+positions across the tray and keeps the lowest position where it fits, stopping at
+the first circle that fits nowhere. Circles are grouped by radius, so both passes
+spend their time on distinct radii rather than on every circle left. Radii and tray
+dimensions use the same unit.
+"""
+
+from __future__ import annotations
+import math
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Tuple
+
+from circles.circle import Circle
+
+RETRY_RATIO = 0.9
+
+
+class Placement(NamedTuple):
+    """
+    A circle placed on a tray.
+
+    Attributes:
+        circle (Circle): The placed object.
+        x (float): The x coordinate of its centre.
+        y (float): The y coordinate of its centre.
+    """
+
+    circle: Circle
+    x: float
+    y: float
+
+
+class TrayPacking(NamedTuple):
+    """
+    The contents of a packed tray.
+
+    Attributes:
+        width (float): The tray width.
+        height (float): The tray height.
+        placements (List[Placement]): The placed circles.
+        unplaced (List[Circle]): The circles that did not fit.
+    """
+
+    width: float
+    height: float
+    placements: List[Placement]
+    unplaced: List[Circle]
+
+    @property
+    def utilisation(self) -> float:
+        """
+        Returns the share of the tray area covered by the placed circles.
+
+        Returns:
+            float: The covered area divided by the tray area.
+        """
+        covered = sum(placement.circle.get_area() for placement in self.placements)
+        return covered / (self.width * self.height)
+
+
+class TrayPlan(NamedTuple):
+    """
+    An order spread over several trays.
+
+    Attributes:
+        trays (List[TrayPacking]): The packed trays.
+        oversized (List[Circle]): The circles too large for an empty tray.
+    """
+
+    trays: List[TrayPacking]
+    oversized: List[Circle]
+
+
+class SpatialHash:
+    """
+    A uniform grid of placed circles for fast neighbour lookups.
+
+    Attributes:
+        cell_size (float): The side of a grid cell.
+    """
+
+    def __init__(self, cell_size: float) -> None:
+        """
+        Initializes an empty grid.
+
+        Parameters:
+            cell_size (float): The side of a grid cell.
+
+        Raises:
+            ValueError: If the cell size is not greater than zero.
+        """
+        if cell_size <= 0:
+            raise ValueError("The cell size must be greater than zero")
+        self.cell_size = cell_size
+        self._cells: Dict[Tuple[int, int], List[Tuple[float, float, float]]] = {}
+        self._top_rows: Dict[int, int] = {}
+
+    def add(self, x: float, y: float, radius: float) -> None:
+        """
+        Adds a circle to the grid.
+
+        Parameters:
+            x (float): The x coordinate of the centre.
+            y (float): The y coordinate of the centre.
+            radius (float): The radius.
+        """
+        cell_x = int(x // self.cell_size)
+        cell_y = int(y // self.cell_size)
+        self._cells.setdefault((cell_x, cell_y), []).append((x, y, radius))
+        if cell_y > self._top_rows.get(cell_x, -1):
+            self._top_rows[cell_x] = cell_y
+
+    def top_row(self, cell_x: int) -> int:
+        """
+        Returns the highest occupied row of a grid column.
+
+        Parameters:
+            cell_x (int): The grid column.
+
+        Returns:
+            int: The highest row holding a circle, -1 for an empty column.
+        """
+        return self._top_rows.get(cell_x, -1)
+
+    def cell(self, cell_x: int, cell_y: int) -> List[Tuple[float, float, float]]:
+        """
+        Returns the circles whose centres lie in a grid cell.
+
+        Parameters:
+            cell_x (int): The grid column.
+            cell_y (int): The grid row.
+
+        Returns:
+            List[Tuple[float, float, float]]: (x, y, radius) of the circles in the cell.
+        """
+        return self._cells.get((cell_x, cell_y), [])
+
+    def near(
+        self, x0: float, y0: float, x1: float, y1: float
+    ) -> Iterator[Tuple[float, float, float]]:
+        """
+        Yields the circles whose centres lie in the cells covering a box.
+
+        Parameters:
+            x0 (float): The left edge of the box.
+            y0 (float): The bottom edge of the box.
+            x1 (float): The right edge of the box.
+            y1 (float): The top edge of the box.
+
+        Returns:
+            Iterator[Tuple[float, float, float]]: (x, y, radius) of every circle found.
+        """
+        size = self.cell_size
+        cells = self._cells
+        for cell_x in range(int(x0 // size), int(x1 // size) + 1):
+            for cell_y in range(int(y0 // size), int(y1 // size) + 1):
+                circles = cells.get((cell_x, cell_y))
+                if circles:
+                    yield from circles
+
+    def overlaps(self, x: float, y: float, radius: float, gap: float = 0.0) -> bool:
+        """
+        Checks whether a circle would overlap a placed circle.
+
+        Parameters:
+            x (float): The x coordinate of the centre.
+            y (float): The y coordinate of the centre.
+            radius (float): The radius, at most half the cell size.
+            gap (float): The required clearance between circles.
+
+        Returns:
+            bool: True if the circle is closer than gap to a placed circle.
+        """
+        reach = self.cell_size
+        for other_x, other_y, other_radius in self.near(
+            x - reach, y - reach, x + reach, y + reach
+        ):
+            distance = radius + other_radius + gap
+            dx = x - other_x
+            dy = y - other_y
+            if dx * dx + dy * dy < distance * distance - 1e-9:
+                return True
+        return False
+
+
+class _Tray:
+    def __init__(self, width: float, height: float, gap: float, max_radius: float):
+        self.width = width
+        self.height = height
+        self.gap = gap
+        self.reach = 2 * max_radius + gap
+        self.grid = SpatialHash(self.reach)
+        self.placements: List[Placement] = []
+
+    def drop(self, x: float, radius: float) -> float:
+        """
+        Returns the lowest y at which a circle centred at x rests on the floor or on
+        the circles below it. Grid rows are scanned from the top down and the scan
+        stops once no lower row can raise the result.
+        """
+        grid = self.grid
+        size = grid.cell_size
+        reach = self.reach
+        gap = self.gap
+        y = radius
+        for cell_x in range(int((x - reach) // size), int((x + reach) // size) + 1):
+            for cell_y in range(grid.top_row(cell_x), -1, -1):
+                if (cell_y + 1) * size + reach <= y:
+                    break
+                for other_x, other_y, other_radius in grid.cell(cell_x, cell_y):
+                    distance = radius + other_radius + gap
+                    dx = abs(x - other_x)
+                    if dx < distance:
+                        top = other_y + math.sqrt(distance * distance - dx * dx)
+                        if top > y:
+                            y = top
+        return y
+
+    def place(self, circle: Circle, x: float, y: float, radius: float) -> None:
+        self.grid.add(x, y, radius)
+        self.placements.append(Placement(circle, x, y))
+
+    def greedy(self, radii: List[float], groups: Dict[float, List[Circle]]) -> None:
+        """
+        Places the circles from the largest radius down. When a circle does not fit,
+        radii larger than RETRY_RATIO times its radius are skipped.
+        """
+        cursor = 0.0
+        limit = math.inf
+        for radius in radii:
+            if radius > limit:
+                continue
+            group = groups[radius]
+            while group:
+                x = cursor + radius
+                if x + radius > self.width:
+                    x = radius
+                y = self.drop(x, radius)
+                if y + radius > self.height and x != radius:
+                    x = radius
+                    y = self.drop(x, radius)
+                if y + radius > self.height:
+                    limit = radius * RETRY_RATIO
+                    break
+                self.place(group.pop(), x, y, radius)
+                cursor = x + radius + self.gap
+
+    def fill(self, radii: List[float], groups: Dict[float, List[Circle]]) -> None:
+        """
+        Places the circles from the smallest radius up at the lowest of evenly spaced
+        positions, stopping at the first circle that does not fit anywhere.
+        """
+        for radius in reversed(radii):
+            group = groups[radius]
+            steps = max(1, int((self.width - 2 * radius) // radius))
+            while group:
+                best = None
+                for step in range(steps + 1):
+                    x = radius + (self.width - 2 * radius) * step / steps
+                    y = self.drop(x, radius)
+                    if y + radius <= self.height and (best is None or y < best[1]):
+                        best = (x, y)
+                if best is None:
+                    return
+                self.place(group.pop(), best[0], best[1], radius)
+
+
+def _group(circles: Iterable[Circle]) -> Tuple[List[float], Dict[float, List[Circle]]]:
+    """
+    Groups circles by radius. Returns the distinct radii from the largest down and
+    the circles of every radius in reverse input order, ready to be popped.
+    """
+    groups: Dict[float, List[Circle]] = {}
+    for circle in circles:
+        groups.setdefault(circle.get_radius(), []).append(circle)
+    for group in groups.values():
+        group.reverse()
+    return sorted(groups, reverse=True), groups
+
+
+def _ungroup(radii: List[float], groups: Dict[float, List[Circle]]) -> List[Circle]:
+    return [circle for radius in radii for circle in reversed(groups[radius])]
+
+
+def _split_oversized(radii: List[float], width: float, height: float) -> int:
+    limit = min(width, height)
+    start = 0
+    while start < len(radii) and 2 * radii[start] > limit:
+        start += 1
+    return start
+
+
+def _validate_tray(width: float, height: float, gap: float) -> None:
+    Circle.validate_data(width)
+    Circle.validate_data(height)
+    if gap < 0:
+        raise ValueError("The gap must not be negative")
+
+
+def pack_tray(
+    circles: Iterable[Circle],
+    width: float,
+    height: float,
+    gap: float = 0.0,
+    improve: bool = True,
+) -> TrayPacking:
+    """
+    Packs circles onto a single tray.
+
+    Parameters:
+        circles (Iterable[Circle]): The objects to place, for example pizzas.
+        width (float): The tray width.
+        height (float): The tray height.
+        gap (float): The required clearance between circles.
+        improve (bool): Whether to run the improvement pass after the greedy pass.
+
+    Returns:
+        TrayPacking: The placed circles and the unplaced ones from the largest down.
+
+    Raises:
+        ValueError: If a tray dimension is not greater than zero or gap is negative.
+    """
+    _validate_tray(width, height, gap)
+    radii, groups = _group(circles)
+    start = _split_oversized(radii, width, height)
+    fitting = radii[start:]
+    if not fitting:
+        return TrayPacking(width, height, [], _ungroup(radii, groups))
+    tray = _Tray(width, height, gap, fitting[0])
+    tray.greedy(fitting, groups)
+    if improve:
+        tray.fill(fitting, groups)
+    return TrayPacking(width, height, tray.placements, _ungroup(radii, groups))
+
+
+def pack_trays(
+    circles: Iterable[Circle],
+    width: float,
+    height: float,
+    gap: float = 0.0,
+    improve: bool = True,
+) -> TrayPlan:
+    """
+    Spreads circles over as many identical trays as needed. Circles are grouped by
+    radius once, so a tray costs time in the number of distinct radii left rather
+    than in the number of circles left.
+
+    Parameters:
+        circles (Iterable[Circle]): The objects to place, for example a day's pizzas.
+        width (float): The tray width.
+        height (float): The tray height.
+        gap (float): The required clearance between circles.
+        improve (bool): Whether to run the improvement pass on every tray.
+
+    Returns:
+        TrayPlan: The packed trays, with empty unplaced lists, and the circles too
+         large for any tray.
+
+    Raises:
+        ValueError: If a tray dimension is not greater than zero or gap is negative.
+    """
+    _validate_tray(width, height, gap)
+    radii, groups = _group(circles)
+    start = _split_oversized(radii, width, height)
+    oversized = _ungroup(radii[:start], groups)
+    radii = radii[start:]
+    trays = []
+    while radii:
+        tray = _Tray(width, height, gap, radii[0])
+        tray.greedy(radii, groups)
+        if improve:
+            tray.fill(radii, groups)
+        trays.append(TrayPacking(width, height, tray.placements, []))
+        radii = [radius for radius in radii if groups[radius]]
+    return TrayPlan(trays, oversized)
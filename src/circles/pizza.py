@@ -3,14 +3,84 @@ Module for representing and manipulating rim objects as circular shapes.
 
 This module defines a `Pizza` class, which represents a pizza as a subclass of `Circle`.
 It allows for the creation of a pizza with specified ingredients and categorizes it
-based on its size, calculated from its radius.
+based on its size, calculated from its radius. The size thresholds are sorted radius
+breakpoints, so whole lists of radii can be classified with `classify_pizza_radii`.
 """
 
 from __future__ import annotations
-from typing import Union
+from bisect import bisect_left
+from typing import Iterable, List, Sequence, Union
 
 from circles.circle import Circle
 
+PIZZA_SIZE_BREAKPOINTS = (20, 40)
+PIZZA_SIZES = ("small", "medium", "large")
+
+
+def validate_breakpoints(
+    breakpoints: Sequence[Union[int, float]], sizes: Sequence[str]
+) -> None:
+    """
+    Validates size breakpoints and their size names.
+
+    Parameters:
+        breakpoints (Sequence[Union[int, float]]): The sorted upper radius limits of
+         every size but the last one, inclusive.
+        sizes (Sequence[str]): The size names, one more than the breakpoints.
+
+    Raises:
+        ValueError: If the breakpoints are not strictly increasing or the number
+         of sizes doesn't match them.
+    """
+    if len(sizes) != len(breakpoints) + 1:
+        raise ValueError("There must be exactly one more size than breakpoints")
+    if any(low >= high for low, high in zip(breakpoints, breakpoints[1:])):
+        raise ValueError("The breakpoints must be strictly increasing")
+
+
+def classify_pizza_radius(
+    radius: Union[int, float],
+    breakpoints: Sequence[Union[int, float]] = PIZZA_SIZE_BREAKPOINTS,
+    sizes: Sequence[str] = PIZZA_SIZES,
+) -> str:
+    """
+    Categorizes a pizza radius into a size.
+
+    Parameters:
+        radius (Union[int, float]): The radius of the pizza in centimeters.
+        breakpoints (Sequence[Union[int, float]]): The sorted upper radius limits of
+         every size but the last one, inclusive.
+        sizes (Sequence[str]): The size names, one more than the breakpoints.
+
+    Returns:
+        str: The size of the pizza.
+    """
+    return sizes[bisect_left(breakpoints, radius)]
+
+
+def classify_pizza_radii(
+    radii: Iterable[Union[int, float]],
+    breakpoints: Sequence[Union[int, float]] = PIZZA_SIZE_BREAKPOINTS,
+    sizes: Sequence[str] = PIZZA_SIZES,
+) -> List[str]:
+    """
+    Categorizes many pizza radii into sizes.
+
+    Parameters:
+        radii (Iterable[Union[int, float]]): The radii of the pizzas in centimeters.
+        breakpoints (Sequence[Union[int, float]]): The sorted upper radius limits of
+         every size but the last one, inclusive.
+        sizes (Sequence[str]): The size names, one more than the breakpoints.
+
+    Returns:
+        List[str]: The size of every pizza.
+
+    Raises:
+        ValueError: If the breakpoints or sizes are invalid.
+    """
+    validate_breakpoints(breakpoints, sizes)
+    return [sizes[bisect_left(breakpoints, radius)] for radius in radii]
+
 
 class Pizza(Circle):
     """
@@ -21,6 +91,8 @@ class Pizza(Circle):
         size (str): The size of the pizza, categorized as "small", "medium", or "large".
     """
 
+    __slots__ = ("ingredients", "size")
+
     def __init__(self, radius: Union[int, float], ingredients: list) -> None:
         """
         Initializes a Pizza object and categorizes it into three different sizes
@@ -36,16 +108,30 @@ class Pizza(Circle):
         super().__init__(radius)
         if isinstance(ingredients, list):
             self.ingredients = ingredients
-            if 0 < self.get_radius() <= 20:
-                self.size = "small"
-            elif 20 < self.get_radius() <= 40:
-                self.size = "medium"
-            elif self.get_radius() > 40:
-                self.size = "large"
+            self.size = classify_pizza_radius(self.get_radius())
         else:
             print("Ingredients value must be a list")
             raise TypeError
 
+    def _on_radius_change(self) -> None:
+        super()._on_radius_change()
+        self.size = classify_pizza_radius(self.get_radius())
+
+    def spec_key(self) -> tuple:
+        """
+        Returns the canonical value key of the pizza.
+
+        Returns:
+            tuple: Pizza, the rounded radius and the ingredients in order.
+        """
+        return Pizza, self._spec_radius(), tuple(self.ingredients)
+
+    def _get_state(self) -> tuple:
+        return self.ingredients, self.size
+
+    def _set_state(self, state: tuple) -> None:
+        self.ingredients, self.size = state
+
     @classmethod
     def create_from_diameter(
         cls, diameter: Union[int, float], ingredients: list = None
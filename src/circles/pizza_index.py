@@ -0,0 +1,253 @@
+"""
+Module for querying pizza collections by their ingredients.
+
+This module defines the `IngredientRegistry` class, which interns ingredient names as
+small integer IDs, and the `PizzaIndex` class, which keeps an inverted index from every
+ingredient to the pizzas containing it. Sets of ingredients and sets of pizzas are
+stored as integer bitsets, so AND/OR/NOT queries are a few integer operations instead
+of scans over lists of strings. The pizza bitset of an ingredient is built from its
+posting list when first queried and updated in place when a pizza with that ingredient
+is added. The index keeps only the ingredient bitset of every pizza; the names are
+interned once in the registry however many pizzas share them, and the pizzas
+themselves are not modified.
+"""
+
+from __future__ import annotations
+import sys
+from typing import Dict, Iterable, List, Optional
+
+from circles.pizza import Pizza
+
+
+def _bits(mask: int) -> List[int]:
+    """
+    Returns the positions of the set bits of a bitset in increasing order.
+    """
+    digits = bin(mask)[:1:-1]
+    positions = []
+    position = digits.find("1")
+    while position != -1:
+        positions.append(position)
+        position = digits.find("1", position + 1)
+    return positions
+
+
+def _bitset(positions: Iterable[int], size: int) -> int:
+    """
+    Returns the bitset with the given bit positions set, in linear time.
+    """
+    data = bytearray((size + 7) // 8)
+    for position in positions:
+        data[position >> 3] |= 1 << (position & 7)
+    return int.from_bytes(data, "little")
+
+
+class IngredientRegistry:
+    """
+    A registry assigning a small integer ID to every distinct ingredient name.
+
+    Attributes:
+        ids (Dict[str, int]): The ID of every registered ingredient.
+        names (List[str]): The interned ingredient names indexed by ID.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes an empty registry.
+        """
+        self.ids: Dict[str, int] = {}
+        self.names: List[str] = []
+
+    def intern(self, name: str) -> int:
+        """
+        Returns the ID of an ingredient, registering it if needed.
+
+        Parameters:
+            name (str): The ingredient name.
+
+        Returns:
+            int: The ingredient ID.
+
+        Raises:
+            TypeError: If the name is not a string.
+        """
+        ingredient_id = self.ids.get(name)
+        if ingredient_id is None:
+            if not isinstance(name, str):
+                raise TypeError("Ingredient names must be strings")
+            ingredient_id = len(self.names)
+            name = sys.intern(name)
+            self.ids[name] = ingredient_id
+            self.names.append(name)
+        return ingredient_id
+
+    def mask(self, ingredients: Iterable[str]) -> int:
+        """
+        Returns the bitset of a collection of ingredients, registering new ones.
+
+        Parameters:
+            ingredients (Iterable[str]): The ingredient names.
+
+        Returns:
+            int: A bitset with the bit of every ingredient ID set.
+        """
+        mask = 0
+        for name in ingredients:
+            mask |= 1 << self.intern(name)
+        return mask
+
+    def decode(self, mask: int) -> List[str]:
+        """
+        Returns the ingredient names of a bitset.
+
+        Parameters:
+            mask (int): A bitset of ingredient IDs.
+
+        Returns:
+            List[str]: The ingredient names ordered by ID.
+        """
+        return [self.names[ingredient_id] for ingredient_id in _bits(mask)]
+
+
+class PizzaIndex:
+    """
+    An inverted index from ingredients to pizzas.
+
+    Attributes:
+        registry (IngredientRegistry): The registry of ingredient IDs.
+        pizzas (List[Pizza]): The indexed pizzas, indexed by pizza ID.
+    """
+
+    def __init__(
+        self,
+        pizzas: Iterable[Pizza] = (),
+        registry: Optional[IngredientRegistry] = None,
+    ) -> None:
+        """
+        Initializes a PizzaIndex.
+
+        Parameters:
+            pizzas (Iterable[Pizza]): The pizzas to index.
+            registry (Optional[IngredientRegistry]): A registry to share with other
+             indexes, by default a new one.
+        """
+        self.registry = registry if registry is not None else IngredientRegistry()
+        self.pizzas: List[Pizza] = []
+        self._ingredient_masks: List[int] = []
+        self._postings: List[List[int]] = []
+        self._posting_bitsets: Dict[int, int] = {}
+        for pizza in pizzas:
+            self.add(pizza)
+
+    def __len__(self) -> int:
+        return len(self.pizzas)
+
+    def add(self, pizza: Pizza) -> int:
+        """
+        Adds a pizza to the index. A pizza with an ingredient that is not a string
+        is rejected before the index or the registry is changed.
+
+        Parameters:
+            pizza (Pizza): The pizza to add.
+
+        Returns:
+            int: The pizza ID.
+
+        Raises:
+            TypeError: If the provided object is not a pizza or an ingredient is not
+             a string.
+        """
+        if not isinstance(pizza, Pizza):
+            raise TypeError("Provided object must be a pizza")
+        if not all(isinstance(name, str) for name in pizza.ingredients):
+            raise TypeError("Ingredient names must be strings")
+        pizza_id = len(self.pizzas)
+        mask = self.registry.mask(pizza.ingredients)
+        postings = self._postings
+        bitsets = self._posting_bitsets
+        for ingredient_id in _bits(mask):
+            while len(postings) <= ingredient_id:
+                postings.append([])
+            postings[ingredient_id].append(pizza_id)
+            bitset = bitsets.get(ingredient_id)
+            if bitset is not None:
+                bitsets[ingredient_id] = bitset | 1 << pizza_id
+        self.pizzas.append(pizza)
+        self._ingredient_masks.append(mask)
+        return pizza_id
+
+    def ingredients_of(self, pizza_id: int) -> List[str]:
+        """
+        Returns the distinct ingredients of an indexed pizza.
+
+        Parameters:
+            pizza_id (int): The pizza ID.
+
+        Returns:
+            List[str]: The ingredient names ordered by ingredient ID.
+        """
+        return self.registry.decode(self._ingredient_masks[pizza_id])
+
+    def _posting(self, name: str) -> int:
+        ingredient_id = self.registry.ids.get(name)
+        if ingredient_id is None or ingredient_id >= len(self._postings):
+            return 0
+        bitset = self._posting_bitsets.get(ingredient_id)
+        if bitset is None:
+            bitset = _bitset(self._postings[ingredient_id], len(self.pizzas))
+            self._posting_bitsets[ingredient_id] = bitset
+        return bitset
+
+    def query_ids(
+        self,
+        all_of: Iterable[str] = (),
+        any_of: Iterable[str] = (),
+        none_of: Iterable[str] = (),
+    ) -> List[int]:
+        """
+        Returns the IDs of the pizzas matching an ingredient query.
+
+        Parameters:
+            all_of (Iterable[str]): Ingredients every result must contain.
+            any_of (Iterable[str]): Ingredients of which every result must contain
+             at least one. Ignored when empty.
+            none_of (Iterable[str]): Ingredients no result may contain.
+
+        Returns:
+            List[int]: The matching pizza IDs in increasing order.
+        """
+        result = (1 << len(self.pizzas)) - 1
+        for name in all_of:
+            result &= self._posting(name)
+        any_of = list(any_of)
+        if any_of:
+            alternatives = 0
+            for name in any_of:
+                alternatives |= self._posting(name)
+            result &= alternatives
+        for name in none_of:
+            result &= ~self._posting(name)
+        return _bits(result)
+
+    def query(
+        self,
+        all_of: Iterable[str] = (),
+        any_of: Iterable[str] = (),
+        none_of: Iterable[str] = (),
+    ) -> List[Pizza]:
+        """
+        Returns the pizzas matching an ingredient query, for example all pizzas with
+        ham and cheese but without pineapple.
+
+        Parameters:
+            all_of (Iterable[str]): Ingredients every result must contain.
+            any_of (Iterable[str]): Ingredients of which every result must contain
+             at least one. Ignored when empty.
+            none_of (Iterable[str]): Ingredients no result may contain.
+
+        Returns:
+            List[Pizza]: The matching pizzas in the order they were added.
+        """
+        pizzas = self.pizzas
+        pizza_ids = self.query_ids(all_of, any_of, none_of)
+        return [pizzas[pizza_id] for pizza_id in pizza_ids]
@@ -10,6 +10,7 @@ from __future__ import annotations
 from typing import Union
 
 from circles.circle import Circle
+from circles.conversion import mm_to_inches
 
 
 class Rim(Circle):
@@ -21,6 +22,8 @@ class Rim(Circle):
 
     """
 
+    __slots__ = ("diameter_inches",)
+
     def __init__(self, radius: Union[int, float]) -> None:
         """
         Initializes a Rim object.
@@ -47,10 +50,30 @@ class Rim(Circle):
         """
         return cls(diameter / 2)
 
+    def _on_radius_change(self) -> None:
+        super()._on_radius_change()
+        self.diameter_inches = self.mm_to_inches(2 * self.get_radius())
+
+    def spec_key(self) -> tuple:
+        """
+        Returns the canonical value key of the rim.
+
+        Returns:
+            tuple: Rim and the rounded radius.
+        """
+        return Rim, self._spec_radius()
+
+    def _get_state(self) -> tuple:
+        return (self.diameter_inches,)
+
+    def _set_state(self, state: tuple) -> None:
+        (self.diameter_inches,) = state
+
     @staticmethod
     def mm_to_inches(mm_value: Union[int, float]) -> float:
         """
-        Converts millimeters to inches.
+        Converts millimeters to inches, rounded to two decimal places by
+        `circles.conversion.mm_to_inches`.
 
         Parameters:
             mm_value (Union[int, float]): The value in millimeters to convert.
@@ -58,5 +81,4 @@ class Rim(Circle):
         Returns:
             float: The equivalent value in inches.
         """
-        Rim.validate_data(mm_value)
-        return round(mm_value / 25.4, 2)
+        return mm_to_inches(mm_value)
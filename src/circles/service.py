@@ -0,0 +1,373 @@
+"""
+Module for answering tyre and rim fitment queries over a local socket.
+
+This module defines the `FitmentService` class, an asyncio server speaking a
+line-delimited JSON protocol over TCP or a Unix socket. Requests from all clients are
+queued and answered in micro-batches: the first queued request opens a batch, which
+collects further requests until the batch window elapses or the batch is full, and then
+the whole batch is answered at once. Identical requests within a batch are computed
+once. A request that fails unexpectedly gets an "INTERNAL_ERROR" reply without
+affecting the rest of its batch. Each connection has a bounded number of requests in
+flight; once it is reached, the server stops reading from that connection until
+replies have been written. A line longer than the stream limit gets a "LINE_TOO_LONG"
+reply and closes the connection; requests still in flight when a client disconnects
+are cancelled.
+
+Requests are JSON objects on a single line, with an optional "id" echoed in the reply:
+
+    {"id": 1, "op": "fits", "tyre_label": "235/19R19", "rim_diameter": 482.6}
+    {"id": 2, "op": "assemble", "tyre_label": "235/19R19", "tyre_diameter": 1600,
+     "rim_diameter": 482.6}
+
+Diameters are in millimeters. Replies are JSON objects on a single line:
+
+    {"id": 1, "ok": true, "fits": true, "rim_size": 19, "necessary_rim_size": 19}
+    {"id": 2, "ok": true, "wheel_diameter": 1600}
+    {"id": 3, "ok": false, "error": "LABEL_FORMAT", "message": "Label data must be ..."}
+
+Usage (at the project level):
+    python -m circles.service [--host 127.0.0.1] [--port 8765] [--window 0.002]
+                              [--max-batch 1024] [--max-pending 64]
+"""
+
+from __future__ import annotations
+import argparse
+import asyncio
+import json
+from typing import Dict, List, Optional, Tuple
+
+from circles.conversion import mm_to_rim_size
+from circles.tyre import try_parse_tyre_label
+from circles.validation import MESSAGES, Reason, check_radius
+
+
+def _error(reason: Reason) -> dict:
+    return {"ok": False, "error": reason.name, "message": MESSAGES[reason]}
+
+
+def _internal_error(error: Exception) -> dict:
+    return {"ok": False, "error": "INTERNAL_ERROR", "message": type(error).__name__}
+
+
+def _rim_size(rim_diameter) -> Tuple[Reason, int]:
+    reason = check_radius(rim_diameter)
+    if reason:
+        return reason, 0
+    return Reason.OK, mm_to_rim_size(rim_diameter)
+
+
+def answer(request: dict) -> dict:
+    """
+    Answers a single request without the request id.
+
+    Parameters:
+        request (dict): The decoded request.
+
+    Returns:
+        dict: The reply.
+    """
+    operation = request.get("op")
+    if operation not in ("fits", "assemble"):
+        return {"ok": False, "error": "UNKNOWN_OP", "message": "Unknown operation"}
+    tyre_label = request.get("tyre_label")
+    if not isinstance(tyre_label, str):
+        return _error(Reason.LABEL_TYPE)
+    fields = try_parse_tyre_label(tyre_label)
+    if fields is None:
+        return _error(Reason.LABEL_FORMAT)
+    reason, rim_size = _rim_size(request.get("rim_diameter"))
+    if reason:
+        return _error(reason)
+    fits = fields.rim_size == rim_size
+    if operation == "fits":
+        return {
+            "ok": True,
+            "fits": fits,
+            "rim_size": rim_size,
+            "necessary_rim_size": fields.rim_size,
+        }
+    tyre_diameter = request.get("tyre_diameter")
+    reason = check_radius(tyre_diameter)
+    if reason:
+        return _error(reason)
+    if not fits:
+        return _error(Reason.SIZE_MISMATCH)
+    return {"ok": True, "wheel_diameter": tyre_diameter}
+
+
+def _safe_answer(request: dict) -> dict:
+    try:
+        return answer(request)
+    except Exception as error:
+        return _internal_error(error)
+
+
+def answer_batch(requests: List[dict]) -> List[dict]:
+    """
+    Answers a batch of requests, computing identical requests only once. A request
+    whose answer raises an exception gets an "INTERNAL_ERROR" reply.
+
+    Parameters:
+        requests (List[dict]): The decoded requests.
+
+    Returns:
+        List[dict]: The replies in request order, with the request ids.
+    """
+    replies = []
+    answers: Dict[tuple, dict] = {}
+    for request in requests:
+        key = (
+            request.get("op"),
+            request.get("tyre_label"),
+            request.get("rim_diameter"),
+            request.get("tyre_diameter"),
+        )
+        try:
+            reply = answers.get(key)
+        except TypeError:
+            reply = _safe_answer(request)
+        else:
+            if reply is None:
+                reply = answers[key] = _safe_answer(request)
+        if "id" in request:
+            reply = dict(reply, id=request["id"])
+        replies.append(reply)
+    return replies
+
+
+class FitmentService:
+    """
+    An asyncio fitment server answering requests in micro-batches.
+
+    Attributes:
+        window (float): The time in seconds a batch collects requests.
+        max_batch (int): The largest number of requests in a batch.
+        max_pending (int): The largest number of requests of one connection that are
+         being answered at once.
+        batches (int): The number of batches answered so far.
+        requests (int): The number of requests answered so far.
+    """
+
+    def __init__(
+        self, window: float = 0.002, max_batch: int = 1024, max_pending: int = 64
+    ) -> None:
+        """
+        Initializes a FitmentService.
+
+        Parameters:
+            window (float): The time in seconds a batch collects requests.
+            max_batch (int): The largest number of requests in a batch.
+            max_pending (int): The largest number of requests of one connection that
+             are being answered at once.
+
+        Raises:
+            ValueError: If window is negative or max_batch or max_pending is not
+             greater than zero.
+        """
+        if window < 0:
+            raise ValueError("The batch window must not be negative")
+        if max_batch <= 0:
+            raise ValueError("The batch size must be greater than zero")
+        if max_pending <= 0:
+            raise ValueError("The number of pending requests must be greater than zero")
+        self.window = window
+        self.max_batch = max_batch
+        self.max_pending = max_pending
+        self.batches = 0
+        self.requests = 0
+        self._queue: Optional[asyncio.Queue] = None
+        self._batcher: Optional[asyncio.Task] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def submit(self, request: dict) -> dict:
+        """
+        Queues a request for the next batch and waits for its reply.
+
+        Parameters:
+            request (dict): The decoded request.
+
+        Returns:
+            dict: The reply.
+        """
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+            self._batcher = asyncio.create_task(self._run_batches())
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((request, future))
+        return await future
+
+    async def _run_batches(self) -> None:
+        loop = asyncio.get_running_loop()
+        queue = self._queue
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self.window
+            while len(batch) < self.max_batch:
+                if queue.empty():
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+                else:
+                    batch.append(queue.get_nowait())
+            try:
+                replies = answer_batch([request for request, _ in batch])
+            except Exception as error:
+                replies = [_internal_error(error)] * len(batch)
+            for (_, future), reply in zip(batch, replies):
+                if not future.done():
+                    future.set_result(reply)
+            self.batches += 1
+            self.requests += len(batch)
+
+    async def _handle_line(
+        self, line: bytes, writer: asyncio.StreamWriter, pending: asyncio.Semaphore
+    ) -> None:
+        try:
+            try:
+                request = json.loads(line)
+            except ValueError:
+                request = None
+            if isinstance(request, dict):
+                reply = await self.submit(request)
+            else:
+                reply = {
+                    "ok": False,
+                    "error": "INVALID_JSON",
+                    "message": "Invalid request",
+                }
+            writer.write(json.dumps(reply).encode() + b"\n")
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            pending.release()
+
+    async def _handle_client(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        tasks = set()
+        pending = asyncio.Semaphore(self.max_pending)
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # the line is longer than the stream limit
+                    reply = {
+                        "ok": False,
+                        "error": "LINE_TOO_LONG",
+                        "message": "Request line too long",
+                    }
+                    writer.write(json.dumps(reply).encode() + b"\n")
+                    break
+                if not line:
+                    break
+                if line.strip():
+                    # stop reading until a reply of this connection has been written
+                    await pending.acquire()
+                    task = asyncio.create_task(self._handle_line(line, writer, pending))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks)
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            for task in tasks:
+                task.cancel()
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+            writer.close()
+
+    async def start(
+        self, host: str = "127.0.0.1", port: int = 0
+    ) -> asyncio.AbstractServer:
+        """
+        Starts listening on a TCP socket.
+
+        Parameters:
+            host (str): The address to bind.
+            port (int): The port to bind, 0 for any free port.
+
+        Returns:
+            asyncio.AbstractServer: The running server.
+        """
+        self._server = await asyncio.start_server(self._handle_client, host, port)
+        return self._server
+
+    async def start_unix(self, path: str) -> asyncio.AbstractServer:
+        """
+        Starts listening on a Unix socket.
+
+        Parameters:
+            path (str): The path of the socket.
+
+        Returns:
+            asyncio.AbstractServer: The running server.
+        """
+        self._server = await asyncio.start_unix_server(self._handle_client, path)
+        return self._server
+
+    async def close(self) -> None:
+        """
+        Stops the server and the batching task.
+        """
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._batcher is not None:
+            self._batcher.cancel()
+            try:
+                await self._batcher
+            except asyncio.CancelledError:
+                pass
+            self._batcher = None
+            self._queue = None
+
+
+async def serve(
+    host: str, port: int, window: float, max_batch: int, max_pending: int = 64
+) -> None:
+    """
+    Runs a FitmentService until it is cancelled.
+
+    Parameters:
+        host (str): The address to bind.
+        port (int): The port to bind.
+        window (float): The time in seconds a batch collects requests.
+        max_batch (int): The largest number of requests in a batch.
+        max_pending (int): The largest number of requests of one connection that are
+         being answered at once.
+    """
+    service = FitmentService(window, max_batch, max_pending)
+    server = await service.start(host, port)
+    try:
+        await server.serve_forever()
+    finally:
+        await service.close()
+
+
+def main() -> None:
+    """
+    Runs the service from the command line.
+    """
+    parser = argparse.ArgumentParser(description="Tyre and rim fitment service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--window", type=float, default=0.002)
+    parser.add_argument("--max-batch", type=int, default=1024)
+    parser.add_argument("--max-pending", type=int, default=64)
+    args = parser.parse_args()
+    asyncio.run(
+        serve(args.host, args.port, args.window, args.max_batch, args.max_pending)
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+"""
+Module for sharing one immutable rim or tyre object between many wheels.
+
+Fleet data holds millions of wheels but only a few hundred distinct rim and tyre specs.
+This module defines `FrozenRim` and `FrozenTyre`, immutable variants of `Rim` and
+`Tyre`, and the `SpecRegistry` class, which creates one frozen object per distinct
+spec, that is radius rounded like `Circle.spec_key` (and tyre label), and returns it
+for every later request with an equal spec. The inch conversion and the label parsing
+then run once per spec, and memory grows with the number of distinct specs instead of
+the number of rows.
+
+`FrozenRim.create_from_diameter` and `FrozenTyre.create_from_diameter` return the
+shared objects of a module-level registry; frozen objects unpickle to the shared object
+of the receiving process.
+"""
+
+from __future__ import annotations
+from typing import Dict, Tuple, Union
+
+from circles.circle import SPEC_DIGITS
+from circles.rim import Rim
+from circles.tyre import Tyre, parse_tyre_label
+from circles.wheel import Wheel
+
+_CACHED = ("_area", "_diameter")
+
+
+class _Frozen:
+    """
+    Allows every attribute to be set once. Only the cached area and diameter can be
+    set again.
+    """
+
+    __slots__ = ()
+
+    def __setattr__(self, name: str, value) -> None:
+        if name not in _CACHED and hasattr(self, name):
+            raise AttributeError(f"{type(self).__name__} objects are immutable")
+        object.__setattr__(self, name, value)
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} objects are immutable")
+
+
+class FrozenRim(_Frozen, Rim):
+    """
+    An immutable rim, shared between wheels through a `SpecRegistry`.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def create_from_diameter(cls, diameter: Union[int, float]) -> FrozenRim:
+        """
+        Returns the shared rim with a diameter.
+
+        Parameters:
+            diameter (Union[int, float]): The diameter of the rim in millimeters.
+
+        Returns:
+            FrozenRim: The shared rim.
+
+        Inherits all argument verification exceptions from Circle.
+        """
+        return _registry.rim(diameter)
+
+    def __reduce__(self) -> tuple:
+        return _shared_rim, (self.get_diameter(),)
+
+
+class FrozenTyre(_Frozen, Tyre):
+    """
+    An immutable tyre, shared between wheels through a `SpecRegistry`.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def create_from_diameter(
+        cls, diameter: Union[int, float], tyre_label: str
+    ) -> FrozenTyre:
+        """
+        Returns the shared tyre with a diameter and a tyre label.
+
+        Parameters:
+            diameter (Union[int, float]): The diameter of the tyre in millimeters.
+            tyre_label (str): A string following the standard tyre size designation format.
+
+        Returns:
+            FrozenTyre: The shared tyre.
+
+        Raises:
+            ValueError: If tyre_label is not a string or is not a valid tyre label.
+        """
+        return _registry.tyre(diameter, tyre_label)
+
+    def __reduce__(self) -> tuple:
+        return _shared_tyre, (self.get_diameter(), self.tyre_label)
+
+
+class SpecRegistry:
+    """
+    One shared frozen rim per diameter and one shared frozen tyre per diameter and
+    tyre label.
+
+    Objects are keyed on the radius rounded to SPEC_DIGITS decimal places, like
+    `Circle.spec_key`, so diameters that give equal rims or tyres, such as 406 and
+    406.0 or 0.1 + 0.2 and 0.3, share the object created first.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes an empty SpecRegistry.
+        """
+        self._rims: Dict[Union[int, float], FrozenRim] = {}
+        self._tyres: Dict[Tuple[Union[int, float], str], FrozenTyre] = {}
+
+    def __len__(self) -> int:
+        return len(self._rims) + len(self._tyres)
+
+    def rim(self, diameter: Union[int, float]) -> FrozenRim:
+        """
+        Returns the shared rim with a diameter, creating it on first use.
+
+        Parameters:
+            diameter (Union[int, float]): The diameter of the rim in millimeters.
+
+        Returns:
+            FrozenRim: The shared rim.
+
+        Inherits all argument verification exceptions from Circle.
+        """
+        radius = diameter / 2
+        key = round(radius, SPEC_DIGITS)
+        rim = self._rims.get(key)
+        if rim is None:
+            rim = FrozenRim(radius)
+            self._rims[key] = rim
+        return rim
+
+    def tyre(self, diameter: Union[int, float], tyre_label: str) -> FrozenTyre:
+        """
+        Returns the shared tyre with a diameter and a tyre label, creating it on first
+        use.
+
+        Parameters:
+            diameter (Union[int, float]): The diameter of the tyre in millimeters.
+            tyre_label (str): A string following the standard tyre size designation format.
+
+        Returns:
+            FrozenTyre: The shared tyre.
+
+        Raises:
+            ValueError: If tyre_label is not a string or is not a valid tyre label.
+        """
+        radius = diameter / 2
+        key = (round(radius, SPEC_DIGITS), tyre_label)
+        try:
+            tyre = self._tyres.get(key)
+        except TypeError:
+            tyre = None
+        if tyre is None:
+            parse_tyre_label(tyre_label)
+            tyre = FrozenTyre(radius, tyre_label)
+            self._tyres[key] = tyre
+        return tyre
+
+    def wheel(
+        self,
+        tyre_diameter: Union[int, float],
+        tyre_label: str,
+        rim_diameter: Union[int, float],
+    ) -> Wheel:
+        """
+        Creates a wheel from the shared tyre and rim with the given parameters.
+
+        Parameters:
+            tyre_diameter (Union[int, float]): The diameter of the tyre in millimeters.
+            tyre_label (str): A string following the standard tyre size designation format.
+            rim_diameter (Union[int, float]): The diameter of the rim in millimeters.
+
+        Returns:
+            Wheel: A new wheel referencing the shared tyre and rim.
+
+        Raises:
+            ValueError: If the tyre label is invalid or tyre and rim sizes do not match.
+        """
+        return Wheel(self.tyre(tyre_diameter, tyre_label), self.rim(rim_diameter))
+
+    def clear(self) -> None:
+        """
+        Forgets all shared objects. Objects handed out before stay valid.
+        """
+        self._rims.clear()
+        self._tyres.clear()
+
+
+_registry = SpecRegistry()
+
+
+def _shared_rim(diameter: Union[int, float]) -> FrozenRim:
+    return _registry.rim(diameter)
+
+
+def _shared_tyre(diameter: Union[int, float], tyre_label: str) -> FrozenTyre:
+    return _registry.tyre(diameter, tyre_label)
+
+
+def default_registry() -> SpecRegistry:
+    """
+    Returns the registry used by `FrozenRim.create_from_diameter`,
+    `FrozenTyre.create_from_diameter` and unpickling.
+
+    Returns:
+        SpecRegistry: The module-level registry.
+    """
+    return _registry
@@ -4,26 +4,214 @@ Module for representing and manipulating tyre objects as circular shapes.
 This module defines a `Tyre` class, representing a tyre as a subclass of `Circle`.
 The `Tyre` class includes methods and properties, such as size
 specifications and necessary rim dimensions based on a standard tyre label format.
-In addition, it verifies the validity of tyre label data
+In addition, it verifies the validity of tyre label data. Labels are parsed by
+`parse_tyre_label`, which keeps recently parsed labels in a bounded cache, so repeated
+labels, valid or not, cost only a dictionary lookup. `try_parse_tyre_label` returns
+None for invalid labels instead of raising, and `clear_tyre_label_cache` empties the
+cache.
+
+Besides the plain "XXX/YYRZZ" format, labels may use the full ISO/ETRTO designation,
+for example "P225/45ZR17 94W" or "LT265/70R17". `parse_tyre_designation` reads such a
+label with one precompiled, anchored pattern in a single pass and returns all of its
+fields; labels in the plain format take a faster slice-based path.
 
 """
 
 from __future__ import annotations
-from typing import Union
+from functools import lru_cache
+import re
+from typing import Iterable, List, NamedTuple, Optional, Union
 
 from circles.circle import Circle
 
+TYRE_LABEL_CACHE_SIZE = 4096
+TYRE_PREFIXES = ("LT", "ST", "P", "T")
+TYRE_CONSTRUCTIONS = ("ZR", "R", "D", "B")
+SPEED_RATINGS = tuple("ABCDEFGHJKLMNPQRSTUVWY") + ("(Y)",)
+
+# One anchored pattern, matched in a single pass by the regular expression engine:
+# prefix, width, aspect ratio, construction, rim size, load index and speed rating.
+_DESIGNATION = re.compile(
+    rf"({'|'.join(TYRE_PREFIXES)})?(\d{{3}})/(\d{{2}})({'|'.join(TYRE_CONSTRUCTIONS)})"
+    rf"(\d{{2}})(?: (\d{{2,3}})({'|'.join(map(re.escape, SPEED_RATINGS))}))?",
+    re.ASCII,
+)
+
+
+class TyreLabel(NamedTuple):
+    """
+    Parsed standard tyre size designation "XXX/YYRZZ".
+
+    Attributes:
+        width (int): The tyre width in millimeters.
+        aspect_ratio (int): The height-to-width ratio in percent.
+        rim_size (int): The rim diameter in inches.
+    """
+
+    width: int
+    aspect_ratio: int
+    rim_size: int
+
+
+class TyreDesignation(NamedTuple):
+    """
+    Parsed ISO/ETRTO tyre designation "[prefix]XXX/YY<construction>ZZ[ LI<speed>]".
+
+    Attributes:
+        prefix (str): The vehicle class, "P", "LT", "ST", "T" or "" when absent.
+        width (int): The tyre width in millimeters.
+        aspect_ratio (int): The height-to-width ratio in percent.
+        construction (str): The carcass construction, "R", "ZR", "D" or "B".
+        rim_size (int): The rim diameter in inches.
+        load_index (Optional[int]): The load index, None when absent.
+        speed_rating (Optional[str]): The speed rating, None when absent.
+    """
+
+    prefix: str
+    width: int
+    aspect_ratio: int
+    construction: str
+    rim_size: int
+    load_index: Optional[int]
+    speed_rating: Optional[str]
+
+
+@lru_cache(maxsize=TYRE_LABEL_CACHE_SIZE)
+def _read_tyre_designation(tyre_label: str) -> Optional[TyreDesignation]:
+    match = _DESIGNATION.fullmatch(tyre_label)
+    if match is None:
+        return None
+    prefix, width, aspect_ratio, construction, rim_size, load_index, speed_rating = (
+        match.groups()
+    )
+    return TyreDesignation(
+        prefix or "",
+        int(width),
+        int(aspect_ratio),
+        construction,
+        int(rim_size),
+        None if load_index is None else int(load_index),
+        speed_rating,
+    )
+
+
+@lru_cache(maxsize=TYRE_LABEL_CACHE_SIZE)
+def _read_tyre_label(tyre_label: str) -> Optional[TyreLabel]:
+    if (
+        len(tyre_label) == 9
+        and tyre_label.isascii()
+        and tyre_label[3] == "/"
+        and tyre_label[6] == "R"
+        and tyre_label[:3].isdigit()
+        and tyre_label[4:6].isdigit()
+        and tyre_label[7:].isdigit()
+    ):
+        return TyreLabel(int(tyre_label[:3]), int(tyre_label[4:6]), int(tyre_label[7:]))
+    designation = _read_tyre_designation(tyre_label)
+    if designation is None:
+        return None
+    return TyreLabel(designation.width, designation.aspect_ratio, designation.rim_size)
+
+
+def parse_tyre_label(tyre_label: str) -> TyreLabel:
+    """
+    Parses a tyre label following the format "XXX/YYRZZ" or the full designation
+    accepted by `parse_tyre_designation`.
+
+    Parameters:
+        tyre_label (str): A string following the standard tyre size designation format.
+
+    Returns:
+        TyreLabel: The width, aspect ratio and rim size encoded in the label.
+
+    Raises:
+        ValueError: If tyre_label is not a string or doesn't follow the standard format.
+    """
+    if not isinstance(tyre_label, str):
+        raise ValueError("Tyre label must be a string")
+    fields = _read_tyre_label(tyre_label)
+    if fields is None:
+        raise ValueError(f"Invalid tyre label: {tyre_label!r}")
+    return fields
+
+
+def try_parse_tyre_label(tyre_label: str) -> Optional[TyreLabel]:
+    """
+    Parses a tyre label like `parse_tyre_label`, returning None instead of raising.
+
+    Parameters:
+        tyre_label (str): A string following the standard tyre size designation format.
+
+    Returns:
+        Optional[TyreLabel]: The parsed label, or None if tyre_label is not a string or
+         doesn't follow the standard format.
+    """
+    if not isinstance(tyre_label, str):
+        return None
+    return _read_tyre_label(tyre_label)
+
+
+def parse_tyre_designation(tyre_label: str) -> TyreDesignation:
+    """
+    Parses a full ISO/ETRTO tyre designation such as "P225/45ZR17 94W".
+
+    Parameters:
+        tyre_label (str): An optional "P", "LT", "ST" or "T" prefix, the width, "/",
+         the aspect ratio, the construction "R", "ZR", "D" or "B", the rim size and
+         optionally a space, a two or three digit load index and a speed rating.
+
+    Returns:
+        TyreDesignation: All fields encoded in the label.
+
+    Raises:
+        ValueError: If tyre_label is not a string or doesn't follow the format.
+    """
+    if not isinstance(tyre_label, str):
+        raise ValueError("Tyre label must be a string")
+    designation = _read_tyre_designation(tyre_label)
+    if designation is None:
+        raise ValueError(f"Invalid tyre designation: {tyre_label!r}")
+    return designation
+
+
+def clear_tyre_label_cache() -> None:
+    """
+    Forgets all cached results of `parse_tyre_label` and `parse_tyre_designation`.
+    """
+    _read_tyre_label.cache_clear()
+    _read_tyre_designation.cache_clear()
+
+
+def parse_tyre_labels(tyre_labels: Iterable[str]) -> List[TyreLabel]:
+    """
+    Parses many tyre labels, reusing the cached result for repeated labels.
+
+    Parameters:
+        tyre_labels (Iterable[str]): Strings following the standard tyre size designation.
+
+    Returns:
+        List[TyreLabel]: The parsed labels in input order.
+
+    Raises:
+        ValueError: If any label is not a string or doesn't follow the standard format.
+    """
+    return [parse_tyre_label(tyre_label) for tyre_label in tyre_labels]
+
 
 class Tyre(Circle):
     """
     Representation of a rim as a subclass of a Circle, based on a standard tyre label format.
 
     Attributes:
+        tyre_label (str): The standard tyre size designation of the tyre
         tyre_size (int): The width of the tyre in millimeters
+        aspect_ratio (int): The height-to-width ratio of the tyre in percent
         necessary_rim_size (int): The required rim diameter in inches
 
     """
 
+    __slots__ = ("tyre_label", "tyre_size", "aspect_ratio", "necessary_rim_size")
+
     def __init__(self, radius: Union[int, float], tyre_label: str) -> None:
         """
         Initializes a Tyre object.
@@ -36,38 +224,62 @@ class Tyre(Circle):
                     - "XXX": The tyre width in millimeters,
                     - "YY": height-to-width ratio
                     - "ZZ": The rim diameter in inches.
+                Full designations such as "P225/45ZR17 94W" are accepted as well,
+                see `parse_tyre_designation`.
 
         Raises:
             ValueError: If tyre_label is not a string, or if it doesn't follow the standard
              format explained above.
         """
         super().__init__(radius)
-        if isinstance(tyre_label, str):
-            if (
-                tyre_label[:3].isnumeric()
-                and tyre_label[4:6].isnumeric()
-                and tyre_label[7:].isnumeric()
-            ):
-                if (
-                    len(tyre_label) == 9
-                    and "/" == tyre_label[3]
-                    and "R" == tyre_label[6]
-                ):
-                    self.tyre_size = int(tyre_label[:3])
-                    self.necessary_rim_size = int(tyre_label[7:])
-                else:
-                    print(
-                        "Label data must be compatible with standard tire size designation"
-                    )
-                    raise ValueError
-            else:
-                print(
-                    "Label data must be compatible with standard tire size designation"
-                )
-                raise ValueError
-        else:
+        if not isinstance(tyre_label, str):
             print("Tyre label must be a string")
             raise ValueError
+        fields = _read_tyre_label(tyre_label)
+        if fields is None:
+            print("Label data must be compatible with standard tire size designation")
+            raise ValueError
+        width, aspect_ratio, rim_size = fields
+        self.tyre_label = tyre_label
+        self.tyre_size = width
+        self.aspect_ratio = aspect_ratio
+        self.necessary_rim_size = rim_size
+
+    @property
+    def designation(self) -> TyreDesignation:
+        """
+        Returns all fields of the tyre label, including the prefix, construction,
+        load index and speed rating.
+
+        Returns:
+            TyreDesignation: The parsed label.
+        """
+        return parse_tyre_designation(self.tyre_label)
+
+    def spec_key(self) -> tuple:
+        """
+        Returns the canonical value key of the tyre.
+
+        Returns:
+            tuple: Tyre, the rounded radius and the tyre label.
+        """
+        return Tyre, self._spec_radius(), self.tyre_label
+
+    def _get_state(self) -> tuple:
+        return (
+            self.tyre_label,
+            self.tyre_size,
+            self.aspect_ratio,
+            self.necessary_rim_size,
+        )
+
+    def _set_state(self, state: tuple) -> None:
+        (
+            self.tyre_label,
+            self.tyre_size,
+            self.aspect_ratio,
+            self.necessary_rim_size,
+        ) = state
 
     def get_necessary_ring_diameter(self) -> Union[int]:
         """
@@ -0,0 +1,227 @@
+"""
+Module for range queries over tyres by rim size, width and aspect ratio.
+
+This module defines the `TyreCatalogue` class, which keeps tyres in sorted indexes:
+per rim size a sorted list of the distinct widths, and per rim size and width the
+aspect ratios in sorted order. A query such as "all tyres with width 205-225 and
+aspect ratio 45-55 that fit a 17 inch rim" bisects the width list once and the aspect
+ratio list of every matching width, so it costs logarithmic time per distinct width
+in range plus the size of the output, instead of a scan over every tyre. Tyres given
+to the constructor or to `TyreCatalogue.extend` are grouped first and every group is
+sorted once, so building a catalogue takes O(n log n) time; `TyreCatalogue.add`
+inserts a single tyre in place.
+"""
+
+from __future__ import annotations
+from bisect import bisect_left, bisect_right, insort
+from operator import attrgetter
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from circles.fitment import rim_inch_size
+from circles.rim import Rim
+from circles.tyre import Tyre
+
+Range = Optional[Tuple[int, int]]
+
+_aspect_ratio = attrgetter("aspect_ratio")
+
+
+class _WidthBucket:
+    __slots__ = ("aspect_ratios", "tyres")
+
+    def __init__(self) -> None:
+        self.aspect_ratios: List[int] = []
+        self.tyres: List[Tyre] = []
+
+    def add(self, tyre: Tyre) -> None:
+        position = bisect_right(self.aspect_ratios, tyre.aspect_ratio)
+        self.aspect_ratios.insert(position, tyre.aspect_ratio)
+        self.tyres.insert(position, tyre)
+
+    def extend(self, tyres: List[Tyre]) -> None:
+        self.tyres.extend(tyres)
+        # a stable sort keeps tyres with equal aspect ratios in the order they came
+        self.tyres.sort(key=_aspect_ratio)
+        self.aspect_ratios = [tyre.aspect_ratio for tyre in self.tyres]
+
+    def span(self, aspect_ratios: Range) -> Tuple[int, int]:
+        if aspect_ratios is None:
+            return 0, len(self.tyres)
+        low, high = aspect_ratios
+        return (
+            bisect_left(self.aspect_ratios, low),
+            bisect_right(self.aspect_ratios, high),
+        )
+
+
+class TyreCatalogue:
+    """
+    Sorted indexes of tyres for range queries on rim size, width and aspect ratio.
+
+    All ranges are inclusive (low, high) tuples of whole numbers; None matches every
+    value. Results are ordered by rim size, width and aspect ratio, and tyres with equal
+    keys keep the order they were added in.
+    """
+
+    def __init__(self, tyres: Iterable[Tyre] = ()) -> None:
+        """
+        Initializes a TyreCatalogue.
+
+        Parameters:
+            tyres (Iterable[Tyre]): The tyres to index.
+
+        Raises:
+            TypeError: If an object is not a tyre.
+        """
+        self._widths: Dict[int, List[int]] = {}
+        self._buckets: Dict[Tuple[int, int], _WidthBucket] = {}
+        self._count = 0
+        self.extend(tyres)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def add(self, tyre: Tyre) -> None:
+        """
+        Adds a tyre to the catalogue.
+
+        Parameters:
+            tyre (Tyre): The tyre to add.
+
+        Raises:
+            TypeError: If the provided object is not a tyre.
+        """
+        if not isinstance(tyre, Tyre):
+            raise TypeError("Provided object must be a tyre")
+        key = (tyre.necessary_rim_size, tyre.tyre_size)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = _WidthBucket()
+            insort(self._widths.setdefault(key[0], []), key[1])
+        bucket.add(tyre)
+        self._count += 1
+
+    def extend(self, tyres: Iterable[Tyre]) -> None:
+        """
+        Adds many tyres to the catalogue, sorting every affected width bucket once.
+        Nothing is added if an object is not a tyre.
+
+        Parameters:
+            tyres (Iterable[Tyre]): The tyres to add.
+
+        Raises:
+            TypeError: If an object is not a tyre.
+        """
+        groups: Dict[Tuple[int, int], List[Tyre]] = {}
+        for tyre in tyres:
+            if not isinstance(tyre, Tyre):
+                raise TypeError("Provided object must be a tyre")
+            key = (tyre.necessary_rim_size, tyre.tyre_size)
+            group = groups.get(key)
+            if group is None:
+                group = groups[key] = []
+            group.append(tyre)
+        new_sizes = set()
+        for key, group in groups.items():
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = _WidthBucket()
+                self._widths.setdefault(key[0], []).append(key[1])
+                new_sizes.add(key[0])
+            bucket.extend(group)
+            self._count += len(group)
+        for size in new_sizes:
+            self._widths[size].sort()
+
+    def rim_sizes(self) -> List[int]:
+        """
+        Returns the rim sizes of the indexed tyres.
+
+        Returns:
+            List[int]: The distinct necessary rim sizes in inches, in increasing order.
+        """
+        return sorted(self._widths)
+
+    def _spans(
+        self, rim_size: Optional[int], widths: Range, aspect_ratios: Range
+    ) -> Iterator[Tuple[_WidthBucket, int, int]]:
+        rim_sizes = self.rim_sizes() if rim_size is None else [rim_size]
+        for size in rim_sizes:
+            size_widths = self._widths.get(size)
+            if not size_widths:
+                continue
+            if widths is None:
+                start, stop = 0, len(size_widths)
+            else:
+                start = bisect_left(size_widths, widths[0])
+                stop = bisect_right(size_widths, widths[1])
+            for width in size_widths[start:stop]:
+                bucket = self._buckets[size, width]
+                low, high = bucket.span(aspect_ratios)
+                if low < high:
+                    yield bucket, low, high
+
+    def query(
+        self,
+        rim_size: Optional[int] = None,
+        widths: Range = None,
+        aspect_ratios: Range = None,
+    ) -> List[Tyre]:
+        """
+        Returns the tyres matching a rim size and width and aspect ratio ranges.
+
+        Parameters:
+            rim_size (Optional[int]): The necessary rim size in inches, None for all.
+            widths (Range): The inclusive range of widths in millimeters.
+            aspect_ratios (Range): The inclusive range of aspect ratios in percent.
+
+        Returns:
+            List[Tyre]: The matching tyres.
+        """
+        result: List[Tyre] = []
+        for bucket, low, high in self._spans(rim_size, widths, aspect_ratios):
+            result.extend(bucket.tyres[low:high])
+        return result
+
+    def count(
+        self,
+        rim_size: Optional[int] = None,
+        widths: Range = None,
+        aspect_ratios: Range = None,
+    ) -> int:
+        """
+        Returns the number of tyres a query would return, without building the list.
+
+        Parameters:
+            rim_size (Optional[int]): The necessary rim size in inches, None for all.
+            widths (Range): The inclusive range of widths in millimeters.
+            aspect_ratios (Range): The inclusive range of aspect ratios in percent.
+
+        Returns:
+            int: The number of matching tyres.
+        """
+        return sum(
+            high - low
+            for _, low, high in self._spans(rim_size, widths, aspect_ratios)
+        )
+
+    def fitting(
+        self, rim: Rim, widths: Range = None, aspect_ratios: Range = None
+    ) -> List[Tyre]:
+        """
+        Returns the tyres that fit a rim within width and aspect ratio ranges.
+
+        Parameters:
+            rim (Rim): The rim to fit.
+            widths (Range): The inclusive range of widths in millimeters.
+            aspect_ratios (Range): The inclusive range of aspect ratios in percent.
+
+        Returns:
+            List[Tyre]: The matching tyres.
+
+        Raises:
+            TypeError: If the provided object is not a rim.
+        """
+        if not isinstance(rim, Rim):
+            raise TypeError("Provided object must be a rim")
+        return self.query(rim_inch_size(rim), widths, aspect_ratios)
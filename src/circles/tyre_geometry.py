@@ -0,0 +1,218 @@
+"""
+Module for computing the geometry implied by tyre labels over whole columns.
+
+A tyre label fixes the outer diameter of the tyre: the rim diameter plus two sidewalls,
+each as high as the width times the aspect ratio. This module computes sidewall
+heights, outer diameters and circumferences for columns of widths, aspect ratios and
+rim sizes, for example the columns of a `TyreArray` or of a memory-mapped catalogue,
+and flags tyres whose radius does not match their label.
+
+The column functions are pipelines of `map` over `operator` functions, so the loop
+over the rows runs in C without executing Python bytecode per row. Labels are parsed
+once per distinct label. All lengths are in millimeters.
+"""
+
+from __future__ import annotations
+from array import array
+from itertools import compress, repeat
+import math
+from operator import add, gt, mul, sub, truediv
+from typing import Dict, Iterable, Sequence, Tuple, Union
+
+from circles.conversion import MM_PER_INCH
+from circles.tyre import Tyre, parse_tyre_label
+
+Number = Union[int, float]
+
+
+def sidewall_height(width: Number, aspect_ratio: Number) -> float:
+    """
+    Returns the sidewall height of a tyre.
+
+    Parameters:
+        width (Number): The tyre width in millimeters.
+        aspect_ratio (Number): The height-to-width ratio in percent.
+
+    Returns:
+        float: The sidewall height in millimeters.
+    """
+    return width * aspect_ratio / 100
+
+
+def outer_diameter(width: Number, aspect_ratio: Number, rim_size: Number) -> float:
+    """
+    Returns the outer diameter of a tyre implied by its label fields.
+
+    Parameters:
+        width (Number): The tyre width in millimeters.
+        aspect_ratio (Number): The height-to-width ratio in percent.
+        rim_size (Number): The rim diameter in inches.
+
+    Returns:
+        float: The outer diameter in millimeters.
+    """
+    return width * aspect_ratio / 50 + rim_size * MM_PER_INCH
+
+
+def label_outer_diameter(tyre_label: str) -> float:
+    """
+    Returns the outer diameter implied by a tyre label.
+
+    Parameters:
+        tyre_label (str): The tyre label, for example "225/45R17".
+
+    Returns:
+        float: The outer diameter in millimeters.
+
+    Raises:
+        ValueError: If tyre_label is not a string or is not a valid tyre label.
+    """
+    return outer_diameter(*parse_tyre_label(tyre_label))
+
+
+def label_columns(tyre_labels: Iterable[str]) -> Tuple[array, array, array]:
+    """
+    Splits tyre labels into width, aspect ratio and rim size columns, parsing every
+    distinct label once.
+
+    Parameters:
+        tyre_labels (Iterable[str]): The tyre labels.
+
+    Returns:
+        Tuple[array, array, array]: The widths, aspect ratios and rim sizes.
+
+    Raises:
+        ValueError: If a label is not a string or is not a valid tyre label.
+    """
+    tyre_labels = list(tyre_labels)
+    widths: Dict[str, int] = {}
+    aspect_ratios: Dict[str, int] = {}
+    rim_sizes: Dict[str, int] = {}
+    for tyre_label in set(tyre_labels):
+        fields = parse_tyre_label(tyre_label)
+        widths[tyre_label], aspect_ratios[tyre_label], rim_sizes[tyre_label] = fields
+    return (
+        array("i", map(widths.__getitem__, tyre_labels)),
+        array("i", map(aspect_ratios.__getitem__, tyre_labels)),
+        array("i", map(rim_sizes.__getitem__, tyre_labels)),
+    )
+
+
+def sidewall_heights(
+    widths: Sequence[Number], aspect_ratios: Sequence[Number]
+) -> array:
+    """
+    Returns the sidewall heights of a column of tyres.
+
+    Parameters:
+        widths (Sequence[Number]): The tyre widths in millimeters.
+        aspect_ratios (Sequence[Number]): The aspect ratios in percent.
+
+    Returns:
+        array: The sidewall heights in millimeters.
+    """
+    return array("d", map(truediv, map(mul, widths, aspect_ratios), repeat(100)))
+
+
+def outer_diameters(
+    widths: Sequence[Number],
+    aspect_ratios: Sequence[Number],
+    rim_sizes: Sequence[Number],
+) -> array:
+    """
+    Returns the outer diameters implied by a column of tyre label fields.
+
+    Parameters:
+        widths (Sequence[Number]): The tyre widths in millimeters.
+        aspect_ratios (Sequence[Number]): The aspect ratios in percent.
+        rim_sizes (Sequence[Number]): The rim sizes in inches.
+
+    Returns:
+        array: The outer diameters in millimeters.
+    """
+    return array(
+        "d",
+        map(
+            add,
+            map(truediv, map(mul, widths, aspect_ratios), repeat(50)),
+            map(mul, rim_sizes, repeat(MM_PER_INCH)),
+        ),
+    )
+
+
+def circumferences(diameters: Sequence[Number]) -> array:
+    """
+    Returns the circumferences of a column of diameters.
+
+    Parameters:
+        diameters (Sequence[Number]): The diameters in millimeters.
+
+    Returns:
+        array: The circumferences in millimeters.
+    """
+    return array("d", map(mul, diameters, repeat(math.pi)))
+
+
+def label_outer_diameters(tyre_labels: Iterable[str]) -> array:
+    """
+    Returns the outer diameters implied by tyre labels.
+
+    Parameters:
+        tyre_labels (Iterable[str]): The tyre labels.
+
+    Returns:
+        array: The outer diameters in millimeters.
+
+    Raises:
+        ValueError: If a label is not a string or is not a valid tyre label.
+    """
+    return outer_diameters(*label_columns(tyre_labels))
+
+
+def radius_mismatches(
+    radii: Sequence[Number], diameters: Sequence[Number], tolerance: float
+) -> array:
+    """
+    Returns the rows whose diameter, twice the radius, differs from the expected
+    diameter by more than a tolerance.
+
+    Parameters:
+        radii (Sequence[Number]): The radii in millimeters.
+        diameters (Sequence[Number]): The expected diameters in millimeters.
+        tolerance (float): The largest accepted difference in millimeters.
+
+    Returns:
+        array: The indexes of the mismatching rows, typecode "q".
+
+    Raises:
+        ValueError: If the columns differ in length or tolerance is negative.
+    """
+    if len(radii) != len(diameters):
+        raise ValueError("The number of radii must match the number of diameters")
+    if tolerance < 0:
+        raise ValueError("The tolerance must not be negative")
+    differences = map(abs, map(sub, map(mul, radii, repeat(2)), diameters))
+    flags = map(gt, differences, repeat(tolerance))
+    return array("q", compress(range(len(radii)), flags))
+
+
+def tyre_mismatches(tyres: Iterable[Tyre], tolerance: float) -> list:
+    """
+    Returns the tyres whose radius doesn't match the outer diameter implied by their
+    label fields.
+
+    Parameters:
+        tyres (Iterable[Tyre]): The tyres to check.
+        tolerance (float): The largest accepted diameter difference in millimeters.
+
+    Returns:
+        list: The mismatching tyres in input order.
+    """
+    tyres = list(tyres)
+    diameters = outer_diameters(
+        [tyre.tyre_size for tyre in tyres],
+        [tyre.aspect_ratio for tyre in tyres],
+        [tyre.necessary_rim_size for tyre in tyres],
+    )
+    radii = [tyre.get_radius() for tyre in tyres]
+    return [tyres[index] for index in radius_mismatches(radii, diameters, tolerance)]
@@ -0,0 +1,232 @@
+"""
+Module for validating circle-like object data without constructing objects.
+
+The constructors of `Tyre`, `Pizza` and `Wheel` print a message before raising an
+exception. This module applies the same rules quietly: every check returns a `Reason`
+code instead of printing or raising, and the batch functions return a
+`ValidationReport` with one code per input row and a structured error for each
+invalid row.
+"""
+
+from __future__ import annotations
+from array import array
+from enum import IntEnum
+import math
+from typing import Iterable, List, NamedTuple, Tuple, Union
+
+from circles.conversion import fits
+from circles.rim import Rim
+from circles.tyre import Tyre, try_parse_tyre_label
+
+
+class Reason(IntEnum):
+    """
+    Reason codes for validation failures. OK marks valid data.
+    """
+
+    OK = 0
+    RADIUS_TYPE = 1
+    RADIUS_NOT_POSITIVE = 2
+    LABEL_TYPE = 3
+    LABEL_FORMAT = 4
+    INGREDIENTS_TYPE = 5
+    COMPONENT_TYPE = 6
+    SIZE_MISMATCH = 7
+    RADIUS_NOT_FINITE = 8
+
+
+MESSAGES = {
+    Reason.OK: "",
+    Reason.RADIUS_TYPE: "The data must be a float or an int",
+    Reason.RADIUS_NOT_POSITIVE: "The data must be greater than zero",
+    Reason.LABEL_TYPE: "Tyre label must be a string",
+    Reason.LABEL_FORMAT: (
+        "Label data must be compatible with standard tire size designation"
+    ),
+    Reason.INGREDIENTS_TYPE: "Ingredients value must be a list",
+    Reason.COMPONENT_TYPE: "Incorrect wheel arguments data",
+    Reason.SIZE_MISMATCH: "Rim and Tyre size doesn't match",
+    Reason.RADIUS_NOT_FINITE: "The data must be a finite number",
+}
+
+
+class ValidationError(NamedTuple):
+    """
+    A row that failed validation.
+
+    Attributes:
+        index (int): The position of the row in the input.
+        reason (Reason): The reason code of the failure.
+        message (str): The human-readable description of the reason.
+    """
+
+    index: int
+    reason: Reason
+    message: str
+
+
+class ValidationReport(NamedTuple):
+    """
+    The outcome of a batch validation.
+
+    Attributes:
+        codes (array): One reason code per input row, 0 for valid rows.
+        errors (List[ValidationError]): The invalid rows in input order.
+    """
+
+    codes: array
+    errors: List[ValidationError]
+
+    @property
+    def valid(self) -> bool:
+        """
+        Returns True if every row is valid.
+        """
+        return not self.errors
+
+
+def check_radius(radius: Union[int, float]) -> Reason:
+    """
+    Checks a radius with the same rules as `Circle.validate_data`, also rejecting
+    infinite and NaN radii and integers too large for a float, which cannot be
+    converted to inches.
+
+    Parameters:
+        radius (Union[int, float]): The radius to check.
+
+    Returns:
+        Reason: OK or the reason the radius is invalid.
+    """
+    if not isinstance(radius, (float, int)):
+        return Reason.RADIUS_TYPE
+    try:
+        finite = math.isfinite(radius)
+    except OverflowError:
+        finite = False
+    if not finite:
+        return Reason.RADIUS_NOT_FINITE
+    if radius <= 0:
+        return Reason.RADIUS_NOT_POSITIVE
+    return Reason.OK
+
+
+def check_tyre(radius: Union[int, float], tyre_label: str) -> Reason:
+    """
+    Checks the arguments of `Tyre`.
+
+    Parameters:
+        radius (Union[int, float]): The radius of the tyre in millimeters.
+        tyre_label (str): The tyre label.
+
+    Returns:
+        Reason: OK or the reason the arguments are invalid.
+    """
+    reason = check_radius(radius)
+    if reason:
+        return reason
+    if not isinstance(tyre_label, str):
+        return Reason.LABEL_TYPE
+    if try_parse_tyre_label(tyre_label) is None:
+        return Reason.LABEL_FORMAT
+    return Reason.OK
+
+
+def check_pizza(radius: Union[int, float], ingredients: list) -> Reason:
+    """
+    Checks the arguments of `Pizza`.
+
+    Parameters:
+        radius (Union[int, float]): The radius of the pizza in centimeters.
+        ingredients (list): The pizza ingredients.
+
+    Returns:
+        Reason: OK or the reason the arguments are invalid.
+    """
+    reason = check_radius(radius)
+    if reason:
+        return reason
+    if not isinstance(ingredients, list):
+        return Reason.INGREDIENTS_TYPE
+    return Reason.OK
+
+
+def check_wheel(tyre: Tyre, rim: Rim) -> Reason:
+    """
+    Checks the arguments of `Wheel`, `Wheel.change_tyre` and `Wheel.change_rim`.
+
+    Parameters:
+        tyre (Tyre): The tyre component.
+        rim (Rim): The rim component.
+
+    Returns:
+        Reason: OK or the reason the components cannot form a wheel.
+    """
+    if not isinstance(tyre, Tyre) or not isinstance(rim, Rim):
+        return Reason.COMPONENT_TYPE
+    if not fits(tyre.necessary_rim_size, rim.diameter_inches):
+        return Reason.SIZE_MISMATCH
+    return Reason.OK
+
+
+def _report(reasons: Iterable[Reason]) -> ValidationReport:
+    codes = array("B")
+    errors = []
+    for index, reason in enumerate(reasons):
+        codes.append(reason)
+        if reason:
+            errors.append(ValidationError(index, reason, MESSAGES[reason]))
+    return ValidationReport(codes, errors)
+
+
+def validate_rims(radii: Iterable[Union[int, float]]) -> ValidationReport:
+    """
+    Validates the radii of many rims.
+
+    Parameters:
+        radii (Iterable[Union[int, float]]): The rim radii in millimeters.
+
+    Returns:
+        ValidationReport: The reason codes and errors.
+    """
+    return _report(check_radius(radius) for radius in radii)
+
+
+def validate_tyres(rows: Iterable[Tuple[Union[int, float], str]]) -> ValidationReport:
+    """
+    Validates many (radius, tyre label) rows.
+
+    Parameters:
+        rows (Iterable[Tuple[Union[int, float], str]]): The tyre arguments.
+
+    Returns:
+        ValidationReport: The reason codes and errors.
+    """
+    return _report(check_tyre(radius, tyre_label) for radius, tyre_label in rows)
+
+
+def validate_pizzas(
+    rows: Iterable[Tuple[Union[int, float], list]]
+) -> ValidationReport:
+    """
+    Validates many (radius, ingredients) rows.
+
+    Parameters:
+        rows (Iterable[Tuple[Union[int, float], list]]): The pizza arguments.
+
+    Returns:
+        ValidationReport: The reason codes and errors.
+    """
+    return _report(check_pizza(radius, ingredients) for radius, ingredients in rows)
+
+
+def validate_wheels(pairs: Iterable[Tuple[Tyre, Rim]]) -> ValidationReport:
+    """
+    Validates many (tyre, rim) pairs.
+
+    Parameters:
+        pairs (Iterable[Tuple[Tyre, Rim]]): The wheel components.
+
+    Returns:
+        ValidationReport: The reason codes and errors.
+    """
+    return _report(check_wheel(tyre, rim) for tyre, rim in pairs)
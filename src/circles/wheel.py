@@ -12,6 +12,7 @@ from typing import Union
 
 
 from circles.circle import Circle
+from circles.conversion import fits
 from circles.rim import Rim
 from circles.tyre import Tyre
 
@@ -27,6 +28,8 @@ class Wheel(Circle):
 
     """
 
+    __slots__ = ("tyre", "rim")
+
     def __init__(self, tyre: Tyre, rim: Rim) -> None:
         """
         Initializes a Wheel object and ensures the compatibility between the tyre
@@ -65,7 +68,7 @@ class Wheel(Circle):
              of the 'Tyre' class
         """
         if isinstance(new_tyre, Tyre):
-            if new_tyre.necessary_rim_size == int(round(self.rim.diameter_inches, 0)):
+            if fits(new_tyre.necessary_rim_size, self.rim.diameter_inches):
                 self.tyre = new_tyre
             else:
                 print("The new tyre doesn't match the rim")
@@ -87,7 +90,7 @@ class Wheel(Circle):
              of the 'Rim' class
         """
         if isinstance(new_rim, Rim):
-            if new_rim.diameter_inches == self.tyre.necessary_rim_size:
+            if fits(self.tyre.necessary_rim_size, new_rim.diameter_inches):
                 self.rim = new_rim
             else:
                 print("The new rim doesn't match the tire")
@@ -96,6 +99,21 @@ class Wheel(Circle):
             print("Provided object must be a rim")
             raise TypeError
 
+    def spec_key(self) -> tuple:
+        """
+        Returns the canonical value key of the wheel.
+
+        Returns:
+            tuple: Wheel, the rounded radius and the keys of the tyre and the rim.
+        """
+        return Wheel, self._spec_radius(), self.tyre.spec_key(), self.rim.spec_key()
+
+    def _get_state(self) -> tuple:
+        return self.tyre, self.rim
+
+    def _set_state(self, state: tuple) -> None:
+        self.tyre, self.rim = state
+
     def verify_rim_size(self) -> bool:
         """
         Checks if the tyre fits properly on the rim.
@@ -103,7 +121,7 @@ class Wheel(Circle):
         Returns:
             bool: True if the rim and tyre sizes match otherwise, False.
         """
-        return self.tyre.necessary_rim_size == int(round(self.rim.diameter_inches, 0))
+        return fits(self.tyre.necessary_rim_size, self.rim.diameter_inches)
 
     @classmethod
     def create_from_diameter(
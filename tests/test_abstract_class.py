@@ -7,9 +7,12 @@ Date: 2023-11-06
 Version: 1.0
 """
 
+import pickle
+
 import pytest
 
 
+from circles.circle import Circle
 from circles.pizza import Pizza
 from circles.rim import Rim
 from circles.tyre import Tyre
@@ -170,3 +173,86 @@ def test_name_mangling():
     with pytest.raises(AttributeError):
         pizza_no_ingredients_int = Pizza(2, [])
         print(pizza_no_ingredients_int.__radius)
+
+
+def test_slotted_layout(child_classes):
+    """
+    Tests that no subclass instance carries a per-instance __dict__ and that
+    undeclared attributes cannot be set.
+
+    Args:
+        child_classes (list): Fixture providing subclass instances.
+    """
+    for obj in child_classes:
+        assert not hasattr(obj, "__dict__")
+        with pytest.raises(AttributeError):
+            obj.unknown_attribute = 1
+
+
+def test_cached_values_follow_diameter_changes(child_classes):
+    """
+    Tests that cached areas and diameters, and the values subclasses derive from
+    the radius, are refreshed after the diameter changes.
+
+    Args:
+        child_classes (list): Fixture providing subclass instances.
+    """
+    for obj in child_classes:
+        assert obj.get_area() == obj.get_area()
+        obj.change_diameter(100)
+        assert obj.get_diameter() == 100
+        assert obj.get_area() == pytest.approx(7853.98, rel=1e-5)
+    pizza, rim = child_classes[0], child_classes[2]
+    assert pizza.size == "large"
+    assert rim.diameter_inches == 3.94
+
+
+def test_pickle_round_trip(child_classes):
+    """
+    Tests that pickled subclass instances keep their radius and attributes, including
+    a changed wheel diameter and attributes changed by hand.
+
+    Args:
+        child_classes (list): Fixture providing subclass instances.
+    """
+    wheel = child_classes[-1]
+    wheel.change_diameter(1700)
+    child_classes[2].diameter_inches = 1
+    for obj in child_classes:
+        copy = pickle.loads(pickle.dumps(obj))
+        assert type(copy) is type(obj)
+        assert copy.get_radius() == obj.get_radius()
+        assert copy.get_area() == obj.get_area()
+        for attribute in type(obj).__slots__:
+            value = getattr(obj, attribute)
+            if isinstance(value, Circle):
+                assert getattr(copy, attribute).get_radius() == value.get_radius()
+            else:
+                assert getattr(copy, attribute) == value
+    copy = pickle.loads(pickle.dumps(wheel))
+    assert copy.get_diameter() == 1700
+    assert copy.tyre.tyre_label == "235/19R19" and copy.verify_rim_size()
+    assert pickle.loads(pickle.dumps(child_classes[2])).diameter_inches == 1
+
+
+def test_value_equality(child_classes):
+    """
+    Tests that subclass instances compare and hash by value, with radii differing
+    only by floating point error treated as equal.
+
+    Args:
+        child_classes (list): Fixture providing subclass instances.
+    """
+    pizza_int, pizza_float = child_classes[0], child_classes[1]
+    assert pizza_int == pizza_float and hash(pizza_int) == hash(pizza_float)
+    assert Rim(0.1 + 0.2) == Rim(0.3) and hash(Rim(0.1 + 0.2)) == hash(Rim(0.3))
+    assert Rim(12) != Rim(12.01)
+    assert Tyre(130, "123/21R21") == child_classes[4]
+    assert Tyre(130, "123/21R21") != Tyre(130, "123/21R21 80H")
+    assert Pizza(2, ["cheese"]) != pizza_int
+    assert Pizza(12, []) != Rim(12) and Rim(12) != 12
+    wheel = child_classes[-1]
+    copy = pickle.loads(pickle.dumps(wheel))
+    assert copy == wheel and len({wheel, copy}) == 1
+    copy.change_diameter(1700)
+    assert copy != wheel
@@ -0,0 +1,97 @@
+"""
+Module for testing the bulk wheel assembly in the 'assembly' module, both in the
+calling process and in a process pool.
+"""
+
+import pytest
+
+from circles.assembly import AssemblyFailure, assemble_wheel, assemble_wheels
+from circles.pizza import Pizza
+from circles.rim import Rim
+from circles.tyre import Tyre
+from circles.wheel import Wheel
+
+
+@pytest.fixture
+def pairs():
+    """
+    Fixture mixing objects, raw specs and invalid pairs.
+
+    Returns:
+        list: (tyre, rim) pairs, where pairs 2, 4 and 5 cannot be assembled.
+    """
+    return [
+        (Tyre(800, "235/19R19"), Rim(241.3)),
+        ((800, "235/19R19"), 241.3),
+        ((800, "235/19R17"), 241.3),
+        ((800, "225/45R17"), Rim(215.9)),
+        ((800, "235/19T19"), 241.3),
+        (Rim(241.3), Rim(241.3)),
+    ]
+
+
+def test_assemble_wheel():
+    """
+    Tests assembling a single wheel from raw specs.
+    """
+    wheel = assemble_wheel((800, "235/19R19"), 241.3)
+    assert isinstance(wheel, Wheel)
+    assert wheel.get_radius() == 800
+    with pytest.raises(TypeError):
+        assemble_wheel((800, "235/19R19"), Pizza(20, []))
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_assemble_wheels(pairs, max_workers, capsys):
+    """
+    Tests that valid pairs are assembled in order with their input indices, invalid
+    pairs are reported and nothing is printed.
+
+    Parameters:
+        pairs (list): Fixture providing the pairs.
+        max_workers (int): The number of worker processes.
+        capsys (pytest fixture): A pytest fixture for capturing standard output.
+    """
+    result = assemble_wheels(pairs, chunk_size=2, max_workers=max_workers)
+    assert [index for index, _ in result.wheels] == [0, 1, 3]
+    assert [wheel.tyre.tyre_size for _, wheel in result.wheels] == [235, 235, 225]
+    assert [failure.index for failure in result.failures] == [2, 4, 5]
+    assert result.failures[0] == AssemblyFailure(
+        2, "ValueError", "Rim and Tyre size doesn't match"
+    )
+    assert result.failures[2].error == "TypeError"
+    assert capsys.readouterr().out == ""
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_malformed_pairs(pairs, max_workers):
+    """
+    Tests that malformed pairs are reported as failures of their own index without
+    affecting the valid pairs of the same chunk.
+
+    Parameters:
+        pairs (list): Fixture providing the pairs.
+        max_workers (int): The number of worker processes.
+    """
+    pairs[2:2] = [None, (Tyre(800, "235/19R19"), Rim(241.3), Rim(241.3)), ()]
+    result = assemble_wheels(pairs, chunk_size=4, max_workers=max_workers)
+    assert [index for index, _ in result.wheels] == [0, 1, 6]
+    assert [failure.index for failure in result.failures] == [2, 3, 4, 5, 7, 8]
+    assert [failure.error for failure in result.failures[:3]] == [
+        "TypeError",
+        "ValueError",
+        "ValueError",
+    ]
+
+
+def test_incorrect_arguments(pairs):
+    """
+    Tests that invalid chunk sizes and worker counts are rejected.
+
+    Parameters:
+        pairs (list): Fixture providing the pairs.
+    """
+    with pytest.raises(ValueError):
+        assemble_wheels(pairs, chunk_size=0)
+    with pytest.raises(ValueError):
+        assemble_wheels(pairs, max_workers=0)
@@ -0,0 +1,104 @@
+"""
+Module for testing saving and memory-mapping columnar catalogue files with the
+'catalogue' module.
+"""
+
+import pytest
+
+from circles.catalogue import load_catalogue, save_catalogue
+from circles.pizza import Pizza
+from circles.rim import Rim
+from circles.tyre import Tyre
+from circles.wheel import Wheel
+
+
+@pytest.fixture
+def path(tmp_path):
+    """
+    Fixture writing a catalogue with two rims, two tyres, one pizza and two wheels,
+    one of them built from components that are not in the rim and tyre lists.
+
+    Parameters:
+        tmp_path (Path): A pytest fixture providing a temporary directory.
+
+    Returns:
+        Path: The path of the catalogue file.
+    """
+    rims = [Rim(241.3), Rim(215.9)]
+    tyres = [Tyre(800, "235/19R19"), Tyre(300, "205/55R17")]
+    wheels = [Wheel(tyres[0], rims[0]), Wheel(Tyre(310.5, "225/45R17"), Rim(216))]
+    path = tmp_path / "catalogue.bin"
+    save_catalogue(path, rims, tyres, [Pizza(41, ["cheese"])], wheels)
+    return path
+
+
+def test_columns(path):
+    """
+    Tests the stored column values, including appended wheel components.
+
+    Parameters:
+        path (Path): Fixture providing the catalogue file.
+    """
+    with load_catalogue(path) as catalogue:
+        assert list(catalogue.rims.radius) == [241.3, 215.9, 216]
+        assert list(catalogue.rims.diameter_inches) == [19.0, 17.0, 17.01]
+        assert list(catalogue.tyres.width) == [235, 205, 225]
+        assert list(catalogue.tyres.aspect_ratio) == [19, 55, 45]
+        assert list(catalogue.tyres.rim_size) == [19, 17, 17]
+        assert list(catalogue.pizzas.radius) == [41]
+        assert list(catalogue.wheels.tyre_index) == [0, 2]
+        assert list(catalogue.wheels.rim_index) == [0, 2]
+
+
+def test_objects(path):
+    """
+    Tests building objects from the mapped rows.
+
+    Parameters:
+        path (Path): Fixture providing the catalogue file.
+    """
+    with load_catalogue(path) as catalogue:
+        assert catalogue.tyre(1).tyre_label == "205/55R17"
+        assert catalogue.rim(1).diameter_inches == 17.0
+        assert catalogue.pizza(0).size == "large"
+        wheel = catalogue.wheel(1)
+        assert wheel.get_radius() == 310.5
+        assert wheel.tyre.tyre_size == 225
+        assert wheel.verify_rim_size()
+
+
+def test_invalid_file(tmp_path, path):
+    """
+    Tests that foreign and truncated files are rejected.
+
+    Parameters:
+        tmp_path (Path): A pytest fixture providing a temporary directory.
+        path (Path): Fixture providing the catalogue file.
+    """
+    foreign = tmp_path / "foreign.bin"
+    foreign.write_bytes(b"x" * 64)
+    with pytest.raises(ValueError):
+        load_catalogue(foreign)
+    truncated = tmp_path / "truncated.bin"
+    truncated.write_bytes(path.read_bytes()[:-8])
+    with pytest.raises(ValueError):
+        load_catalogue(truncated)
+
+
+def test_full_designations(tmp_path):
+    """
+    Tests that tyre labels are stored as written, so tyres and wheels with full
+    designations load back equal to the saved ones and repeated labels share a row.
+
+    Parameters:
+        tmp_path (Path): A pytest fixture providing a temporary directory.
+    """
+    tyres = [Tyre(320, "P225/45ZR17 94W"), Tyre(330, "P225/45ZR17 94W")]
+    wheel = Wheel(Tyre(310.5, "LT265/70R17"), Rim(216))
+    path = tmp_path / "catalogue.bin"
+    save_catalogue(path, tyres=tyres, wheels=[wheel])
+    with load_catalogue(path) as catalogue:
+        assert list(catalogue.tyres.label) == [0, 0, 1]
+        assert catalogue.tyre(1) == tyres[1]
+        assert catalogue.tyre(0).designation.speed_rating == "W"
+        assert catalogue.wheel(0) == wheel
@@ -0,0 +1,70 @@
+"""
+Module for testing the batch geometry methods of the 'CircleArray' class and its
+typed variants, and the conversions to and from lists of circle objects.
+"""
+
+import pytest
+
+from circles.circle_array import CircleArray, PizzaArray, RimArray, TyreArray
+from circles.pizza import Pizza
+from circles.rim import Rim
+from circles.tyre import Tyre
+
+
+def test_areas_and_diameters():
+    """
+    Tests that the batched geometry methods match the per-object Circle methods.
+    """
+    rims = [Rim(12), Rim(12.4), Rim(241.3)]
+    rim_array = RimArray.from_circles(rims)
+    assert len(rim_array) == 3
+    for area, rim in zip(rim_array.areas(), rims):
+        assert area == pytest.approx(rim.get_area())
+    assert list(rim_array.diameters()) == [24, 24.8, 482.6]
+    assert list(rim_array.diameters_inches()) == [rim.diameter_inches for rim in rims]
+
+
+def test_change_diameter():
+    """
+    Tests changing the diameters with a single value and with one value per circle.
+    """
+    circles = CircleArray([1, 2, 3])
+    circles.change_diameter(8)
+    assert list(circles.radii) == [4, 4, 4]
+    circles.change_diameter([2, 4, 6])
+    assert list(circles.radii) == [1, 2, 3]
+
+
+def test_incorrect_values():
+    """
+    Tests that invalid radii and diameters raise the same exceptions as Circle.
+    """
+    with pytest.raises(ValueError):
+        CircleArray([1, 0])
+    with pytest.raises(TypeError):
+        CircleArray([1, "2"])
+    circles = CircleArray([1, 2])
+    with pytest.raises(ValueError):
+        circles.change_diameter([2])
+    with pytest.raises(ValueError):
+        circles.change_diameter(-2)
+    with pytest.raises(TypeError):
+        circles.to_circles()
+
+
+def test_round_trip():
+    """
+    Tests that typed arrays convert back to equivalent circle objects.
+    """
+    tyres = [Tyre(800, "235/19R19"), Tyre(130, "123/21R21")]
+    new_tyres = TyreArray.from_circles(tyres).to_circles()
+    assert [tyre.tyre_size for tyre in new_tyres] == [235, 123]
+    assert [tyre.get_radius() for tyre in new_tyres] == [800, 130]
+
+    pizzas = [Pizza(20, ["cheese"]), Pizza(41, [])]
+    new_pizzas = PizzaArray.from_circles(pizzas).to_circles()
+    assert [pizza.size for pizza in new_pizzas] == ["small", "large"]
+    assert new_pizzas[0].ingredients == ["cheese"]
+
+    with pytest.raises(ValueError):
+        TyreArray([800], [])
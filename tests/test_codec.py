@@ -0,0 +1,123 @@
+"""
+Module for testing the buffer encoding of the 'codec' module.
+"""
+
+import pickle
+
+import pytest
+
+from circles.codec import decode, encode
+from circles.pizza import Pizza
+from circles.rim import Rim
+from circles.specs import SpecRegistry
+from circles.tyre import Tyre
+from circles.wheel import Wheel
+
+
+@pytest.fixture
+def objects():
+    """
+    Fixture returning a mixed list with a wheel sharing its rim with the list.
+
+    Returns:
+        list: Rims, tyres, pizzas and wheels.
+    """
+    rim = Rim(241.3)
+    wheel = Wheel(Tyre(800, "235/19R19"), rim)
+    wheel.change_diameter(1700)
+    return [
+        rim,
+        Tyre(130, "123/21R21"),
+        Pizza(12, ["cheese", "ham"]),
+        wheel,
+        Pizza(30.5, []),
+        wheel,
+    ]
+
+
+def test_round_trip(objects):
+    """
+    Tests that decoded objects keep their types, radii and attributes.
+    """
+    decoded = decode(encode(objects))
+    assert [type(obj) for obj in decoded] == [type(obj) for obj in objects]
+    for copy, original in zip(decoded, objects):
+        assert copy.get_radius() == original.get_radius()
+        assert copy.get_area() == pytest.approx(original.get_area())
+    assert decoded[0].diameter_inches == 19.0
+    assert decoded[1].tyre_label == "123/21R21"
+    assert decoded[1].necessary_rim_size == 21
+    assert decoded[2].ingredients == ["cheese", "ham"]
+    assert decoded[2].size == "small" and decoded[4].size == "medium"
+    wheel = decoded[3]
+    assert wheel.get_diameter() == 1700
+    assert wheel.rim is decoded[0] and decoded[5] is wheel
+    assert wheel.verify_rim_size()
+
+
+def test_int_radii_stay_ints():
+    """
+    Tests that int radii are decoded as ints and float radii as floats.
+    """
+    rim = Rim(12)
+    objects = [rim, Rim(12.0), Tyre(300, "205/55R16"), Pizza(2**53, [])]
+    objects.append(Wheel(objects[2], Rim(203.2)))
+    decoded = decode(encode(objects))
+    radii = [circle.get_radius() for circle in decoded]
+    assert radii == [12, 12.0, 300, 2**53, 300]
+    assert [type(radius) for radius in radii] == [int, float, int, int, int]
+    assert decoded[4].tyre is decoded[2]
+    assert decoded == objects
+    with pytest.raises(ValueError):
+        encode([Rim(2**53 + 1)])
+
+
+def test_frozen_objects():
+    """
+    Tests that shared frozen rims and tyres are encoded and decode to equal plain
+    objects, still shared between wheels.
+    """
+    registry = SpecRegistry()
+    wheels = [registry.wheel(600, "205/55R16", 406.4) for _ in range(2)]
+    decoded = decode(encode([registry.rim(406.4), *wheels]))
+    assert type(decoded[0]) is Rim and type(decoded[1].tyre) is Tyre
+    assert decoded[1].rim is decoded[0] and decoded[2].tyre is decoded[1].tyre
+    assert decoded == [registry.rim(406.4), *wheels]
+
+
+def test_changed_attributes(objects):
+    """
+    Tests that attributes changed by hand survive the round trip.
+    """
+    objects[0].diameter_inches = 18.5
+    objects[1].necessary_rim_size = 17
+    objects[2].size = "party"
+    decoded = decode(encode(objects))
+    assert decoded[0].diameter_inches == 18.5
+    assert decoded[1].necessary_rim_size == 17
+    assert decoded[1].tyre_size == 123
+    assert decoded[2].size == "party"
+
+
+def test_smaller_than_pickle():
+    """
+    Tests that a batch of wheels encodes smaller than it pickles.
+    """
+    wheels = [Wheel(Tyre(800 + i, "235/19R19"), Rim(241.3)) for i in range(1000)]
+    assert len(encode(wheels)) < len(pickle.dumps(wheels, pickle.HIGHEST_PROTOCOL))
+    assert decode(encode([])) == []
+
+
+def test_invalid_input():
+    """
+    Tests that unsupported objects and corrupt buffers are rejected.
+    """
+    with pytest.raises(TypeError):
+        encode(["235/19R19"])
+    with pytest.raises(TypeError):
+        encode([Pizza(12, ["cheese", 7])])
+    data = encode([Pizza(12, ["cheese"])])
+    with pytest.raises(ValueError):
+        decode(b"not a buffer")
+    with pytest.raises(ValueError):
+        decode(data[:-4])
@@ -0,0 +1,119 @@
+"""
+Module for testing the sorted queries of the 'collection' module.
+"""
+
+import random
+import statistics
+
+import pytest
+
+from circles.circle import Circle
+from circles.collection import CircleCollection
+from circles.pizza import Pizza
+from circles.rim import Rim
+from circles.specs import FrozenRim
+from circles.tyre import Tyre
+from circles.wheel import Wheel
+
+
+def _mixed(seed=3, size=300):
+    generator = random.Random(seed)
+    circles = []
+    for index in range(size):
+        radius = generator.choice(
+            [generator.randrange(1, 400), generator.random() * 400 or 1]
+        )
+        kind = index % 3
+        if kind == 0:
+            circles.append(Pizza(radius, []))
+        elif kind == 1:
+            circles.append(Rim(radius))
+        else:
+            circles.append(Tyre(radius, "205/55R16"))
+    circles.append(Wheel(Tyre(300, "205/55R16"), Rim(203.2)))
+    return circles
+
+
+def test_range_queries_match_scans():
+    """
+    Tests radius, diameter and area ranges against full scans, per class and over
+    all classes.
+    """
+    circles = _mixed()
+    collection = CircleCollection(circles[:100])
+    collection.extend(circles[100:])
+    assert len(collection) == len(circles)
+    for kind in (None, Pizza, Rim, Tyre, Wheel, Circle):
+        members = [c for c in circles if kind is None or isinstance(c, kind)]
+        for low, high in ((0, 50), (100, 250.5), (300, 300), (500, 900)):
+            found = collection.between(low, high, kind=kind)
+            expected = [c for c in members if low <= c.get_radius() <= high]
+            assert sorted(map(id, found)) == sorted(map(id, expected))
+            radii = [c.get_radius() for c in found]
+            assert radii == sorted(radii)
+            assert collection.count_between(low, high, kind=kind) == len(expected)
+            found = collection.between(2 * low, 2 * high, "diameter", kind)
+            assert len(found) == len(expected)
+        area_low, area_high = circles[5].get_area(), circles[7].get_area()
+        area_low, area_high = min(area_low, area_high), max(area_low, area_high)
+        expected = [c for c in members if area_low <= c.get_area() <= area_high]
+        found = collection.between(area_low, area_high, "area", kind)
+        assert sorted(map(id, found)) == sorted(map(id, expected))
+    with pytest.raises(ValueError):
+        collection.between(1, 2, "volume")
+
+
+def test_top_k_and_quantiles():
+    """
+    Tests the largest and smallest circles and quantiles against sorting and the
+    statistics module.
+    """
+    circles = _mixed(seed=5)
+    collection = CircleCollection(circles)
+    by_radius = sorted(circles, key=lambda circle: circle.get_radius())
+    largest = collection.largest(10)
+    assert [c.get_radius() for c in largest] == [
+        c.get_radius() for c in by_radius[::-1][:10]
+    ]
+    rims = [c for c in by_radius if type(c) is Rim]
+    assert collection.largest(5, Rim) == rims[::-1][:5]
+    assert collection.smallest(5, Rim) == rims[:5]
+    assert collection.largest(0) == []
+    assert len(collection.largest(10**6)) == len(circles)
+    radii = [c.get_radius() for c in rims]
+    expected = statistics.quantiles(radii, n=4, method="inclusive")
+    assert collection.quantiles([0.25, 0.5, 0.75], kind=Rim) == pytest.approx(expected)
+    diameters = collection.quantiles([0, 1], "diameter", Rim)
+    assert diameters == [2 * radii[0], 2 * radii[-1]]
+    areas = [c.get_area() for c in circles]
+    assert collection.quantiles([0.5], "area") == [statistics.median(areas)]
+    by_class = collection.quantiles_by_class([0.5])
+    assert set(by_class) == {Pizza, Rim, Tyre, Wheel}
+    assert by_class[Rim] == [statistics.median(radii)]
+    with pytest.raises(ValueError):
+        collection.quantiles([1.5])
+    with pytest.raises(ValueError):
+        CircleCollection().quantiles([0.5])
+
+
+def test_insert_rebuild_and_subclasses():
+    """
+    Tests merging later inserts, rebuilding after a diameter change and querying
+    frozen subclasses through their base class.
+    """
+    collection = CircleCollection([Rim(10), Rim(30)])
+    assert collection.count_between(0, 100) == 2
+    collection.add(Rim(20))
+    collection.extend([Rim(40), Rim(50)])
+    assert [c.get_radius() for c in collection.between(0, 100)] == [10, 20, 30, 40, 50]
+    changed = collection.smallest(1)[0]
+    changed.change_diameter(120)
+    collection.rebuild()
+    assert collection.largest(1) == [changed] and changed in collection.between(60, 60)
+    frozen = FrozenRim.create_from_diameter(70)
+    collection.add(frozen)
+    assert collection.classes() == [Rim, FrozenRim]
+    assert collection.between(35, 35, kind=Rim) == [frozen]
+    assert collection.between(35, 35, kind=FrozenRim) == [frozen]
+    with pytest.raises(TypeError):
+        collection.add(12)
@@ -0,0 +1,91 @@
+"""
+Module for testing the millimeter and inch conversions of the 'conversion' module.
+"""
+
+from array import array
+
+import pytest
+
+from circles.conversion import (
+    STANDARD_RIM_DIAMETERS,
+    fits,
+    inches_to_rim_size,
+    mm_to_centi_inches,
+    mm_to_centi_inches_array,
+    mm_to_inches,
+    mm_to_inches_array,
+    mm_to_rim_size,
+    mm_to_rim_sizes,
+)
+
+
+def test_mm_to_inches():
+    """
+    Tests scalar conversions against rounding the float division, which differs
+    only near ties.
+    """
+    for mm_value in (24, 24.8, 100, 482.6, 1000.123, 469.9, 495.3):
+        assert mm_to_inches(mm_value) == round(mm_value / 25.4, 2)
+    assert mm_to_inches(4.191) == 0.16 and round(4.191 / 25.4, 2) == 0.17
+    assert mm_to_centi_inches(482.6) == 1900
+    assert mm_to_centi_inches(12.7) == 50
+    assert mm_to_rim_size(482.6) == 19
+
+
+def test_standard_rim_diameters():
+    """
+    Tests the precomputed diameters of the standard rim sizes.
+    """
+    assert STANDARD_RIM_DIAMETERS[482.6] == 19
+    for diameter, size in STANDARD_RIM_DIAMETERS.items():
+        assert mm_to_centi_inches(diameter) == 100 * size
+        assert mm_to_rim_size(diameter) == size
+
+
+def test_rounding_half_to_even():
+    """
+    Tests that exact ties are rounded half to even, like `round`.
+    """
+    assert mm_to_centi_inches(15.875) == 62
+    assert mm_to_centi_inches(47.625) == 188
+    assert mm_to_rim_size(469.9) == 18
+    assert mm_to_rim_size(444.5) == 18
+    assert inches_to_rim_size(18.5) == 18 and inches_to_rim_size(19.5) == 20
+    assert fits(19, 18.6) and fits(19, 19.49) and not fits(19, 19.5)
+
+
+def test_arrays():
+    """
+    Tests that batched conversions match the scalar ones.
+    """
+    values = [482.6, 100, 482.6, 469.9, 1000.123]
+    inches = mm_to_inches_array(values)
+    assert isinstance(inches, array) and inches.typecode == "d"
+    assert list(inches) == [mm_to_inches(value) for value in values]
+    assert list(mm_to_centi_inches_array(values)) == [
+        mm_to_centi_inches(value) for value in values
+    ]
+    assert list(mm_to_rim_sizes(values)) == [mm_to_rim_size(value) for value in values]
+    assert len(mm_to_inches_array([])) == 0
+
+
+@pytest.mark.parametrize(
+    "value, error",
+    [
+        (0, ValueError),
+        (-1, ValueError),
+        (float("inf"), ValueError),
+        (float("nan"), ValueError),
+        (10**400, ValueError),
+        ("1", TypeError),
+        ([1], TypeError),
+    ],
+)
+def test_invalid_values(value, error):
+    """
+    Tests the verification of the converted values.
+    """
+    with pytest.raises(error):
+        mm_to_inches(value)
+    with pytest.raises(error):
+        mm_to_inches_array([482.6, value])
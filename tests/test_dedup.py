@@ -0,0 +1,64 @@
+"""
+Module for testing the deduplication functions of the 'dedup' module.
+"""
+
+from circles.dedup import count_by_spec, dedupe, group_by_spec
+from circles.pizza import Pizza
+from circles.rim import Rim
+from circles.specs import SpecRegistry
+from circles.tyre import Tyre
+from circles.wheel import Wheel
+
+
+def _catalogue():
+    tyre = Tyre(300, "205/55R16")
+    rim = Rim(203.2)
+    return [
+        Rim(203.2),
+        tyre,
+        Rim(0.1 + 0.2),
+        Tyre(300.0, "205/55R16"),
+        Rim(203.2000000001),
+        Pizza(20, ["cheese"]),
+        Rim(0.3),
+        Pizza(20, ["cheese", "ham"]),
+        Wheel(tyre, rim),
+        Pizza(20.0, ["cheese"]),
+        Wheel(Tyre(300, "205/55R16"), Rim(203.2)),
+    ]
+
+
+def test_dedupe_keeps_first_of_every_spec():
+    """
+    Tests that dedupe keeps the first circle of every spec in input order.
+    """
+    circles = _catalogue()
+    unique = dedupe(circles)
+    assert [circles.index(circle) for circle in unique] == [0, 1, 2, 5, 7, 8]
+    assert all(unique[index] is circles[index] for index in (0, 1, 2))
+    assert dedupe([]) == []
+
+
+def test_group_and_count_by_spec():
+    """
+    Tests grouping and counting circles by spec key.
+    """
+    circles = _catalogue()
+    groups = group_by_spec(circles)
+    assert list(groups) == [circle.spec_key() for circle in dedupe(circles)]
+    assert [len(group) for group in groups.values()] == [2, 2, 2, 2, 1, 2]
+    assert groups[Rim(0.3).spec_key()] == [circles[2], circles[6]]
+    assert groups[Rim(0.3).spec_key()][1] is circles[6]
+    counts = count_by_spec(circles)
+    assert list(counts) == list(groups)
+    assert list(counts.values()) == [len(group) for group in groups.values()]
+
+
+def test_frozen_specs_equal_mutable_ones():
+    """
+    Tests that shared frozen objects have the same spec as mutable ones.
+    """
+    registry = SpecRegistry()
+    assert registry.rim(406.4) == Rim(203.2)
+    assert registry.tyre(600, "205/55R16") == Tyre(300, "205/55R16")
+    assert len(dedupe([Rim(203.2), registry.rim(406.4)])) == 1
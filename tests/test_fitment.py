@@ -0,0 +1,81 @@
+"""
+Module for testing the tyre and rim lookups of the 'FitmentIndex' class against
+the compatibility rule used by the 'Wheel' class.
+"""
+
+import pytest
+
+from circles.fitment import FitmentIndex, rim_inch_size
+from circles.pizza import Pizza
+from circles.rim import Rim
+from circles.tyre import Tyre
+from circles.wheel import Wheel
+
+
+@pytest.fixture
+def index():
+    """
+    Fixture creating an index of two 19 inch rims, one 17 inch rim and three tyres.
+
+    Returns:
+        FitmentIndex: The populated index.
+    """
+    rims = [Rim(241.3), Rim(241.0), Rim(215.9)]
+    tyres = [Tyre(800, "235/19R19"), Tyre(800, "225/45R17"), Tyre(800, "205/55R16")]
+    return FitmentIndex(rims, tyres)
+
+
+def test_rim_inch_size():
+    """
+    Tests the rounding of rim diameters to whole inches.
+    """
+    assert rim_inch_size(Rim(241.3)) == 19
+    assert rim_inch_size(Rim(215.9)) == 17
+
+
+def test_lookups(index):
+    """
+    Tests both lookup directions, including sizes without any match.
+
+    Args:
+        index (FitmentIndex): Fixture providing the index.
+    """
+    (tyre_19,) = index.tyres_by_size[19]
+    (tyre_17,) = index.tyres_by_size[17]
+    (tyre_16,) = index.tyres_by_size[16]
+    assert [rim.get_radius() for rim in index.rims_for(tyre_19)] == [241.3, 241.0]
+    assert [rim.get_radius() for rim in index.rims_for(tyre_17)] == [215.9]
+    assert index.rims_for(tyre_16) == []
+    assert index.tyres_for(Rim(241.3)) == [tyre_19]
+    assert index.tyres_for(Rim(300)) == []
+    assert list(index.iter_rims_for(tyre_19)) == index.rims_for(tyre_19)
+    assert list(index.iter_rims_for(tyre_16)) == []
+    assert list(index.iter_tyres_for(Rim(241.3))) == [tyre_19]
+    assert list(index.iter_tyres_for(Rim(300))) == []
+    index.rims_for(tyre_19).clear()
+    assert len(index.rims_for(tyre_19)) == 2
+
+
+def test_pairs_match_wheel(index):
+    """
+    Tests that every generated pair can be assembled into a wheel and that no
+    compatible pair is missing.
+
+    Args:
+        index (FitmentIndex): Fixture providing the index.
+    """
+    pairs = list(index.pairs())
+    assert len(pairs) == 3
+    for tyre, rim in pairs:
+        assert Wheel(tyre, rim).verify_rim_size()
+
+
+def test_incorrect_types():
+    """
+    Tests that objects of the wrong type are rejected.
+    """
+    index = FitmentIndex()
+    with pytest.raises(TypeError):
+        index.add_rim(Pizza(20, []))
+    with pytest.raises(TypeError):
+        index.add_tyre(Rim(241.3))
@@ -0,0 +1,108 @@
+"""
+Module for testing the on-disk fitment matrix of the 'fitment_matrix' module.
+"""
+
+import struct
+
+import pytest
+
+from circles.conversion import fits
+from circles.fitment_matrix import (
+    HEADER,
+    load_fitment_matrix,
+    write_fitment_matrix,
+    write_fitment_matrix_columns,
+)
+from circles.rim import Rim
+from circles.tyre import Tyre
+
+
+def _tyres():
+    labels = ["205/55R16", "225/45R17", "195/65R15", "255/35R19", "175/70R13"]
+    return [Tyre(300 + index, labels[index % 5]) for index in range(23)]
+
+
+def _rims():
+    diameters = [406.4, 431.8, 381.0, 482.6, 457.2, 237 * 2]
+    return [Rim.create_from_diameter(diameters[index % 6]) for index in range(17)]
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_matrix_matches_pairwise_check(tmp_path, max_workers):
+    """
+    Tests that every row lists exactly the rims the tyre fits, in increasing order,
+    when written by the calling process and by worker processes.
+    """
+    tyres, rims = _tyres(), _rims()
+    path = str(tmp_path / "fitment.bin")
+    entries = write_fitment_matrix(
+        path, tyres, rims, chunk_size=4, max_workers=max_workers
+    )
+    with load_fitment_matrix(path) as matrix:
+        assert matrix.shape == (len(tyres), len(rims)) and len(matrix) == len(tyres)
+        assert matrix.entries == entries
+        for row, tyre in enumerate(tyres):
+            expected = [
+                index
+                for index, rim in enumerate(rims)
+                if fits(tyre.necessary_rim_size, rim.diameter_inches)
+            ]
+            assert list(matrix.rims_for(row)) == expected
+            assert matrix.count(row) == len(expected)
+        assert len(list(matrix.pairs())) == entries
+        assert entries == sum(
+            fits(tyre.necessary_rim_size, rim.diameter_inches)
+            for tyre in tyres
+            for rim in rims
+        )
+
+
+def test_columns_and_empty_matrices(tmp_path):
+    """
+    Tests writing from rim size columns, including matrices without entries.
+    """
+    path = str(tmp_path / "fitment.bin")
+    assert write_fitment_matrix_columns(path, [16, 17, 16, 99], [17, 16, 16], 2, 1) == 5
+    with load_fitment_matrix(path) as matrix:
+        assert [list(matrix.rims_for(row)) for row in range(4)] == [
+            [1, 2],
+            [0],
+            [1, 2],
+            [],
+        ]
+    assert write_fitment_matrix_columns(path, [], [16], max_workers=1) == 0
+    with load_fitment_matrix(path) as matrix:
+        assert matrix.shape == (0, 1) and list(matrix.pairs()) == []
+
+
+def test_invalid_arguments_and_files(tmp_path):
+    """
+    Tests the argument checks and the rejection of invalid files.
+    """
+    path = str(tmp_path / "fitment.bin")
+    with pytest.raises(ValueError):
+        write_fitment_matrix_columns(path, [16], [16], chunk_size=0)
+    with pytest.raises(ValueError):
+        write_fitment_matrix_columns(path, [16], [16], max_workers=0)
+    with pytest.raises(TypeError):
+        write_fitment_matrix(path, [Rim(200)], [Rim(200)])
+    with pytest.raises(TypeError):
+        write_fitment_matrix(path, _tyres(), [_tyres()[0]])
+    write_fitment_matrix_columns(path, [16, 16], [16, 16], max_workers=1)
+    with open(path, "rb") as file:
+        data = file.read()
+    with open(path, "wb") as file:
+        file.write(data[:-8])
+    with pytest.raises(ValueError):
+        load_fitment_matrix(path)
+    with open(path, "wb") as file:
+        file.write(b"NOTAFILE" + data[8:])
+    with pytest.raises(ValueError):
+        load_fitment_matrix(path)
+    # the second row would start after the last entry
+    with open(path, "wb") as file:
+        file.write(data[: HEADER.size] + struct.pack("<3q", 0, 5, 4) + data[56:])
+    with pytest.raises(ValueError):
+        load_fitment_matrix(path)
+    with pytest.raises(TypeError):
+        write_fitment_matrix_columns(path, [16, 16.5], [16], max_workers=1)
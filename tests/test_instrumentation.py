@@ -0,0 +1,71 @@
+"""
+Module for testing the opt-in call counters of the 'instrumentation' module.
+"""
+
+import pytest
+
+from circles import instrumentation
+from circles.circle import Circle
+from circles.rim import Rim
+from circles.tyre import Tyre
+from circles.wheel import Wheel
+
+
+@pytest.fixture(autouse=True)
+def clean_counters():
+    """
+    Fixture resetting the counters and disabling instrumentation after each test.
+    """
+    instrumentation.reset()
+    yield
+    instrumentation.disable()
+    instrumentation.set_exporter(None)
+    instrumentation.reset()
+
+
+def test_disabled_by_default():
+    """
+    Tests that nothing is wrapped or counted unless instrumentation is enabled.
+    """
+    original = Rim.__dict__["__init__"]
+    assert not instrumentation.is_enabled()
+    Rim(241.3)
+    assert instrumentation.snapshot()["Rim.__init__"].calls == 0
+    with instrumentation.instrumented():
+        assert Rim.__dict__["__init__"] is not original
+    assert Rim.__dict__["__init__"] is original
+    assert isinstance(Circle.__dict__["validate_data"], staticmethod)
+
+
+def test_counters():
+    """
+    Tests call, failure and time counters of instrumented functions.
+    """
+    with instrumentation.instrumented():
+        wheel = Wheel(Tyre(800, "235/19R19"), Rim(241.3))
+        wheel.verify_rim_size()
+        with pytest.raises(ValueError):
+            Rim(-1)
+        with pytest.raises(TypeError):
+            Rim.mm_to_inches("1")
+    stats = instrumentation.snapshot()
+    assert stats["Rim.__init__"].calls == 2
+    assert stats["Rim.__init__"].failures == 1
+    assert stats["Rim.mm_to_inches"].failures == 1
+    assert stats["Wheel.verify_rim_size"].calls == 2
+    assert stats["Wheel.__init__"].total_time > 0
+    assert stats["Circle.validate_data"].calls >= 4
+
+
+def test_export():
+    """
+    Tests the exporter hook and resetting after export.
+    """
+    exported = []
+    instrumentation.set_exporter(exported.append)
+    with instrumentation.instrumented():
+        Rim(241.3)
+    stats = instrumentation.export(reset_counters=True)
+    assert exported == [stats]
+    assert stats["Rim.__init__"].calls == 1
+    assert instrumentation.snapshot()["Rim.__init__"].calls == 0
@@ -0,0 +1,123 @@
+"""
+Module for testing the streaming CSV and JSONL catalogue readers in the 'loader' module.
+"""
+
+import json
+
+import pytest
+
+from circles.loader import iter_csv, iter_jsonl
+from circles.pizza import Pizza
+from circles.rim import Rim
+from circles.tyre import Tyre
+
+
+@pytest.fixture
+def rows():
+    """
+    Fixture with three valid rows followed by three invalid ones.
+
+    Returns:
+        list: Catalogue rows as dictionaries.
+    """
+    return [
+        {"type": "tyre", "diameter": 1600, "tyre_label": "235/19R19"},
+        {"type": "rim", "diameter": 482.6},
+        {"type": "pizza", "diameter": 40, "ingredients": ["cheese", "sauce"]},
+        {"type": "tyre", "diameter": 1600, "tyre_label": "235/19T19"},
+        {"type": "rim", "diameter": -1},
+        {"type": "plate", "diameter": 20},
+    ]
+
+
+def check_objects(objects, errors, first_line):
+    """
+    Checks the objects and errors loaded from the fixture rows.
+
+    Parameters:
+        objects (list): The loaded objects.
+        errors (list): The reported LoadError records.
+        first_line (int): The line number of the first fixture row in the file.
+    """
+    tyre, rim, pizza = objects
+    assert isinstance(tyre, Tyre) and tyre.get_radius() == 800
+    assert isinstance(rim, Rim) and rim.diameter_inches == 19.0
+    assert isinstance(pizza, Pizza) and pizza.ingredients == ["cheese", "sauce"]
+    assert [error.line - first_line for error in errors] == [3, 4, 5]
+    assert errors[2].reason == "Unknown object type: 'plate'"
+
+
+def test_iter_jsonl(tmp_path, rows, capsys):
+    """
+    Tests loading a JSONL file, including a malformed line.
+
+    Parameters:
+        tmp_path (Path): A pytest fixture providing a temporary directory.
+        rows (list): Fixture providing the catalogue rows.
+        capsys (pytest fixture): A pytest fixture for capturing standard output.
+    """
+    path = tmp_path / "catalogue.jsonl"
+    lines = ["{not json"] + [json.dumps(row) for row in rows]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    errors = []
+    objects = list(iter_jsonl(path, errors.append))
+    assert errors[0].line == 1
+    check_objects(objects, errors[1:], 2)
+    assert capsys.readouterr().out == ""
+
+
+def test_iter_csv(tmp_path, rows):
+    """
+    Tests loading a CSV file with ";"-separated ingredients.
+
+    Parameters:
+        tmp_path (Path): A pytest fixture providing a temporary directory.
+        rows (list): Fixture providing the catalogue rows.
+    """
+    path = tmp_path / "catalogue.csv"
+    lines = ["type,diameter,tyre_label,ingredients"]
+    for row in rows:
+        ingredients = ";".join(row.get("ingredients", []))
+        lines.append(
+            f"{row['type']},{row['diameter']},{row.get('tyre_label', '')},{ingredients}"
+        )
+    lines.insert(1, "rim,abc,,")
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    errors = []
+    objects = list(iter_csv(path, errors.append))
+    assert errors[0].line == 2
+    check_objects(objects, errors[1:], 3)
+
+
+def test_lazy_loading(tmp_path, rows):
+    """
+    Tests that objects are yielded before the whole file has been read.
+
+    Parameters:
+        tmp_path (Path): A pytest fixture providing a temporary directory.
+        rows (list): Fixture providing the catalogue rows.
+    """
+    path = tmp_path / "catalogue.jsonl"
+    path.write_text(json.dumps(rows[1]) + "\n", encoding="utf-8")
+    objects = iter_jsonl(path)
+    assert isinstance(next(objects), Rim)
+    assert list(objects) == []
+
+
+@pytest.mark.parametrize("diameter", ["inf", "-inf", "nan", "1e999", "9" * 400])
+def test_non_finite_diameters(tmp_path, diameter):
+    """
+    Tests that infinite, NaN and too large diameters are reported instead of aborting
+    the load.
+
+    Parameters:
+        tmp_path (Path): A pytest fixture providing a temporary directory.
+        diameter (str): The invalid diameter field.
+    """
+    path = tmp_path / "catalogue.csv"
+    lines = ["type,diameter,tyre_label", f"rim,{diameter},", "rim,482.6,"]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    errors = []
+    objects = list(iter_csv(path, errors.append))
+    assert [error.line for error in errors] == [2]
+    assert len(objects) == 1 and objects[0].diameter_inches == 19.0
@@ -0,0 +1,63 @@
+"""
+Module for testing the streaming pizza order aggregates of the 'orders' module.
+"""
+
+import math
+
+import pytest
+
+from circles.circle_array import PizzaArray
+from circles.orders import PizzaOrderAggregator, aggregate_pizzas
+from circles.pizza import Pizza
+from circles.rim import Rim
+
+
+def test_aggregate_pizzas():
+    """
+    Tests the histogram, total area and ingredient areas of Pizza objects.
+    """
+    pizzas = [
+        Pizza(10, ["cheese", "sauce"]),
+        Pizza(30, ["cheese"]),
+        Pizza(50, []),
+    ]
+    aggregator = aggregate_pizzas(pizzas)
+    assert aggregator.count == 3
+    assert aggregator.histogram == {"small": 1, "medium": 1, "large": 1}
+    assert aggregator.total_area == pytest.approx(math.pi * (100 + 900 + 2500))
+    assert aggregator.ingredient_area["cheese"] == pytest.approx(math.pi * 1000)
+    assert aggregator.ingredient_area["sauce"] == pytest.approx(math.pi * 100)
+
+
+def test_raw_rows_and_custom_breakpoints():
+    """
+    Tests aggregating raw rows with custom size thresholds and repeated ingredients.
+    """
+    aggregator = PizzaOrderAggregator((15,), ("personal", "family"))
+    aggregator.add_many_raw([(10, ["ham"]), (15, []), (16, ("ham",))])
+    assert aggregator.histogram == {"personal": 2, "family": 1}
+    assert aggregator.ingredient_area["ham"] == pytest.approx(math.pi * 356)
+    aggregator.add_raw(1, ["ham", "ham", "olives", "ham"])
+    assert aggregator.ingredient_area["ham"] == pytest.approx(math.pi * 357)
+    assert aggregator.ingredient_area["olives"] == pytest.approx(math.pi)
+    assert PizzaArray([10, 15, 16], [[], [], []]).sizes((15,), ("s", "l")) == [
+        "s",
+        "s",
+        "l",
+    ]
+
+
+def test_incorrect_arguments():
+    """
+    Tests that invalid pizzas, radii and thresholds are rejected.
+    """
+    aggregator = PizzaOrderAggregator()
+    with pytest.raises(TypeError):
+        aggregator.add(Rim(20))
+    with pytest.raises(ValueError):
+        aggregator.add_raw(0)
+    with pytest.raises(TypeError):
+        aggregator.add_raw(10, "ham")
+    assert aggregator.count == 0 and aggregator.ingredient_area == {}
+    with pytest.raises(ValueError):
+        PizzaOrderAggregator((20, 20), ("a", "b", "c"))
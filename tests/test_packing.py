@@ -0,0 +1,105 @@
+"""
+Module for testing the tray packing of the 'packing' module.
+"""
+
+import math
+
+import pytest
+
+from circles.packing import SpatialHash, pack_tray, pack_trays
+from circles.pizza import Pizza
+from circles.rim import Rim
+
+
+def assert_valid(packing, gap=0.0):
+    """
+    Checks that every placed circle lies on the tray and overlaps no other circle.
+    """
+    placements = packing.placements
+    for index, first in enumerate(placements):
+        radius = first.circle.get_radius()
+        assert radius - 1e-9 <= first.x <= packing.width - radius + 1e-9
+        assert radius - 1e-9 <= first.y <= packing.height - radius + 1e-9
+        for second in placements[index + 1 :]:
+            distance = math.hypot(first.x - second.x, first.y - second.y)
+            assert distance >= radius + second.circle.get_radius() + gap - 1e-6
+
+
+def test_pack_tray():
+    """
+    Tests that a packed tray holds no overlapping circles and reports its usage.
+    """
+    pizzas = [Pizza(radius, ["cheese"]) for radius in (10, 15, 20, 5, 5, 8, 12) * 4]
+    packing = pack_tray(pizzas, 100, 60, gap=1)
+    assert_valid(packing, gap=1)
+    assert len(packing.placements) + len(packing.unplaced) == len(pizzas)
+    covered = sum(math.pi * p.circle.get_radius() ** 2 for p in packing.placements)
+    assert packing.utilisation == pytest.approx(covered / 6000)
+    assert 0 < packing.utilisation < math.pi / 4
+
+
+def test_pack_tray_unplaced_and_oversized():
+    """
+    Tests that circles that do not fit are returned from the largest down.
+    """
+    pizzas = [Pizza(10, []), Pizza(40, []), Pizza(10, []), Pizza(10, [])]
+    packing = pack_tray(pizzas, 40, 20)
+    assert_valid(packing)
+    assert len(packing.placements) == 2
+    assert [pizza.get_radius() for pizza in packing.unplaced] == [40, 10]
+    empty = pack_tray([Pizza(40, [])], 40, 20)
+    assert empty.placements == [] and empty.utilisation == 0
+
+
+def test_pack_tray_improvement_pass():
+    """
+    Tests that the improvement pass never places fewer circles than the greedy pass.
+    """
+    rims = [Rim(diameter) for diameter in range(100, 400, 7)]
+    greedy = pack_tray(rims, 500, 500, improve=False)
+    improved = pack_tray(rims, 500, 500)
+    assert_valid(improved)
+    assert len(improved.placements) >= len(greedy.placements)
+
+
+def test_pack_trays():
+    """
+    Tests that a plan places every circle that fits on an empty tray exactly once.
+    """
+    pizzas = [Pizza(radius, []) for radius in (15, 20, 25, 30) * 25]
+    pizzas.append(Pizza(45, []))
+    plan = pack_trays(pizzas, 120, 80, gap=1)
+    placed = [p.circle for tray in plan.trays for p in tray.placements]
+    assert len(placed) == 100
+    assert {id(pizza) for pizza in placed} == {id(pizza) for pizza in pizzas[:-1]}
+    assert plan.oversized == [pizzas[-1]]
+    for tray in plan.trays:
+        assert_valid(tray, gap=1)
+        assert tray.unplaced == []
+
+
+def test_spatial_hash():
+    """
+    Tests the neighbour lookups of the grid.
+    """
+    grid = SpatialHash(10)
+    grid.add(5, 5, 5)
+    grid.add(50, 50, 5)
+    assert list(grid.near(0, 0, 10, 10)) == [(5, 5, 5)]
+    assert grid.overlaps(12, 5, 5)
+    assert not grid.overlaps(15, 5, 5)
+    assert grid.overlaps(15, 5, 5, gap=1)
+    assert grid.top_row(5) == 5 and grid.top_row(3) == -1
+
+
+@pytest.mark.parametrize(
+    "width, height, gap", [(0, 10, 0), (10, -1, 0), (10, 10, -1)]
+)
+def test_pack_tray_invalid(width, height, gap):
+    """
+    Tests the verification of the tray dimensions and the gap.
+    """
+    with pytest.raises(ValueError):
+        pack_tray([Pizza(1, [])], width, height, gap)
+    with pytest.raises(ValueError):
+        pack_trays([Pizza(1, [])], width, height, gap)
@@ -8,7 +8,7 @@ Version: 1.0
 """
 
 import pytest
-from circles.pizza import Pizza
+from circles.pizza import Pizza, classify_pizza_radii
 
 
 @pytest.fixture
@@ -79,3 +79,23 @@ def test_incorrect_ingredients():
     """
     with pytest.raises(TypeError):
         Pizza(20, "banana")
+
+
+def test_classify_pizza_radii():
+    """
+    Tests batch classification with the default and with custom breakpoints.
+    """
+    radii = [5.0, 20, 21, 40, 40.1, 600]
+    assert classify_pizza_radii(radii) == [Pizza(radius, []).size for radius in radii]
+    assert classify_pizza_radii(radii, (10,), ("kids", "adult")) == [
+        "kids",
+        "adult",
+        "adult",
+        "adult",
+        "adult",
+        "adult",
+    ]
+    with pytest.raises(ValueError):
+        classify_pizza_radii(radii, (40, 20))
+    with pytest.raises(ValueError):
+        classify_pizza_radii(radii, (20,), ("small", "medium", "large"))
@@ -0,0 +1,115 @@
+"""
+Module for testing ingredient interning and the ingredient queries of the
+'PizzaIndex' class.
+"""
+
+import pytest
+
+from circles.pizza import Pizza
+from circles.pizza_index import IngredientRegistry, PizzaIndex
+from circles.rim import Rim
+
+
+@pytest.fixture
+def index():
+    """
+    Fixture indexing four pizzas with overlapping ingredients.
+
+    Returns:
+        PizzaIndex: The populated index.
+    """
+    return PizzaIndex(
+        [
+            Pizza(20, ["cheese", "sauce", "ham"]),
+            Pizza(30, ["cheese", "ham", "pineapple"]),
+            Pizza(25, ["sauce", "mushrooms"]),
+            Pizza(41, []),
+        ]
+    )
+
+
+def test_registry():
+    """
+    Tests that names get stable IDs and that bitsets decode back to the names.
+    """
+    registry = IngredientRegistry()
+    assert registry.intern("cheese") == 0
+    assert registry.intern("ham") == 1
+    assert registry.intern("".join(["che", "ese"])) == 0
+    mask = registry.mask(["ham", "olives", "ham"])
+    assert mask == 0b110
+    assert registry.decode(mask) == ["ham", "olives"]
+    with pytest.raises(TypeError):
+        registry.intern(3)
+
+
+def test_queries(index):
+    """
+    Tests AND, OR and NOT queries and their combinations.
+
+    Args:
+        index (PizzaIndex): Fixture providing the index.
+    """
+    assert index.query_ids(all_of=["cheese", "ham"]) == [0, 1]
+    assert index.query_ids(all_of=["cheese", "ham"], none_of=["pineapple"]) == [0]
+    assert index.query_ids(any_of=["pineapple", "mushrooms"]) == [1, 2]
+    assert index.query_ids(none_of=["cheese", "sauce"]) == [3]
+    assert index.query_ids() == [0, 1, 2, 3]
+    assert index.query_ids(all_of=["anchovies"]) == []
+    assert index.query_ids(none_of=["anchovies"]) == [0, 1, 2, 3]
+    assert [pizza.get_radius() for pizza in index.query(all_of=["sauce"])] == [20, 25]
+
+
+def test_add(index):
+    """
+    Tests adding pizzas after the index was built, between queries.
+
+    Args:
+        index (PizzaIndex): Fixture providing the index.
+    """
+    assert index.query_ids(all_of=["cheese"], none_of=["ham"]) == []
+    assert index.add(Pizza(10, ["olives", "cheese"])) == 4
+    assert len(index) == 5
+    assert index.ingredients_of(4) == ["cheese", "olives"]
+    assert index.query_ids(all_of=["cheese"], none_of=["ham"]) == [4]
+    assert index.add(Pizza(12, ["ham"])) == 5
+    assert index.query_ids(any_of=["ham", "olives"]) == [0, 1, 4, 5]
+    assert index.query_ids(none_of=["cheese", "sauce"]) == [3, 5]
+    with pytest.raises(TypeError):
+        index.add(Rim(20))
+
+
+def test_ingredients_are_interned(index):
+    """
+    Tests that the index shares one string object per ingredient name without
+    changing the ingredient lists of the pizzas.
+
+    Args:
+        index (PizzaIndex): Fixture providing the index.
+    """
+    ingredients = ["".join(["che", "ese"]), "".join(["h", "am"])]
+    pizza = Pizza(10, list(ingredients))
+    pizza_id = index.add(pizza)
+    assert all(name is kept for name, kept in zip(pizza.ingredients, ingredients))
+    names = index.ingredients_of(pizza_id)
+    assert names == ["cheese", "ham"]
+    assert names[0] is index.ingredients_of(0)[0]
+    assert names[1] is index.registry.names[index.registry.ids["ham"]]
+
+
+def test_add_is_all_or_nothing(index):
+    """
+    Tests that a pizza with an ingredient that is not a string leaves the index,
+    the registry and the pizza unchanged.
+
+    Args:
+        index (PizzaIndex): Fixture providing the index.
+    """
+    pizza = Pizza(10, ["olives", "anchovies"])
+    pizza.ingredients.append(3)
+    with pytest.raises(TypeError):
+        index.add(pizza)
+    assert pizza.ingredients == ["olives", "anchovies", 3]
+    assert len(index) == 4
+    assert "olives" not in index.registry.ids
+    assert len(index.registry.names) == 5
@@ -36,3 +36,34 @@ def test_mm_to_inches_incorrect_args():
     mm = "2345"
     with pytest.raises(TypeError):
         Rim.mm_to_inches(mm)
+
+
+@pytest.mark.parametrize("radius", [float("inf"), float("nan"), 10**400])
+def test_non_finite_radius(radius):
+    """
+    Tests that a rim with an infinite, NaN or too large radius is rejected with
+    ValueError.
+
+    Parameters:
+        radius: The invalid radius.
+    """
+    with pytest.raises(ValueError):
+        Rim(radius)
+
+
+@pytest.mark.parametrize("diameter", [float("inf"), float("nan")])
+def test_change_diameter_non_finite(diameter):
+    """
+    Tests that a rim is left unchanged when a non-finite diameter is rejected.
+
+    Parameters:
+        diameter: The invalid diameter.
+    """
+    rim = Rim(241.3)
+    assert rim.get_area() > 0
+    with pytest.raises(ValueError):
+        rim.change_diameter(diameter)
+    assert rim.get_radius() == 241.3
+    assert rim.get_diameter() == 482.6
+    assert rim.diameter_inches == 19.0
+    assert rim == Rim(241.3)
@@ -0,0 +1,252 @@
+"""
+Module for testing the micro-batching fitment service of the 'service' module
+on a local socket.
+"""
+
+import asyncio
+import gc
+import json
+import socket
+import struct
+
+import pytest
+
+from circles import service as service_module
+from circles.service import FitmentService, answer, answer_batch
+
+
+def test_answer():
+    """
+    Tests answering fitment and assembly requests directly.
+    """
+    fits = {"op": "fits", "tyre_label": "235/19R19", "rim_diameter": 482.6}
+    assert answer(fits) == {
+        "ok": True,
+        "fits": True,
+        "rim_size": 19,
+        "necessary_rim_size": 19,
+    }
+    assert answer(dict(fits, rim_diameter=600))["fits"] is False
+    assert answer(dict(fits, tyre_label="235/19T19"))["error"] == "LABEL_FORMAT"
+    assert answer(dict(fits, rim_diameter=-1))["error"] == "RADIUS_NOT_POSITIVE"
+    assert answer(dict(fits, op="paint"))["error"] == "UNKNOWN_OP"
+    assemble = dict(fits, op="assemble", tyre_diameter=1600)
+    assert answer(assemble) == {"ok": True, "wheel_diameter": 1600}
+    assert answer(dict(assemble, rim_diameter=600))["error"] == "SIZE_MISMATCH"
+    assert answer(dict(assemble, tyre_diameter="big"))["error"] == "RADIUS_TYPE"
+    for diameter in (float("inf"), float("nan"), 10**400):
+        reply = answer(dict(fits, rim_diameter=diameter))
+        assert reply["error"] == "RADIUS_NOT_FINITE"
+        reply = answer(dict(assemble, tyre_diameter=diameter))
+        assert reply["error"] == "RADIUS_NOT_FINITE"
+
+
+def test_answer_batch():
+    """
+    Tests that batch replies keep the request order and ids.
+    """
+    requests = [
+        {"id": index, "op": "fits", "tyre_label": "235/19R19", "rim_diameter": 482.6}
+        for index in range(3)
+    ]
+    requests.append({"id": 3, "op": "fits", "tyre_label": ["x"], "rim_diameter": 1})
+    replies = answer_batch(requests)
+    assert [reply["id"] for reply in replies] == [0, 1, 2, 3]
+    assert replies[0]["fits"] and not replies[3]["ok"]
+
+
+def test_answer_batch_isolates_failures(monkeypatch):
+    """
+    Tests that a request whose answer raises gets an error reply and the other
+    requests of the batch are still answered.
+    """
+
+    def answer_or_fail(request):
+        if request.get("tyre_label") == "fail":
+            raise OverflowError("too large")
+        return answer(request)
+
+    monkeypatch.setattr(service_module, "answer", answer_or_fail)
+    fits = {"op": "fits", "tyre_label": "235/19R19", "rim_diameter": 482.6}
+    replies = answer_batch([dict(fits, tyre_label="fail", id=0), dict(fits, id=1)])
+    assert replies[0] == {
+        "ok": False,
+        "error": "INTERNAL_ERROR",
+        "message": "OverflowError",
+        "id": 0,
+    }
+    assert replies[1]["fits"]
+
+
+async def run_clients(service, clients, requests_per_client, rim_diameter=482.6):
+    """
+    Starts the service, sends requests from concurrent clients and collects replies.
+
+    Parameters:
+        service (FitmentService): The service to test.
+        clients (int): The number of concurrent connections.
+        requests_per_client (int): The number of pipelined requests per connection.
+        rim_diameter: The rim diameter of the requests with an even index.
+
+    Returns:
+        list: The replies of every client.
+    """
+    server = await service.start()
+    port = server.sockets[0].getsockname()[1]
+
+    async def client(number):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        for index in range(requests_per_client):
+            request = {
+                "id": [number, index],
+                "op": "fits",
+                "tyre_label": "235/19R19" if index % 2 else "205/55R16",
+                "rim_diameter": 482.6 if index % 2 else rim_diameter,
+            }
+            writer.write(json.dumps(request).encode() + b"\n")
+        writer.write(b"not json\n")
+        writer.write_eof()
+        replies = [json.loads(line) async for line in reader]
+        writer.close()
+        return replies
+
+    try:
+        return await asyncio.gather(*(client(number) for number in range(clients)))
+    finally:
+        await service.close()
+
+
+def test_service_batches_concurrent_clients():
+    """
+    Tests that concurrent clients get correct replies and that their requests are
+    grouped into fewer batches than requests.
+    """
+    service = FitmentService(window=0.01)
+    results = asyncio.run(run_clients(service, clients=20, requests_per_client=10))
+    for number, replies in enumerate(results):
+        assert len(replies) == 11
+        assert sum(reply.get("error") == "INVALID_JSON" for reply in replies) == 1
+        for reply in replies:
+            if "id" in reply:
+                assert reply["id"][0] == number
+                assert reply["fits"] == bool(reply["id"][1] % 2)
+    assert service.requests == 200
+    assert service.batches < service.requests
+
+
+def test_service_survives_invalid_numbers_and_bounds_pending_requests():
+    """
+    Tests that non-finite diameters get error replies without stalling the other
+    requests, and that every pipelined request is answered with one request of a
+    connection in flight at a time.
+    """
+    service = FitmentService(window=0.001, max_pending=1)
+    results = asyncio.run(
+        run_clients(service, clients=3, requests_per_client=40, rim_diameter=1e400)
+    )
+    for replies in results:
+        assert len(replies) == 41
+        errors = [reply.get("error") for reply in replies if not reply["ok"]]
+        assert errors.count("RADIUS_NOT_FINITE") == 20
+        assert sum(reply.get("fits", False) for reply in replies) == 20
+    assert service.requests == 120
+
+
+async def oversized_line(service):
+    """
+    Sends a valid request followed by a line longer than the stream limit.
+
+    Parameters:
+        service (FitmentService): The service to test.
+
+    Returns:
+        list: The replies received before the server closed the connection.
+    """
+    server = await service.start()
+    port = server.sockets[0].getsockname()[1]
+    try:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        request = {"id": 0, "op": "fits", "tyre_label": "235/19R19", "rim_diameter": -1}
+        writer.write(json.dumps(request).encode() + b"\n")
+        writer.write(b"x" * 2**17 + b"\n")
+        replies = [json.loads(line) async for line in reader]
+        writer.close()
+        return replies
+    finally:
+        await service.close()
+
+
+def test_oversized_line():
+    """
+    Tests that a line longer than the stream limit gets an error reply and closes
+    the connection after the earlier requests are answered.
+    """
+    replies = asyncio.run(oversized_line(FitmentService(window=0.01)))
+    assert sorted(reply["error"] for reply in replies) == [
+        "LINE_TOO_LONG",
+        "RADIUS_NOT_POSITIVE",
+    ]
+
+
+async def disconnect_mid_batch(service):
+    """
+    Sends requests and resets the connection before the batch is answered, then
+    checks that the service still answers another client.
+
+    Parameters:
+        service (FitmentService): The service to test.
+
+    Returns:
+        Tuple[list, list]: The replies of the second client and the exception
+         contexts reported to the event loop.
+    """
+    loop = asyncio.get_running_loop()
+    errors = []
+    loop.set_exception_handler(lambda _, context: errors.append(context))
+    server = await service.start()
+    port = server.sockets[0].getsockname()[1]
+    fits = {"op": "fits", "tyre_label": "235/19R19", "rim_diameter": 482.6}
+    try:
+        _, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(b"".join(json.dumps(fits).encode() + b"\n" for _ in range(20)))
+        await writer.drain()
+        await asyncio.sleep(0.01)
+        # close with a reset instead of an orderly shutdown
+        linger = struct.pack("ii", 1, 0)
+        writer.get_extra_info("socket").setsockopt(
+            socket.SOL_SOCKET, socket.SO_LINGER, linger
+        )
+        writer.transport.abort()
+        await asyncio.sleep(0.2)
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(json.dumps(fits).encode() + b"\n")
+        writer.write_eof()
+        replies = [json.loads(line) async for line in reader]
+        writer.close()
+    finally:
+        await service.close()
+    gc.collect()
+    await asyncio.sleep(0)
+    return replies, errors
+
+
+def test_client_disconnects_mid_batch():
+    """
+    Tests that requests in flight when a client disconnects are dropped without
+    unhandled task exceptions and that the service keeps working.
+    """
+    replies, errors = asyncio.run(disconnect_mid_batch(FitmentService(window=0.05)))
+    assert replies == [dict(ok=True, fits=True, rim_size=19, necessary_rim_size=19)]
+    assert errors == []
+
+
+def test_incorrect_arguments():
+    """
+    Tests that invalid batching and connection settings are rejected.
+    """
+    with pytest.raises(ValueError):
+        FitmentService(window=-1)
+    with pytest.raises(ValueError):
+        FitmentService(max_batch=0)
+    with pytest.raises(ValueError):
+        FitmentService(max_pending=0)
@@ -0,0 +1,94 @@
+"""
+Module for testing the shared rim and tyre objects of the 'specs' module.
+"""
+
+import pickle
+
+import pytest
+
+from circles.rim import Rim
+from circles.specs import FrozenRim, FrozenTyre, SpecRegistry, default_registry
+from circles.tyre import Tyre
+from circles.wheel import Wheel
+
+
+def test_registry_shares_objects():
+    """
+    Tests that equal parameters give the same object and that the objects match
+    their mutable counterparts.
+    """
+    registry = SpecRegistry()
+    rim = registry.rim(406.4)
+    assert rim is registry.rim(406.4)
+    assert registry.rim(406) is registry.rim(406.0)
+    assert registry.rim(0.1 + 0.2) is registry.rim(0.3)
+    assert registry.tyre(600.0000001, "205/55R16") is registry.tyre(600, "205/55R16")
+    assert isinstance(rim, Rim)
+    assert rim.diameter_inches == Rim.create_from_diameter(406.4).diameter_inches
+    tyre = registry.tyre(600, "205/55R16")
+    assert tyre is registry.tyre(600, "205/55R16")
+    assert tyre is not registry.tyre(600, "205/55R17")
+    assert isinstance(tyre, Tyre)
+    assert tyre.necessary_rim_size == 16
+    assert len(registry) == 5
+    registry.clear()
+    assert len(registry) == 0
+    assert registry.rim(406.4) is not rim
+
+
+def test_registry_validates(capsys):
+    """
+    Tests that invalid parameters raise the same errors as the mutable classes,
+    without printing.
+
+    Parameters:
+        capsys (pytest fixture): A pytest fixture for capturing standard output.
+    """
+    registry = SpecRegistry()
+    with pytest.raises(ValueError):
+        registry.rim(-1)
+    with pytest.raises(TypeError):
+        registry.rim("406")
+    with pytest.raises(ValueError):
+        registry.tyre(600, "205-55R16")
+    with pytest.raises(ValueError):
+        registry.tyre(600, ["205/55R16"])
+    assert len(registry) == 0
+    assert capsys.readouterr().out == ""
+
+
+def test_frozen_objects_are_immutable():
+    """
+    Tests that shared objects can't be changed, while their caches still work.
+    """
+    rim = SpecRegistry().rim(406.4)
+    assert rim.get_area() == pytest.approx(3.14159265 * 203.2**2)
+    with pytest.raises(AttributeError):
+        rim.change_diameter(500)
+    with pytest.raises(AttributeError):
+        rim.diameter_inches = 17
+    with pytest.raises(AttributeError):
+        del rim.diameter_inches
+    assert rim.get_diameter() == 406.4
+    tyre = SpecRegistry().tyre(600, "205/55R16")
+    with pytest.raises(AttributeError):
+        tyre.tyre_label = "205/55R17"
+
+
+def test_factories_and_wheels_use_default_registry():
+    """
+    Tests the create_from_diameter factories, wheels and pickling.
+    """
+    rim = FrozenRim.create_from_diameter(406.4)
+    tyre = FrozenTyre.create_from_diameter(600, "205/55R16")
+    assert rim is default_registry().rim(406.4)
+    assert tyre is default_registry().tyre(600, "205/55R16")
+    wheels = [default_registry().wheel(600, "205/55R16", 406.4) for _ in range(3)]
+    assert all(isinstance(wheel, Wheel) for wheel in wheels)
+    assert all(wheel.rim is rim and wheel.tyre is tyre for wheel in wheels)
+    wheels[0].change_rim(Rim(203.2))
+    assert wheels[1].rim is rim
+    with pytest.raises(ValueError):
+        default_registry().wheel(600, "205/55R17", 406.4)
+    loaded = pickle.loads(pickle.dumps(wheels))
+    assert loaded[1].rim is rim and loaded[2].tyre is tyre
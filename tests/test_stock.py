@@ -0,0 +1,110 @@
+"""
+Module for testing the incremental stock tracking of the 'stock' module.
+"""
+
+import random
+
+import pytest
+
+from circles.rim import Rim
+from circles.stock import StockEvent, StockTracker
+from circles.tyre import Tyre
+
+
+def _recount(tyres, rims):
+    sizes = set(tyres) | set(rims)
+    wheels = sum(min(tyres.get(size, 0), rims.get(size, 0)) for size in sizes)
+    pairs = sum(tyres.get(size, 0) * rims.get(size, 0) for size in sizes)
+    return wheels, pairs
+
+
+def test_objects_and_event_methods():
+    """
+    Tests the totals after adding and removing Tyre and Rim objects.
+    """
+    tracker = StockTracker()
+    tracker.add_tyre(Tyre(300, "205/55R16"))
+    tracker.add_tyre(Tyre(300, "205/55R16"))
+    assert (tracker.wheels, tracker.pairs) == (0, 0)
+    tracker.add_rim(Rim(203.2))
+    tracker.add_rim(Rim.create_from_diameter(431.8))
+    assert (tracker.wheels, tracker.pairs) == (1, 2)
+    tracker.rim_in(16, 3)
+    assert (tracker.wheels, tracker.pairs) == (2, 8)
+    assert tracker.wheels_by_size() == {16: 2}
+    assert tracker.wheels_for(16) == 2 and tracker.wheels_for(17) == 0
+    assert tracker.tyre_count(16) == 2 and tracker.rim_count(17) == 1
+    tracker.remove_tyre(Tyre(300, "205/55R16"))
+    tracker.remove_rim(Rim(203.2))
+    assert (tracker.wheels, tracker.pairs) == (1, 3)
+    assert tracker.events == 7
+    with pytest.raises(ValueError):
+        tracker.tyre_out(17)
+    with pytest.raises(ValueError):
+        tracker.rim_in(16, -1)
+    with pytest.raises(TypeError):
+        tracker.add_tyre(Rim(203.2))
+    with pytest.raises(TypeError):
+        tracker.remove_rim(Tyre(300, "205/55R16"))
+    assert (tracker.wheels, tracker.pairs, tracker.events) == (1, 3, 7)
+
+
+def test_apply_matches_recount():
+    """
+    Tests that applying a random event stream keeps the totals equal to a full
+    recount after every event.
+    """
+    generator = random.Random(7)
+    tracker = StockTracker()
+    tyres, rims = {}, {}
+    for _ in range(2000):
+        kind = StockEvent(generator.randrange(4))
+        size = generator.randrange(14, 19)
+        counts = tyres if kind < StockEvent.RIM_IN else rims
+        quantity = generator.randrange(1, 4)
+        if kind in (StockEvent.TYRE_OUT, StockEvent.RIM_OUT):
+            quantity = min(quantity, counts.get(size, 0))
+            counts[size] = counts.get(size, 0) - quantity
+        else:
+            counts[size] = counts.get(size, 0) + quantity
+        tracker.apply([(kind, size, quantity)])
+        assert (tracker.wheels, tracker.pairs) == _recount(tyres, rims)
+    assert tracker.events == 2000
+    assert tracker.wheels_by_size() == {
+        size: min(count, rims.get(size, 0))
+        for size, count in sorted(tyres.items())
+        if min(count, rims.get(size, 0))
+    }
+
+
+def test_apply_errors_keep_earlier_events():
+    """
+    Tests that an invalid event stops the stream after the valid events before it.
+    """
+    tracker = StockTracker()
+    with pytest.raises(ValueError):
+        tracker.apply([(0, 16, 2), (2, 16, 1), (3, 16, 5), (2, 16, 1)])
+    assert (tracker.wheels, tracker.pairs, tracker.events) == (1, 2, 2)
+    with pytest.raises(ValueError):
+        tracker.apply([(4, 16, 1)])
+    with pytest.raises(ValueError):
+        tracker.apply([(0, 16, -1)])
+    assert tracker.tyre_count(16) == 2 and tracker.rim_count(16) == 1
+
+
+def test_snapshot_and_restore():
+    """
+    Tests that snapshots are unaffected by later events and can be restored.
+    """
+    tracker = StockTracker()
+    tracker.apply([(0, 16, 3), (2, 16, 2), (0, 17, 1)])
+    snapshot = tracker.snapshot()
+    tracker.apply([(1, 16, 3), (2, 17, 4)])
+    assert snapshot.tyres == {16: 3, 17: 1} and snapshot.rims == {16: 2}
+    assert (snapshot.wheels, snapshot.pairs, snapshot.events) == (2, 6, 3)
+    assert tracker.snapshot().tyres == {17: 1}
+    tracker.restore(snapshot)
+    assert (tracker.wheels, tracker.pairs, tracker.events) == (2, 6, 3)
+    tracker.rim_in(16)
+    assert (tracker.wheels, tracker.pairs) == (3, 9)
+    assert snapshot.rims == {16: 2}
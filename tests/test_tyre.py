@@ -8,7 +8,15 @@ Version: 1.0
 
 import pytest
 
-from circles.tyre import Tyre
+from circles.tyre import (
+    Tyre,
+    TyreLabel,
+    clear_tyre_label_cache,
+    parse_tyre_designation,
+    parse_tyre_label,
+    parse_tyre_labels,
+    try_parse_tyre_label,
+)
 
 
 @pytest.fixture
@@ -49,3 +57,103 @@ def test_incorrect_arguments():
     # testing non numeric values
     with pytest.raises(ValueError):
         Tyre(130, "AAA/BBRCC")
+
+
+def test_parse_tyre_label():
+    """
+    Tests that the standalone parser returns the label fields and that the tyre
+    stores the same values.
+    """
+    assert parse_tyre_label("235/45R17") == TyreLabel(235, 45, 17)
+    assert parse_tyre_label("235/45R17").aspect_ratio == 45
+    assert try_parse_tyre_label("P235/45ZR17 94W") == TyreLabel(235, 45, 17)
+    tyre = Tyre(800, "235/45R17")
+    assert (tyre.tyre_size, tyre.aspect_ratio, tyre.necessary_rim_size) == (235, 45, 17)
+
+
+def test_parse_tyre_labels_reuses_results():
+    """
+    Tests that repeated labels in a batch are parsed once and served from the cache,
+    and that clearing the cache forgets them.
+    """
+    labels = parse_tyre_labels(["205/55R16", "205/55R16", "225/40R18"])
+    assert labels == [(205, 55, 16), (205, 55, 16), (225, 40, 18)]
+    assert labels[0] is labels[1]
+    clear_tyre_label_cache()
+    assert parse_tyre_label("205/55R16") is not labels[0]
+    assert parse_tyre_label("205/55R16") == labels[0]
+
+
+@pytest.mark.parametrize(
+    "label",
+    [123, "123?21R21", "123/21T21", "AAA/BBRCC", "123/21R2", " 23/21R21", "١٢٣/21R21"],
+)
+def test_parse_tyre_label_incorrect(label):
+    """
+    Tests that the standalone parsers reject invalid labels.
+
+    Parameters:
+        label: An invalid tyre label.
+    """
+    with pytest.raises(ValueError):
+        parse_tyre_label(label)
+    assert try_parse_tyre_label(label) is None
+
+
+@pytest.mark.parametrize(
+    "label, expected",
+    [
+        ("235/45R17", ("", 235, 45, "R", 17, None, None)),
+        ("P225/45ZR17 94W", ("P", 225, 45, "ZR", 17, 94, "W")),
+        ("LT265/70R17", ("LT", 265, 70, "R", 17, None, None)),
+        ("ST205/75D15 107L", ("ST", 205, 75, "D", 15, 107, "L")),
+        ("T125/70B16", ("T", 125, 70, "B", 16, None, None)),
+        ("255/35ZR19 96(Y)", ("", 255, 35, "ZR", 19, 96, "(Y)")),
+    ],
+)
+def test_parse_tyre_designation(label, expected):
+    """
+    Tests that full designations are parsed into all their fields and accepted
+    by the Tyre constructor.
+
+    Parameters:
+        label: A tyre designation.
+        expected: Its fields.
+    """
+    assert parse_tyre_designation(label) == expected
+    tyre = Tyre(800, label)
+    assert tyre.designation == expected
+    assert (tyre.tyre_size, tyre.aspect_ratio, tyre.necessary_rim_size) == (
+        expected[1],
+        expected[2],
+        expected[4],
+    )
+
+
+@pytest.mark.parametrize(
+    "label",
+    [
+        "123/21T21",
+        "AAA/BBRCC",
+        "X225/45R17",
+        "P225/45ZR17 94",
+        "P225/45ZR17 94I",
+        "P225/45ZR17  94W",
+        "P225/45ZR17 9W",
+        "P225/45ZR17 1234W",
+        "225/45R17W",
+        "225/4R17",
+    ],
+)
+def test_parse_tyre_designation_incorrect(label):
+    """
+    Tests that malformed designations are rejected.
+
+    Parameters:
+        label: An invalid tyre designation.
+    """
+    with pytest.raises(ValueError):
+        parse_tyre_designation(label)
+    with pytest.raises(ValueError):
+        parse_tyre_label(label)
+    assert try_parse_tyre_label(label) is None
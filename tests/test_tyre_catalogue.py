@@ -0,0 +1,105 @@
+"""
+Module for testing the range queries of the 'tyre_catalogue' module.
+"""
+
+import random
+
+import pytest
+
+from circles.rim import Rim
+from circles.tyre import Tyre
+from circles.tyre_catalogue import TyreCatalogue
+
+
+@pytest.fixture
+def tyres():
+    """
+    Fixture returning a random set of tyres.
+
+    Returns:
+        list: Tyres with widths 175-275, aspect ratios 30-70 and rim sizes 15-19.
+    """
+    generator = random.Random(7)
+    return [
+        Tyre(
+            300 + index,
+            f"{generator.randrange(175, 280, 10):03d}/"
+            f"{generator.randrange(30, 75, 5):02d}R{generator.randint(15, 19):02d}",
+        )
+        for index in range(500)
+    ]
+
+
+def scan(tyres, rim_size=None, widths=None, aspect_ratios=None):
+    """
+    Returns the tyres matching a query by a linear scan, in catalogue order.
+    """
+    matches = [
+        tyre
+        for tyre in tyres
+        if (rim_size is None or tyre.necessary_rim_size == rim_size)
+        and (widths is None or widths[0] <= tyre.tyre_size <= widths[1])
+        and (
+            aspect_ratios is None
+            or aspect_ratios[0] <= tyre.aspect_ratio <= aspect_ratios[1]
+        )
+    ]
+    return sorted(
+        matches,
+        key=lambda tyre: (tyre.necessary_rim_size, tyre.tyre_size, tyre.aspect_ratio),
+    )
+
+
+@pytest.mark.parametrize(
+    "rim_size, widths, aspect_ratios",
+    [
+        (17, (205, 225), (45, 55)),
+        (None, (205, 225), None),
+        (15, None, (60, 70)),
+        (None, None, None),
+        (18, (300, 400), None),
+        (21, None, None),
+    ],
+)
+def test_query(tyres, rim_size, widths, aspect_ratios):
+    """
+    Tests that queries match a linear scan.
+    """
+    catalogue = TyreCatalogue(tyres)
+    expected = scan(tyres, rim_size, widths, aspect_ratios)
+    assert catalogue.query(rim_size, widths, aspect_ratios) == expected
+    assert catalogue.count(rim_size, widths, aspect_ratios) == len(expected)
+
+
+def test_fitting(tyres):
+    """
+    Tests the lookup of the tyres fitting a rim.
+    """
+    catalogue = TyreCatalogue(tyres)
+    assert len(catalogue) == 500
+    assert catalogue.rim_sizes() == [15, 16, 17, 18, 19]
+    assert catalogue.fitting(Rim(215.9), (205, 225)) == scan(tyres, 17, (205, 225))
+    with pytest.raises(TypeError):
+        catalogue.fitting(Tyre(800, "235/19R19"))
+    with pytest.raises(TypeError):
+        catalogue.add(Rim(215.9))
+
+
+def test_bulk_and_incremental_building(tyres):
+    """
+    Tests that building in bulk, extending and adding one tyre at a time give the
+    same order, and that a failed extend adds nothing.
+    """
+    incremental = TyreCatalogue()
+    for tyre in tyres:
+        incremental.add(tyre)
+    mixed = TyreCatalogue(tyres[:200])
+    for tyre in tyres[200:250]:
+        mixed.add(tyre)
+    mixed.extend(tyres[250:])
+    expected = [id(tyre) for tyre in incremental.query()]
+    assert [id(tyre) for tyre in TyreCatalogue(tyres).query()] == expected
+    assert [id(tyre) for tyre in mixed.query()] == expected
+    with pytest.raises(TypeError):
+        mixed.extend([tyres[0], Rim(20)])
+    assert len(mixed) == 500
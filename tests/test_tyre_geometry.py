@@ -0,0 +1,93 @@
+"""
+Module for testing the label geometry of the 'tyre_geometry' module.
+"""
+
+from array import array
+import math
+
+import pytest
+
+from circles.circle_array import TyreArray
+from circles.tyre import Tyre
+from circles.tyre_geometry import (
+    circumferences,
+    label_columns,
+    label_outer_diameter,
+    label_outer_diameters,
+    outer_diameter,
+    outer_diameters,
+    radius_mismatches,
+    sidewall_height,
+    sidewall_heights,
+    tyre_mismatches,
+)
+
+
+def test_scalar_geometry():
+    """
+    Tests the sidewall height and outer diameter of a single tyre.
+    """
+    assert sidewall_height(225, 45) == pytest.approx(101.25)
+    assert outer_diameter(225, 45, 17) == pytest.approx(2 * 101.25 + 17 * 25.4)
+    assert label_outer_diameter("225/45R17") == outer_diameter(225, 45, 17)
+    assert label_outer_diameter("P225/45ZR17 94W") == outer_diameter(225, 45, 17)
+    with pytest.raises(ValueError):
+        label_outer_diameter("225-45R17")
+
+
+def test_columns_match_scalar_functions():
+    """
+    Tests that the column functions agree with the scalar ones.
+    """
+    labels = ["225/45R17", "205/55R16", "225/45R17", "LT265/70R17 121S"]
+    widths, aspect_ratios, rim_sizes = label_columns(labels)
+    assert list(widths) == [225, 205, 225, 265]
+    assert list(aspect_ratios) == [45, 55, 45, 70]
+    assert list(rim_sizes) == [17, 16, 17, 17]
+    diameters = outer_diameters(widths, aspect_ratios, rim_sizes)
+    assert isinstance(diameters, array)
+    assert list(diameters) == [
+        outer_diameter(*fields) for fields in zip(widths, aspect_ratios, rim_sizes)
+    ]
+    assert list(label_outer_diameters(labels)) == list(diameters)
+    assert list(sidewall_heights(widths, aspect_ratios)) == [
+        sidewall_height(width, aspect) for width, aspect in zip(widths, aspect_ratios)
+    ]
+    assert list(circumferences(diameters)) == [math.pi * d for d in diameters]
+    assert [len(column) for column in label_columns([])] == [0, 0, 0]
+    with pytest.raises(ValueError):
+        label_columns(["225/45R17", 17])
+
+
+def test_radius_mismatches():
+    """
+    Tests flagging radii that don't match the expected diameters.
+    """
+    diameters = [600.0, 600.0, 600.0, 600.0]
+    radii = [300.0, 301.0, 299.5, 290.0]
+    assert list(radius_mismatches(radii, diameters, 2.0)) == [3]
+    assert list(radius_mismatches(radii, diameters, 0.0)) == [1, 2, 3]
+    assert list(radius_mismatches([], [], 1.0)) == []
+    with pytest.raises(ValueError):
+        radius_mismatches(radii, diameters[:2], 1.0)
+    with pytest.raises(ValueError):
+        radius_mismatches(radii, diameters, -1.0)
+
+
+def test_tyre_array_and_objects():
+    """
+    Tests the consistency check on a TyreArray and on Tyre objects.
+    """
+    expected = outer_diameter(225, 45, 17)
+    tyres = [
+        Tyre(expected / 2, "225/45R17"),
+        Tyre(300, "225/45R17"),
+        Tyre(outer_diameter(205, 55, 16) / 2 + 0.4, "205/55R16"),
+    ]
+    tyre_array = TyreArray.from_circles(tyres)
+    assert list(tyre_array.outer_diameters()) == pytest.approx(
+        [expected, expected, outer_diameter(205, 55, 16)]
+    )
+    assert list(tyre_array.radius_mismatches(1.0)) == [1]
+    assert list(tyre_array.radius_mismatches(0.5)) == [1, 2]
+    assert tyre_mismatches(tyres, 1.0) == [tyres[1]]
@@ -0,0 +1,81 @@
+"""
+Module for testing the quiet validation checks and batch reports in the
+'validation' module against the behaviour of the class constructors.
+"""
+
+import pytest
+
+from circles.pizza import Pizza
+from circles.rim import Rim
+from circles.tyre import Tyre
+from circles.validation import (
+    Reason,
+    check_pizza,
+    check_tyre,
+    check_wheel,
+    validate_pizzas,
+    validate_rims,
+    validate_tyres,
+    validate_wheels,
+)
+
+
+@pytest.mark.parametrize(
+    ("radius", "tyre_label", "expected"),
+    [
+        (800, "235/19R19", Reason.OK),
+        ("800", "235/19R19", Reason.RADIUS_TYPE),
+        (0, "235/19R19", Reason.RADIUS_NOT_POSITIVE),
+        (800, 123, Reason.LABEL_TYPE),
+        (800, "235/19T19", Reason.LABEL_FORMAT),
+    ],
+)
+def test_check_tyre(radius, tyre_label, expected):
+    """
+    Tests that every reason code agrees with the exception raised by Tyre.
+
+    Parameters:
+        radius: The tyre radius.
+        tyre_label: The tyre label.
+        expected (Reason): The expected reason code.
+    """
+    assert check_tyre(radius, tyre_label) == expected
+    if expected:
+        with pytest.raises((TypeError, ValueError)):
+            Tyre(radius, tyre_label)
+
+
+def test_check_pizza_and_wheel():
+    """
+    Tests the pizza and wheel checks.
+    """
+    assert check_pizza(20, []) == Reason.OK
+    assert check_pizza(20, "cheese") == Reason.INGREDIENTS_TYPE
+    tyre = Tyre(800, "235/19R19")
+    assert check_wheel(tyre, Rim(241.3)) == Reason.OK
+    assert check_wheel(tyre, Rim(300)) == Reason.SIZE_MISMATCH
+    assert check_wheel(tyre, Pizza(20, [])) == Reason.COMPONENT_TYPE
+
+
+def test_batch_reports(capsys):
+    """
+    Tests that the batch functions return one code per row, structured errors
+    and print nothing.
+
+    Parameters:
+        capsys (pytest fixture): A pytest fixture for capturing standard output.
+    """
+    report = validate_tyres([(800, "235/19R19"), (800, "AAA/BBRCC"), (-1, "x")])
+    assert list(report.codes) == [0, 4, 2]
+    assert [error.index for error in report.errors] == [1, 2]
+    assert report.errors[0].reason is Reason.LABEL_FORMAT
+    assert report.errors[0].message.startswith("Label data must be")
+    assert not report.valid
+
+    assert validate_rims([1, 2.5]).valid
+    codes = validate_rims([float("inf"), float("-inf"), float("nan"), 10**400]).codes
+    assert list(codes) == [8, 8, 8, 8]
+    assert list(validate_pizzas([(20, []), (20, None)]).codes) == [0, 5]
+    tyre = Tyre(800, "235/19R19")
+    assert list(validate_wheels([(tyre, Rim(241.3)), (Rim(241.3), tyre)]).codes) == [0, 6]
+    assert capsys.readouterr().out == ""
@@ -64,8 +64,8 @@ def test_change_tyre(wheel):
     old_tyre = wheel.tyre
     wheel.change_tyre(other_tyre)
     new_tyre = wheel.tyre
-    assert old_tyre != new_tyre
-    assert new_tyre == other_tyre
+    assert old_tyre is not new_tyre
+    assert new_tyre is other_tyre
 
 
 def test_change_tyre_incorrect_argument(wheel):
@@ -97,9 +97,9 @@ def test_change_rim(wheel):
     wheel.change_rim(other_rim)
     new_rim = wheel.rim
     # tests if the rim was changed
-    assert old_rim != new_rim
+    assert old_rim is not new_rim
     # tests if the new tyre in the wheel is the same as the tyre provided
-    assert new_rim == other_rim
+    assert new_rim is other_rim
 
 
 def test_change_rim_incorrect_argument(wheel):
@@ -116,6 +116,21 @@ def test_change_rim_incorrect_argument(wheel):
         wheel.change_rim(Tyre(800, "250/19R19"))
 
 
+def test_change_rim_rounds_like_verify(wheel):
+    """
+    Tests that change_rim accepts exactly the rims verify_rim_size accepts.
+
+    Args:
+        wheel (Wheel): Fixture providing an instance of the Wheel class.
+    """
+    close_rim = Rim(237)
+    assert close_rim.diameter_inches == 18.66
+    wheel.change_rim(close_rim)
+    assert wheel.rim is close_rim and wheel.verify_rim_size()
+    with pytest.raises(ValueError):
+        wheel.change_rim(Rim(247.65))
+
+
 def test_incorrect_types():
     """
     Tests that invalid types or values for Wheel initialization raise ValueError.